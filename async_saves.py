@@ -0,0 +1,102 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Async Save Service Module
+
+asyncio front end for character_manager's save functions. The blocking
+file I/O runs on a bounded thread pool so it never stalls the event
+loop, and a per-character asyncio.Lock keeps two saves (or a save and a
+load/delete) of the same character from interleaving.
+"""
+
+import asyncio
+import contextlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+import character_manager
+from records import copy_character_state
+
+# ============================================================================
+# ASYNC SAVE SERVICE
+# ============================================================================
+
+class AsyncSaveService:
+
+    def __init__(self, save_directory="data/save_games", save_format="text",
+                 max_workers=4, fsync=False):
+        self.save_directory = save_directory
+        self.save_format = save_format
+        self.fsync = fsync
+        self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                           thread_name_prefix="save-io")
+        self._locks = {}        # name -> [asyncio.Lock, number of users]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args))
+
+    @contextlib.asynccontextmanager
+    async def _character_lock(self, character_name):
+        entry = self._locks.get(character_name)
+        if entry is None:
+            entry = self._locks[character_name] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._locks[character_name]
+
+    # ------------------------------------------------------------------------
+    # SAVE / LOAD
+    # ------------------------------------------------------------------------
+
+    async def save_character(self, character):
+        # Copy now: the caller may keep changing the character while we wait
+        state = copy_character_state(character)
+        async with self._character_lock(state["name"]):
+            await self._run(character_manager.write_save, state,
+                            self.save_directory, self.save_format, self.fsync)
+        return True
+
+    async def load_character(self, character_name):
+        async with self._character_lock(character_name):
+            return await self._run(character_manager.load_character,
+                                   character_name, self.save_directory)
+
+    async def load_many(self, character_names, return_exceptions=False):
+        """
+        Load several characters concurrently; returns {name: character}.
+
+        With return_exceptions=True a failed load maps to its exception
+        instead of cancelling the whole batch.
+        """
+        names = list(dict.fromkeys(character_names))
+        results = await asyncio.gather(
+            *(self.load_character(name) for name in names),
+            return_exceptions=return_exceptions
+        )
+        return dict(zip(names, results))
+
+    # ------------------------------------------------------------------------
+    # LIST / DELETE
+    # ------------------------------------------------------------------------
+
+    async def list_saved_characters(self):
+        return await self._run(character_manager.list_saved_characters, self.save_directory)
+
+    async def delete_character(self, character_name):
+        async with self._character_lock(character_name):
+            return await self._run(character_manager.delete_character,
+                                   character_name, self.save_directory)
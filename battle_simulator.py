@@ -0,0 +1,582 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Battle Simulator Module
+
+Runs SimpleBattle fights headlessly (no input() / print()) using a
+pluggable action policy, and aggregates the results for balance testing.
+"""
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+
+import character_manager
+from combat_events import NULL_SINK
+from combat_system import SimpleBattle, create_enemy
+from custom_exceptions import CharacterDeadError
+
+DEFAULT_MAX_TURNS = 1000
+
+# Random battles are split into fixed-size shards, each with its own
+# random.Random stream, so results only depend on the seed and never on
+# how many worker processes ran the shards.
+SHARD_SIZE = 1000
+SEED_RANGE = 2 ** 32
+
+# Menu choices understood by SimpleBattle.perform_action
+ACTION_ATTACK = "1"
+ACTION_ABILITY = "2"
+ACTION_ESCAPE = "3"
+
+# ============================================================================
+# ACTION POLICIES
+# ============================================================================
+# A policy is a function that takes the running battle and returns the menu
+# choice for this turn. Policies are plain module-level functions so they
+# can be passed around (and pickled) by name.
+
+def always_attack_policy(battle):
+    """Basic attack every turn."""
+    return ACTION_ATTACK
+
+
+def ability_first_policy(battle):
+    """Use the class ability every turn (Clerics attack when at full HP)."""
+    character = battle.character
+    if character["class"] == "Cleric" and character["health"] >= character["max_health"]:
+        return ACTION_ATTACK
+    return ACTION_ABILITY
+
+
+def random_policy(battle):
+    """Pick attack or ability at random using the battle's own RNG."""
+    return battle.rng.choice((ACTION_ATTACK, ACTION_ABILITY))
+
+
+POLICIES = {
+    "always_attack": always_attack_policy,
+    "ability_first": ability_first_policy,
+    "random": random_policy,
+}
+
+
+def get_policy(policy):
+    """Accept a policy name or function and return the function."""
+    if callable(policy):
+        return policy
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy: {policy}")
+    return POLICIES[policy]
+
+# ============================================================================
+# HEADLESS BATTLE
+# ============================================================================
+
+class HeadlessBattle(SimpleBattle):
+    """SimpleBattle driven by a policy instead of the keyboard."""
+
+    def __init__(self, character, enemy, policy=always_attack_policy,
+                 rng=None, max_turns=DEFAULT_MAX_TURNS, sink=NULL_SINK):
+        super().__init__(character, enemy, rng if rng is not None else random.Random(), sink)
+        self.policy = policy
+        self.max_turns = max_turns
+
+    def run(self):
+        """Fight until someone wins, escapes or max_turns is reached."""
+        if self.character["health"] <= 0:
+            raise CharacterDeadError("Character is already dead!")
+
+        while self.turn <= self.max_turns:
+            winner = self.play_round()
+            if winner is not None:
+                return self._finish(winner)
+            self.turn += 1
+
+        self.turn = self.max_turns
+        return self._finish("timeout")
+
+    def play_round(self):
+        """Player turn then enemy turn; returns the winner, or None to keep going."""
+        self.perform_action(self.policy(self))
+        if not self.combat_active:
+            return "escape"
+        if self.enemy["health"] <= 0:
+            return "player"
+
+        self.enemy_attack()
+        if self.character["health"] <= 0:
+            return "enemy"
+        return None
+
+    def _finish(self, winner):
+        self.combat_active = False
+        return {
+            "winner": winner,
+            "turns": self.turn,
+            "hp_remaining": self.character["health"]
+        }
+
+# ============================================================================
+# BATCH SIMULATION
+# ============================================================================
+
+def create_character_at_level(character_class, level=1):
+    """Create a fresh character and level it up to the given level."""
+    character = character_manager.create_character(f"Sim{character_class}", character_class)
+    while character["level"] < level:
+        character_manager.gain_experience(character, character["level"] * 100)
+    return character
+
+
+def new_results():
+    """Empty aggregate that simulate_battles fills in."""
+    return {
+        "battles": 0,
+        "wins": 0,
+        "losses": 0,
+        "escapes": 0,
+        "timeouts": 0,
+        "turns": {},
+        "hp_remaining": {}
+    }
+
+
+def record_result(results, outcome, count=1):
+    """Add a battle outcome (seen `count` times) to an aggregate."""
+    results["battles"] += count
+    winner = outcome["winner"]
+    if winner == "player":
+        results["wins"] += count
+        hp = outcome["hp_remaining"]
+        results["hp_remaining"][hp] = results["hp_remaining"].get(hp, 0) + count
+    elif winner == "enemy":
+        results["losses"] += count
+    elif winner == "escape":
+        results["escapes"] += count
+    else:
+        results["timeouts"] += count
+
+    turns = outcome["turns"]
+    results["turns"][turns] = results["turns"].get(turns, 0) + count
+
+
+def merge_results(total, part):
+    """Add the counts from one aggregate into another."""
+    for key in ["battles", "wins", "losses", "escapes", "timeouts"]:
+        total[key] += part[key]
+    for key in ["turns", "hp_remaining"]:
+        for value, count in part[key].items():
+            total[key][value] = total[key].get(value, 0) + count
+    return total
+
+
+def summarize(results):
+    """Add win rate and averages to an aggregate and return it."""
+    battles = results["battles"]
+    wins = results["wins"]
+    results["win_rate"] = wins / battles if battles else 0.0
+    results["avg_turns"] = (
+        sum(t * n for t, n in results["turns"].items()) / battles if battles else 0.0
+    )
+    results["avg_hp_remaining"] = (
+        sum(hp * n for hp, n in results["hp_remaining"].items()) / wins if wins else 0.0
+    )
+    return results
+
+
+def simulate_battles(character_class, enemy_type, policy="always_attack",
+                     trials=1000, level=1, seed=None, max_turns=DEFAULT_MAX_TURNS):
+    """
+    Run many headless battles of one class against one enemy type.
+
+    Returns win rate plus turns-to-finish and HP-remaining (on wins)
+    distributions as {value: count} dicts. Deterministic matchups are
+    resolved once and counted `trials` times; random ones with a built-in
+    policy are sampled from their exact outcome distribution (see
+    outcome_distribution), so their cost barely depends on `trials`.
+    """
+    seed = _pick_seed(seed)
+    character_template = create_character_at_level(character_class, level)
+    enemy_template = create_enemy(enemy_type)
+    matchup = (character_class, level, enemy_type)
+    results = _simulate_matchup(character_template, enemy_template, policy,
+                                trials, seed, matchup, max_turns)
+    return _label(results, character_class, level, enemy_type, policy, seed)
+
+
+def _simulate_matchup(character_template, enemy_template, policy, trials, seed, matchup,
+                      max_turns):
+    """
+    Aggregate `trials` battles between copies of the two templates.
+
+    matchup is the (character_class, level, enemy_type) key that, with the
+    seed, picks the RNG streams.
+    """
+    policy_func = get_policy(policy)
+    results = new_results()
+    if trials <= 0:
+        return results
+
+    if policy_func is always_attack_policy:
+        outcome = resolve_always_attack(character_template, enemy_template, max_turns)
+        record_result(results, outcome, trials)
+        return results
+
+    if is_deterministic(policy_func, character_template["class"]):
+        battle = HeadlessBattle(dict(character_template), dict(enemy_template),
+                                policy_func, shard_rng(seed, matchup, 0), max_turns)
+        record_result(results, battle.run(), trials)
+        return results
+
+    if policy_func in POLICIES.values():
+        try:
+            distribution = outcome_distribution(character_template, enemy_template,
+                                                policy_func, max_turns)
+        except ChainTooLargeError:
+            pass
+        else:
+            for shard_index, shard_trials in _shards(trials):
+                _sample_outcomes(results, distribution, shard_trials,
+                                 shard_rng(seed, matchup, shard_index))
+            return results
+
+    for shard_index, shard_trials in _shards(trials):
+        merge_results(results, _simulate_trials(character_template, enemy_template, policy_func,
+                                                shard_trials, shard_rng(seed, matchup, shard_index),
+                                                max_turns))
+    return results
+
+
+def _simulate_trials(character_template, enemy_template, policy_func, trials, rng, max_turns):
+    """Play `trials` battles one by one with a shared RNG."""
+    results = new_results()
+    for _ in range(trials):
+        battle = HeadlessBattle(dict(character_template), dict(enemy_template),
+                                policy_func, rng, max_turns)
+        record_result(results, battle.run())
+    return results
+
+
+def _sample_outcomes(results, distribution, trials, rng):
+    """Draw `trials` outcomes from an outcome_distribution() result."""
+    outcomes = list(distribution)
+    counts = {}
+    for outcome in rng.choices(outcomes, cum_weights=list(accumulate(distribution.values())),
+                               k=trials):
+        counts[outcome] = counts.get(outcome, 0) + 1
+    for (winner, turns, hp), count in counts.items():
+        record_result(results, {"winner": winner, "turns": turns, "hp_remaining": hp}, count)
+
+
+def _label(results, character_class, level, enemy_type, policy, seed):
+    results["character_class"] = character_class
+    results["enemy_type"] = enemy_type
+    results["level"] = level
+    results["policy"] = policy if isinstance(policy, str) else policy.__name__
+    results["seed"] = seed
+    return summarize(results)
+
+# ============================================================================
+# SEEDING
+# ============================================================================
+
+def _pick_seed(seed):
+    """Use the given seed, or draw one so the run can be reproduced later."""
+    if seed is None:
+        return random.randrange(SEED_RANGE)
+    return seed
+
+
+def shard_rng(seed, matchup, shard_index):
+    """
+    Independent RNG stream for one shard of one matchup in a seeded run.
+
+    random.Random hashes a str seed with SHA-512, so seeding from the repr
+    of the whole key gives every (seed, matchup, shard) its own stream for
+    any seed type, the same in every process.
+    """
+    return random.Random(repr((seed, tuple(matchup), shard_index)))
+
+
+def _shards(trials):
+    """Split trials into (shard_index, shard_trials) pairs of SHARD_SIZE."""
+    return [
+        (index, min(SHARD_SIZE, trials - start))
+        for index, start in enumerate(range(0, trials, SHARD_SIZE))
+    ]
+
+# ============================================================================
+# FAST PATHS
+# ============================================================================
+
+def is_deterministic(policy, character_class):
+    """True if every battle with this policy and class plays out the same."""
+    if policy is always_attack_policy:
+        return True
+    if policy is ability_first_policy:
+        # Rogue critical strikes are a coin flip
+        return character_class != "Rogue"
+    return False
+
+
+def resolve_always_attack(character, enemy, max_turns=DEFAULT_MAX_TURNS):
+    """
+    Closed-form outcome of an always-attack battle.
+
+    Both sides deal a fixed amount each turn, so the number of hits each
+    side needs is a ceiling division. Matches HeadlessBattle.run() exactly.
+    """
+    if character["health"] <= 0:
+        raise CharacterDeadError("Character is already dead!")
+
+    battle = SimpleBattle(character, enemy)
+    player_dmg = battle.calculate_damage(character, enemy)
+    enemy_dmg = battle.calculate_damage(enemy, character)
+
+    turns_to_kill = -(-enemy["health"] // player_dmg)
+    turns_to_die = -(-character["health"] // enemy_dmg)
+
+    if turns_to_kill <= turns_to_die and turns_to_kill <= max_turns:
+        hp = character["health"] - (turns_to_kill - 1) * enemy_dmg
+        return {"winner": "player", "turns": turns_to_kill, "hp_remaining": hp}
+    if turns_to_die < turns_to_kill and turns_to_die <= max_turns:
+        return {"winner": "enemy", "turns": turns_to_die, "hp_remaining": 0}
+
+    hp = character["health"] - max_turns * enemy_dmg
+    return {"winner": "timeout", "turns": max_turns, "hp_remaining": hp}
+
+# ============================================================================
+# EXACT OUTCOME DISTRIBUTIONS
+# ============================================================================
+# With a built-in policy the only state that carries from one round to the
+# next is the two HP totals, and each round makes at most a few small RNG
+# draws. Enumerating every draw gives the chance of each (character_hp,
+# enemy_hp) after the round, and pushing the probabilities through that
+# chain turn by turn gives the exact chance of every outcome.
+#
+# Paths less likely than NEGLIGIBLE_PROBABILITY are dropped; they would
+# not show up once in 10**15 battles, and without the cut a Cleric who
+# keeps healing spreads a vanishing tail over all max_turns turns.
+#
+# Custom policies may keep state of their own, so they are always played
+# battle by battle. So are matchups with more than MAX_CHAIN_STATES
+# reachable HP pairs (none of the shipped classes and enemies come close).
+
+NEGLIGIBLE_PROBABILITY = 1e-15
+MAX_CHAIN_STATES = 50000
+
+
+class ChainTooLargeError(Exception):
+    """The matchup has too many HP states to solve exactly."""
+
+
+class _ScriptedRng:
+    """
+    Stands in for random.Random: the i-th draw returns option script[i]
+    (option 0 past the end of the script) and records how many options
+    it had.
+    """
+
+    def __init__(self, script):
+        self.script = script
+        self.options = []
+
+    def _draw(self, options):
+        draw = len(self.options)
+        self.options.append(options)
+        return self.script[draw] if draw < len(self.script) else 0
+
+    def randint(self, a, b):
+        return a + self._draw(b - a + 1)
+
+    def choice(self, seq):
+        return seq[self._draw(len(seq))]
+
+
+def round_transitions(character, enemy, policy_func):
+    """
+    Every way one round can end, starting from the given HP totals.
+
+    Returns {(winner, character_hp, enemy_hp): probability}, with winner
+    None when the fight goes on.
+    """
+    transitions = {}
+    scripts = [[]]
+    while scripts:
+        script = scripts.pop()
+        rng = _ScriptedRng(script)
+        battle = HeadlessBattle(dict(character), dict(enemy), policy_func, rng)
+        winner = battle.play_round()
+
+        probability = 1.0
+        for options in rng.options:
+            probability /= options
+        key = (winner, battle.character["health"], battle.enemy["health"])
+        transitions[key] = transitions.get(key, 0.0) + probability
+
+        # Queue every other option for the draws this script left at 0
+        for draw in range(len(script), len(rng.options)):
+            prefix = script + [0] * (draw - len(script))
+            scripts.extend(prefix + [option] for option in range(1, rng.options[draw]))
+    return transitions
+
+
+def outcome_distribution(character, enemy, policy=always_attack_policy,
+                         max_turns=DEFAULT_MAX_TURNS):
+    """
+    Exact probability of every outcome of a battle between the two.
+
+    Returns {(winner, turns, hp_remaining): probability}, matching what
+    HeadlessBattle.run() would return. Only valid for policies that decide
+    from the battle's HP and RNG alone (the built-in ones). Raises
+    ChainTooLargeError past MAX_CHAIN_STATES.
+    """
+    if character["health"] <= 0:
+        raise CharacterDeadError("Character is already dead!")
+
+    policy_func = get_policy(policy)
+    character = dict(character)
+    enemy = dict(enemy)
+    transitions = {}
+    outcomes = {}
+    states = {(character["health"], enemy["health"]): 1.0}
+
+    for turn in range(1, max_turns + 1):
+        next_states = {}
+        for state, probability in states.items():
+            if probability < NEGLIGIBLE_PROBABILITY:
+                continue
+            if state not in transitions:
+                if len(transitions) >= MAX_CHAIN_STATES:
+                    raise ChainTooLargeError(
+                        f"More than {MAX_CHAIN_STATES} HP states to solve")
+                character["health"], enemy["health"] = state
+                transitions[state] = round_transitions(character, enemy, policy_func)
+
+            for (winner, character_hp, enemy_hp), chance in transitions[state].items():
+                if winner is None:
+                    key = (character_hp, enemy_hp)
+                    next_states[key] = next_states.get(key, 0.0) + probability * chance
+                else:
+                    key = (winner, turn, character_hp)
+                    outcomes[key] = outcomes.get(key, 0.0) + probability * chance
+        states = next_states
+        if not states:
+            break
+
+    for (character_hp, _), probability in states.items():
+        if probability < NEGLIGIBLE_PROBABILITY:
+            continue
+        key = ("timeout", max_turns, character_hp)
+        outcomes[key] = outcomes.get(key, 0.0) + probability
+    return outcomes
+
+# ============================================================================
+# BALANCE SWEEPS
+# ============================================================================
+
+CHARACTER_CLASSES = ["Warrior", "Mage", "Rogue", "Cleric"]
+ENEMY_TYPES = ["goblin", "orc", "dragon"]
+
+
+def sweep_balance(policy="always_attack", trials=10000, levels=range(1, 51),
+                  classes=CHARACTER_CLASSES, enemy_types=ENEMY_TYPES,
+                  seed=None, max_turns=DEFAULT_MAX_TURNS):
+    """
+    Simulate every class x level x enemy type matchup.
+
+    Returns {(character_class, level, enemy_type): results}. Characters are
+    leveled once per class and reused across enemy types.
+    """
+    seed = _pick_seed(seed)
+    enemy_templates = {enemy_type: create_enemy(enemy_type) for enemy_type in enemy_types}
+    levels = sorted(levels)
+    sweep = {}
+
+    for character_class in classes:
+        character = create_character_at_level(character_class, 1)
+        for level in levels:
+            while character["level"] < level:
+                character_manager.gain_experience(character, character["level"] * 100)
+
+            for enemy_type, enemy in enemy_templates.items():
+                matchup = (character_class, level, enemy_type)
+                results = _simulate_matchup(character, enemy, policy, trials, seed,
+                                            matchup, max_turns)
+                sweep[(character_class, level, enemy_type)] = _label(
+                    results, character_class, level, enemy_type, policy, seed)
+
+    return sweep
+
+# ============================================================================
+# MULTI-PROCESS RUNNER
+# ============================================================================
+
+def _run_shard(task):
+    """Worker entry point: simulate one shard of one matchup (a whole one if shard_index is None)."""
+    character_class, level, enemy_type, policy, seed, shard_index, trials, max_turns = task
+    matchup = (character_class, level, enemy_type)
+    character = create_character_at_level(character_class, level)
+    enemy = create_enemy(enemy_type)
+    if shard_index is None:
+        return _simulate_matchup(character, enemy, policy, trials, seed, matchup, max_turns)
+    return _simulate_trials(character, enemy, get_policy(policy), trials,
+                            shard_rng(seed, matchup, shard_index), max_turns)
+
+
+def run_parallel_sweep(matchups, policy="random", trials=10000, seed=None,
+                       workers=None, max_turns=DEFAULT_MAX_TURNS):
+    """
+    Simulate (character_class, level, enemy_type) matchups on a process pool.
+
+    Matchups with a built-in policy are solved as one task each (see
+    _simulate_matchup); those with a custom policy are split into shards
+    that run on any free worker. The merged results are identical to
+    sweep_balance()/simulate_battles() with the same seed, whatever the
+    number of workers.
+    """
+    seed = _pick_seed(seed)
+    policy_func = get_policy(policy)
+    sweep = {}
+    tasks = []
+
+    for character_class, level, enemy_type in matchups:
+        sweep[(character_class, level, enemy_type)] = new_results()
+        if policy_func in POLICIES.values():
+            tasks.append((character_class, level, enemy_type, policy_func,
+                          seed, None, trials, max_turns))
+            continue
+        for shard_index, shard_trials in _shards(trials):
+            tasks.append((character_class, level, enemy_type, policy_func,
+                          seed, shard_index, shard_trials, max_turns))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if tasks and workers > 1:
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_run_shard, tasks, chunksize=chunksize))
+    else:
+        parts = [_run_shard(task) for task in tasks]
+
+    # pool.map keeps task order, so merging is reproducible
+    for task, part in zip(tasks, parts):
+        merge_results(sweep[task[:3]], part)
+
+    for (character_class, level, enemy_type), results in sweep.items():
+        _label(results, character_class, level, enemy_type, policy, seed)
+    return sweep
+
+
+def run_balance_report(enemy_types=ENEMY_TYPES, levels=(1,), policy="random",
+                       trials=10000, seed=None, workers=None):
+    """Nightly report: every character class against every enemy type."""
+    matchups = [
+        (character_class, level, enemy_type)
+        for character_class in CHARACTER_CLASSES
+        for level in levels
+        for enemy_type in enemy_types
+    ]
+    return run_parallel_sweep(matchups, policy, trials, seed, workers)
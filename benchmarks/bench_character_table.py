@@ -0,0 +1,71 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Character Table Benchmark
+
+Times CharacterTable.gain_experience on a large table against calling
+character_manager.gain_experience on the same characters as dicts, and
+checks that both end with the same stats. Grants are 5 XP (few level
+ups), 500 XP (many) and 1,000,000 XP (every living row, many levels).
+
+Run from the project root:  python benchmarks/bench_character_table.py [rows]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+from character_table import NUMERIC_COLUMNS, CharacterTable
+
+
+def make_characters(rows, seed=163):
+    rng = random.Random(seed)
+    base = character_manager.create_character("Bench", "Warrior")
+    characters = []
+    for i in range(rows):
+        character = dict(base)
+        character["name"] = f"Bench{i}"
+        character["level"] = rng.randint(1, 50)
+        character["experience"] = rng.randint(0, character["level"] * 100 - 1)
+        character["health"] = rng.choice([0] + [character["max_health"]] * 9)
+        characters.append(character)
+    return characters
+
+
+def grant_dicts(characters, xp_amount):
+    for character in characters:
+        if character["health"] > 0:
+            character_manager.gain_experience(character, xp_amount)
+
+
+def check_parity(rows=20000):
+    for xp_amount in (0, 1, 99, 500, 10 ** 6):
+        characters = make_characters(rows)
+        table = CharacterTable.from_characters(characters)
+        grant_dicts(characters, xp_amount)
+        table.gain_experience(xp_amount)
+        for row, character in enumerate(characters):
+            expected = {column: character[column] for column in NUMERIC_COLUMNS}
+            assert table.update_character(row, {}) == expected, (xp_amount, row)
+    return rows
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print(f"parity: {check_parity()} rows identical")
+    for xp_amount in (5, 500, 10 ** 6):
+        characters = make_characters(rows)
+        table = CharacterTable.from_characters(characters)
+        dict_time = timed(grant_dicts, characters, xp_amount)
+        table_time = timed(table.gain_experience, xp_amount)
+        print(f"{rows:,} rows, xp={xp_amount:>9,}  dicts {dict_time:7.3f}s  "
+              f"table {table_time:7.3f}s")
@@ -0,0 +1,64 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Data Parsing Benchmark
+
+Generates a large items file, checks that game_data.load_items_mmap()
+and game_data.load_items_cached() return the same items as
+game_data.load_items(), and times them (the cached loader once cold,
+when it parses and writes the cache, and once warm).
+
+Run from the project root:  python benchmarks/bench_data_parsing.py [count]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+
+ITEM_TYPES = [("consumable", "health"), ("weapon", "strength"), ("armor", "max_health")]
+
+
+def write_items_file(path, count):
+    with open(path, "w") as f:
+        for i in range(count):
+            item_type, stat = ITEM_TYPES[i % 3]
+            f.write(
+                f"ITEM_ID: item_{i}\n"
+                f"NAME: Generated Item {i}\n"
+                f"TYPE: {item_type}\n"
+                f"EFFECT: {stat}:{i % 50 + 1}\n"
+                f"COST: {i % 500 + 5}\n"
+                f"DESCRIPTION: Generated item number {i} for parser benchmarks\n"
+                "\n"
+            )
+
+
+def time_call(function, path):
+    start = time.perf_counter()
+    result = function(path)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "items.txt")
+        write_items_file(path, count)
+        size_mb = os.path.getsize(path) / 1e6
+
+        original, original_time = time_call(game_data.load_items, path)
+        fast, fast_time = time_call(game_data.load_items_mmap, path)
+        assert fast == original, "parsers disagree"
+        cold, cold_time = time_call(game_data.load_items_cached, path)
+        warm, warm_time = time_call(game_data.load_items_cached, path)
+        assert cold == warm == original, "cache disagrees"
+
+        print(f"{count:,} items ({size_mb:.1f} MB): identical results")
+        print(f"load_items       {original_time:8.3f}s")
+        print(f"load_items_mmap  {fast_time:8.3f}s  ({original_time / fast_time:.2f}x)")
+        print(f"cached (cold)    {cold_time:8.3f}s")
+        print(f"cached (warm)    {warm_time:8.3f}s  ({original_time / warm_time:.2f}x)")
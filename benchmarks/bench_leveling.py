@@ -0,0 +1,69 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Leveling Benchmark
+
+Checks that the closed-form character_manager.gain_experience gives the
+same level, stats and leftover XP as the original level-by-level loop,
+then times both on small and huge XP grants.
+
+Run from the project root:  python benchmarks/bench_leveling.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+
+def loop_gain_experience(character, xp_amount):
+    """The original one-level-at-a-time implementation, kept as reference."""
+    character["experience"] += xp_amount
+    while True:
+        required = character["level"] * 100
+        if character["experience"] >= required:
+            character["experience"] -= required
+            character["level"] += 1
+            character["max_health"] += 10
+            character["strength"] += 2
+            character["magic"] += 2
+            character["health"] = character["max_health"]
+        else:
+            break
+
+
+def check_parity(samples=20000, seed=163):
+    rng = random.Random(seed)
+    for _ in range(samples):
+        char = character_manager.create_character("Bench", rng.choice(
+            ["Warrior", "Mage", "Rogue", "Cleric"]))
+        char["level"] = rng.randint(1, 200)
+        char["experience"] = rng.randint(0, char["level"] * 100 - 1)
+        char["health"] = rng.randint(1, char["max_health"])
+        xp = rng.choice([0, 1, 99, 100, rng.randint(0, 10 ** 4), rng.randint(0, 10 ** 9)])
+
+        expected = dict(char)
+        loop_gain_experience(expected, xp)
+        character_manager.gain_experience(char, xp)
+        assert char == expected, (char, expected, xp)
+    return samples
+
+
+def time_grants(function, xp_amount, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        char = character_manager.create_character("Bench", "Warrior")
+        function(char, xp_amount)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print(f"parity: {check_parity()} random grants identical")
+    for xp_amount, repeats in [(250, 20000), (10 ** 6, 2000), (10 ** 8, 20)]:
+        loop_time = time_grants(loop_gain_experience, xp_amount, repeats)
+        fast_time = time_grants(character_manager.gain_experience, xp_amount, repeats)
+        print(f"xp={xp_amount:>11,} x{repeats:<6} loop {loop_time:8.4f}s  "
+              f"closed-form {fast_time:8.4f}s  ({loop_time / fast_time:,.1f}x)")
@@ -0,0 +1,64 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Records Benchmark
+
+Measures what records.Character costs and saves against the plain dict
+from create_character(): memory per character, field reads through
+record["key"] and record.attr, and a full HeadlessBattle run.
+
+Run from the project root:  python benchmarks/bench_records.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import battle_simulator
+import character_manager
+import combat_system
+from records import Character, Enemy
+
+
+def memory(obj):
+    """Size of the object plus its per-instance __dict__, if it has one."""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def time_reads(number=1000000):
+    plain = character_manager.create_character("Bench", "Warrior")
+    record = Character(plain)
+    return {
+        'dict["health"]': timeit.timeit(lambda: plain["health"], number=number),
+        'record["health"]': timeit.timeit(lambda: record["health"], number=number),
+        "record.health": timeit.timeit(lambda: record.health, number=number),
+    }
+
+
+def time_battles(wrap_character, wrap_enemy, number=20000):
+    character = character_manager.create_character("Bench", "Warrior")
+    enemy = combat_system.create_enemy("orc")
+
+    def battle():
+        battle_simulator.HeadlessBattle(wrap_character(character), wrap_enemy(enemy)).run()
+    return timeit.timeit(battle, number=number)
+
+
+if __name__ == "__main__":
+    plain = character_manager.create_character("Bench", "Warrior")
+    record = Character(plain)
+    print(f"memory: dict {memory(plain)} bytes, Character {memory(record)} bytes")
+
+    reads = time_reads()
+    baseline = reads['dict["health"]']
+    for label, seconds in reads.items():
+        print(f"{label:<18} {seconds:.4f}s  ({seconds / baseline:.2f}x dict)")
+
+    dict_time = time_battles(dict, dict)
+    record_time = time_battles(Character, Enemy)
+    print(f"HeadlessBattle     dicts {dict_time:.4f}s  records {record_time:.4f}s  "
+          f"({record_time / dict_time:.2f}x dict)")
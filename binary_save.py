@@ -0,0 +1,183 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Binary Save Format Module
+
+Compact, typed encoding for character saves. Unlike the KEY: value text
+format, ints stay ints, lists stay lists and None stays None, and a save
+is decoded with a handful of bulk operations instead of line parsing.
+
+Layout (all integers big-endian):
+
+    header   magic b"QCSV" | version u16 | payload length u32 | crc32 u32
+    payload  schema length u32   | schema
+             string count u32    | strings length u32 | strings
+             int count u32       | ints (int64 each)
+
+    schema   one type tag per field, then the field names, NUL separated
+    strings  every str value and list entry in field order, NUL separated
+    ints     every int value, plus the entry count of each list
+
+    tags     i  int64 (next int)
+             z  int too big for int64 (next string, as decimal)
+             s  str (next string)
+             l  list of str (next int = count, then that many strings)
+             n  None
+
+The schema is the same for every character, so decoded schemas are
+cached and most loads are three splits and one struct unpack.
+"""
+
+import struct
+import zlib
+
+from custom_exceptions import InvalidSaveDataError, SaveFileCorruptedError
+from records import StackedInventory
+
+MAGIC = b"QCSV"
+VERSION = 1
+
+HEADER = struct.Struct(">4sHII")
+U32 = struct.Struct(">I")
+PAIR_U32 = struct.Struct(">II")
+
+INT64_MIN = -(2 ** 63)
+INT64_MAX = 2 ** 63 - 1
+
+# schema bytes -> (tags, keys)
+_schema_cache = {}
+
+# ============================================================================
+# ENCODING
+# ============================================================================
+
+def encode_character(character):
+    """Encode a character mapping into binary save bytes."""
+    tags = []
+    keys = []
+    strings = []
+    ints = []
+
+    for key, value in character.items():
+        if not isinstance(key, str) or "\0" in key:
+            raise InvalidSaveDataError(f"Invalid field name: {key!r}")
+        keys.append(key)
+
+        if value is None:
+            tags.append("n")
+        elif isinstance(value, int):
+            if INT64_MIN <= value <= INT64_MAX:
+                tags.append("i")
+                ints.append(value)
+            else:
+                tags.append("z")
+                strings.append(str(value))
+        elif isinstance(value, str):
+            if "\0" in value:
+                raise InvalidSaveDataError(f"Field {key} contains a NUL character")
+            tags.append("s")
+            strings.append(value)
+        elif isinstance(value, (list, StackedInventory)):
+            if isinstance(value, StackedInventory):
+                value = value.to_list()
+            for entry in value:
+                if not isinstance(entry, str) or "\0" in entry:
+                    raise InvalidSaveDataError(f"Field {key} must be a list of strings")
+            tags.append("l")
+            ints.append(len(value))
+            strings.extend(value)
+        else:
+            raise InvalidSaveDataError(f"Cannot save field {key} of type {type(value).__name__}")
+
+    schema = "\0".join(["".join(tags)] + keys).encode("utf-8")
+    string_data = "\0".join(strings).encode("utf-8")
+    payload = b"".join([
+        U32.pack(len(schema)), schema,
+        PAIR_U32.pack(len(strings), len(string_data)), string_data,
+        U32.pack(len(ints)), struct.pack(f">{len(ints)}q", *ints),
+    ])
+    header = HEADER.pack(MAGIC, VERSION, len(payload), zlib.crc32(payload))
+    return header + payload
+
+# ============================================================================
+# DECODING
+# ============================================================================
+
+def decode_character(data):
+    """Decode binary save bytes back into a character dict."""
+    if len(data) < HEADER.size:
+        raise SaveFileCorruptedError("Save file is truncated")
+
+    magic, version, length, checksum = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise SaveFileCorruptedError("Not a binary save file")
+    if version > VERSION:
+        raise InvalidSaveDataError(f"Unsupported save version: {version}")
+    if len(data) - HEADER.size != length:
+        raise SaveFileCorruptedError("Save file is truncated")
+    if zlib.crc32(memoryview(data)[HEADER.size:]) != checksum:
+        raise SaveFileCorruptedError("Save file checksum mismatch")
+
+    try:
+        return _decode_payload(bytes(data), HEADER.size)
+    except (struct.error, UnicodeDecodeError, IndexError, ValueError) as e:
+        raise SaveFileCorruptedError(f"Malformed save payload: {e}")
+
+
+def _decode_schema(schema):
+    decoded = _schema_cache.get(schema)
+    if decoded is None:
+        tags, *keys = schema.decode("utf-8").split("\0")
+        if len(tags) != len(keys):
+            raise ValueError("schema tag count does not match field count")
+        decoded = (tags, keys)
+        if len(_schema_cache) < 64:
+            _schema_cache[schema] = decoded
+    return decoded
+
+
+def _decode_payload(data, offset):
+    (schema_size,) = U32.unpack_from(data, offset)
+    offset += 4
+    tags, keys = _decode_schema(data[offset:offset + schema_size])
+    offset += schema_size
+
+    string_count, strings_size = PAIR_U32.unpack_from(data, offset)
+    offset += 8
+    strings = data[offset:offset + strings_size].decode("utf-8").split("\0") if string_count else []
+    offset += strings_size
+    if len(strings) != string_count:
+        raise ValueError("string count does not match string table")
+
+    (int_count,) = U32.unpack_from(data, offset)
+    offset += 4
+    ints = struct.unpack_from(f">{int_count}q", data, offset)
+    offset += 8 * int_count
+    if offset != len(data):
+        raise SaveFileCorruptedError("Unexpected data after last field")
+
+    character = {}
+    next_string = 0
+    next_int = 0
+    for tag, key in zip(tags, keys):
+        if tag == "i":
+            character[key] = ints[next_int]
+            next_int += 1
+        elif tag == "s":
+            character[key] = strings[next_string]
+            next_string += 1
+        elif tag == "l":
+            count = ints[next_int]
+            next_int += 1
+            character[key] = strings[next_string:next_string + count]
+            next_string += count
+        elif tag == "n":
+            character[key] = None
+        elif tag == "z":
+            character[key] = int(strings[next_string])
+            next_string += 1
+        else:
+            raise InvalidSaveDataError(f"Unknown field type in save: {tag!r}")
+
+    if next_string != string_count or next_int != int_count:
+        raise ValueError("field values do not match the string and int tables")
+    return character
@@ -0,0 +1,157 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Bulk Loader Module
+
+Boot-time roster loading. Streams a save directory with os.scandir,
+parses and validates the saves across a process pool in fixed-size
+batches, and reports bad saves (InvalidSaveDataError,
+SaveFileCorruptedError) without stopping at the first one.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import binary_save
+import character_manager
+from custom_exceptions import (
+    CharacterNotFoundError,
+    InvalidSaveDataError,
+    SaveFileCorruptedError
+)
+from records import use_quest_logs
+
+DEFAULT_BATCH_SIZE = 2048
+
+# ============================================================================
+# DIRECTORY SCAN
+# ============================================================================
+
+def scan_save_files(save_directory="data/save_games"):
+    """
+    Yield (character_name, path, save_format) for each save in a directory.
+
+    Saves are yielded as the scan reaches them. A character with both a
+    text and a binary save is yielded once, for the file
+    character_manager.find_save() picks; only then is anything stat()ed.
+    """
+    if not os.path.isdir(save_directory):
+        return
+
+    formats = character_manager.SAVE_FORMATS
+    with os.scandir(save_directory) as entries:
+        for entry in entries:
+            for save_format, suffix in formats.items():
+                if not entry.name.endswith(suffix):
+                    continue
+                name = entry.name[:-len(suffix)]
+                others = [
+                    character_manager.get_save_path(name, save_directory, other)
+                    for other in formats if other != save_format
+                ]
+                if any(os.path.exists(other) for other in others):
+                    # The pair's other file is skipped the same way
+                    try:
+                        chosen = character_manager.find_save(name, save_directory)[1]
+                    except CharacterNotFoundError:
+                        break       # deleted while we were scanning
+                    if chosen != save_format:
+                        break
+                yield name, entry.path, save_format
+                break
+
+# ============================================================================
+# PARSE + VALIDATE (runs in worker processes)
+# ============================================================================
+
+def load_save_file(task):
+    """
+    Parse and validate one save file.
+
+    Returns (name, character, None) on success or (name, None, error)
+    where error is a dict describing what went wrong.
+    """
+    name, path, save_format = task
+    try:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            raise SaveFileCorruptedError("Unable to read save file")
+
+        if save_format == "binary":
+            character = use_quest_logs(binary_save.decode_character(data))
+        else:
+            try:
+                text = data.decode("utf-8")
+            except UnicodeDecodeError:
+                raise SaveFileCorruptedError("Save file is not valid UTF-8")
+            character = character_manager.parse_save_lines(text.splitlines())
+
+        character_manager.validate_character_data(character)
+        return name, character, None
+
+    except (InvalidSaveDataError, SaveFileCorruptedError) as e:
+        return name, None, {
+            "name": name,
+            "path": path,
+            "error": type(e).__name__,
+            "message": str(e)
+        }
+
+# ============================================================================
+# BULK LOADING
+# ============================================================================
+
+def iter_load_saves(save_directory="data/save_games", workers=None,
+                    batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Yield (name, character, error) for every save in the directory.
+
+    Files are handed to the pool in batches of batch_size, so memory
+    stays bounded however many saves there are. workers=1 loads in this
+    process.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    files = scan_save_files(save_directory)
+    if workers <= 1:
+        for task in files:
+            yield load_save_file(task)
+        return
+
+    chunksize = max(1, batch_size // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            batch = []
+            for task in files:
+                batch.append(task)
+                if len(batch) >= batch_size:
+                    break
+            if not batch:
+                return
+            yield from pool.map(load_save_file, batch, chunksize=chunksize)
+
+
+def load_all_saves(save_directory="data/save_games", workers=None,
+                   batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Load a whole save directory into a roster plus an error report:
+
+        {"characters": {name: character}, "errors": [error dicts],
+         "loaded": count, "failed": count}
+    """
+    characters = {}
+    errors = []
+    for name, character, error in iter_load_saves(save_directory, workers, batch_size):
+        if error is None:
+            characters[name] = character
+        else:
+            errors.append(error)
+
+    return {
+        "characters": characters,
+        "errors": errors,
+        "loaded": len(characters),
+        "failed": len(errors)
+    }
@@ -0,0 +1,103 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Character Cache Module
+
+Bounded LRU cache in front of character_manager.load_character. Entries
+are evicted when the cache is over max_size (least recently used first)
+or when they are older than ttl seconds. save_character writes through
+to disk and refreshes the cache; delete_character invalidates it.
+
+The cache hands out copies, so a caller changing a loaded character does
+not change the cached one behind the save file's back.
+"""
+
+import time
+from collections import OrderedDict
+
+import character_manager
+from records import copy_character_state
+
+# ============================================================================
+# CHARACTER CACHE
+# ============================================================================
+
+class CharacterCache:
+
+    def __init__(self, max_size=1024, ttl=None, save_directory="data/save_games",
+                 save_format="text", clock=time.monotonic):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.save_directory = save_directory
+        self.save_format = save_format
+        self.clock = clock
+
+        self._entries = OrderedDict()   # name -> (stored at, character)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, character_name):
+        return character_name in self._entries
+
+    # ------------------------------------------------------------------------
+    # CACHED SAVE API
+    # ------------------------------------------------------------------------
+
+    def load_character(self, character_name):
+        entry = self._entries.get(character_name)
+        if entry is not None:
+            stored_at, character = entry
+            if self.ttl is not None and self.clock() - stored_at >= self.ttl:
+                del self._entries[character_name]
+                self.expirations += 1
+            else:
+                self._entries.move_to_end(character_name)
+                self.hits += 1
+                return copy_character_state(character)
+
+        self.misses += 1
+        character = character_manager.load_character(character_name, self.save_directory)
+        self._store(character_name, character)
+        return copy_character_state(character)
+
+    def save_character(self, character):
+        character_manager.save_character(character, self.save_directory, self.save_format)
+        self._store(character["name"], copy_character_state(character))
+        return True
+
+    def delete_character(self, character_name):
+        self.invalidate(character_name)
+        return character_manager.delete_character(character_name, self.save_directory)
+
+    # ------------------------------------------------------------------------
+    # CACHE MANAGEMENT
+    # ------------------------------------------------------------------------
+
+    def invalidate(self, character_name):
+        return self._entries.pop(character_name, None) is not None
+
+    def clear(self):
+        self._entries.clear()
+
+    def _store(self, character_name, character):
+        self._entries[character_name] = (self.clock(), character)
+        self._entries.move_to_end(character_name)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get_stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
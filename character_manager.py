@@ -7,7 +7,12 @@ AI Usage: [Document any AI assistance used]
 This module handles character creation, loading, saving, and character management.
 """
 
+import math
 import os
+import stat
+
+import binary_save
+from records import QuestLog, StackedInventory, use_quest_logs
 
 from custom_exceptions import (
     InvalidCharacterClassError,
@@ -45,8 +50,8 @@ def create_character(name, character_class):
         "experience": 0,
         "gold": 100,
         "inventory": [],
-        "active_quests": [],
-        "completed_quests": []
+        "active_quests": QuestLog(),
+        "completed_quests": QuestLog()
     }
 
 # ======================================================================
@@ -59,17 +64,33 @@ def gain_experience(character, xp_amount):
 
     character["experience"] += xp_amount
 
-    while True:
-        required = character["level"] * 100
-        if character["experience"] >= required:
-            character["experience"] -= required
-            character["level"] += 1
-            character["max_health"] += 10
-            character["strength"] += 2
-            character["magic"] += 2
-            character["health"] = character["max_health"]
-        else:
-            break
+    new_level, remaining = calculate_level_up(character["level"], character["experience"])
+    gained = new_level - character["level"]
+    if gained > 0:
+        character["level"] = new_level
+        character["experience"] = remaining
+        character["max_health"] += 10 * gained
+        character["strength"] += 2 * gained
+        character["magic"] += 2 * gained
+        character["health"] = character["max_health"]
+
+def calculate_level_up(level, experience):
+    """
+    Return (new_level, leftover_xp) for a character holding `experience` XP.
+
+    Going from level L up n levels costs 100 * (L + (L+1) + ... + (L+n-1))
+    XP, an arithmetic series, so the largest affordable n is the root of a
+    quadratic instead of a level-by-level loop.
+    """
+    if experience < level * 100:
+        return level, experience
+
+    # n*L + n*(n-1)/2 <= budget  <=>  n^2 + (2L-1)*n - 2*budget <= 0
+    budget = experience // 100
+    b = 2 * level - 1
+    n = (math.isqrt(b * b + 8 * budget) - b) // 2
+    cost = 100 * (n * level + n * (n - 1) // 2)
+    return level + n, experience - cost
 
 # ======================================================================
 # GOLD MANAGEMENT
@@ -104,30 +125,162 @@ def revive_character(character):
 # SAVE / LOAD CHARACTER
 # ======================================================================
 
-def save_character(character, save_directory="data/save_games"):
+# Save file suffix for each supported format
+SAVE_FORMATS = {
+    "text": "_save.txt",
+    "binary": "_save.bin",
+}
+
+def get_save_path(character_name, save_directory="data/save_games", save_format="text"):
+    if save_format not in SAVE_FORMATS:
+        raise ValueError(f"Unknown save format: {save_format}")
+    return os.path.join(save_directory, f"{character_name}{SAVE_FORMATS[save_format]}")
+
+def save_character(character, save_directory="data/save_games", save_format="text", fsync=False):
+    write_save(character, save_directory, save_format, fsync)
+    return True
+
+def write_save(character, save_directory="data/save_games", save_format="text", fsync=False):
+    """Write a character's save atomically and return the bytes written."""
     os.makedirs(save_directory, exist_ok=True)
-    path = os.path.join(save_directory, f"{character['name']}_save.txt")
+    path = get_save_path(character['name'], save_directory, save_format)
+
+    if save_format == "binary":
+        data = binary_save.encode_character(character)
+    else:
+        lines = []
+        for key, value in character.items():
+            if isinstance(value, (list, StackedInventory)):
+                value = ",".join(value)
+            lines.append(f"{key.upper()}: {value}\n")
+        data = "".join(lines).encode("utf-8")
+
+    # IOError / PermissionError propagate to the caller
+    written = atomic_write(path, data, fsync)
+
+    # Keep one save per character so a load never finds a stale format
+    for other_format in SAVE_FORMATS:
+        if other_format != save_format:
+            try:
+                os.remove(get_save_path(character['name'], save_directory, other_format))
+            except FileNotFoundError:
+                pass
+    return written
+
+def _create_temp_file(directory):
+    """
+    Create a new hidden temp file in directory and return (fd, path).
+
+    Unlike mkstemp (always 0600) it is created 0666, so the kernel applies
+    the process umask just as open() would.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        temp_path = os.path.join(directory, f".{os.urandom(8).hex()}.tmp")
+        try:
+            return os.open(temp_path, flags, 0o666), temp_path
+        except FileExistsError:
+            continue
+
+def atomic_write(path, data, fsync=False):
+    """
+    Replace path with data so readers only ever see the old or new file.
+
+    The data goes to a temp file in the same directory which is then
+    renamed over path. The file keeps the mode of the one it replaces, or
+    gets the mode open() would give a new file. With fsync=True the file (and, where supported, its directory entry)
+    is flushed to disk before returning.
+    """
+    directory = os.path.dirname(path) or "."
     try:
-        with open(path, "w") as f:
-            for key, value in character.items():
-                if isinstance(value, list):
-                    value = ",".join(value)
-                f.write(f"{key.upper()}: {value}\n")
-        return True
-    except Exception:
-        raise  # Allow IOError / PermissionError to propagate
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    fd, temp_path = _create_temp_file(directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if mode is not None and hasattr(os, "fchmod"):
+                os.fchmod(f.fileno(), mode)
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    if fsync:
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return len(data)    # e.g. Windows cannot open directories
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+    return len(data)
+
+def find_save(character_name, save_directory="data/save_games"):
+    """
+    Return (path, save_format) of a character's current save.
+
+    write_save() leaves one format per character, but if both files exist
+    (older saves, or files copied in by hand) the newest one wins, binary
+    on a tie. Raises CharacterNotFoundError if there is no save.
+    """
+    newest = None
+    for save_format in SAVE_FORMATS:
+        path = get_save_path(character_name, save_directory, save_format)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            continue
+        if newest is None or mtime >= newest[0]:
+            newest = (mtime, path, save_format)
 
-def load_character(character_name, save_directory="data/save_games"):
-    path = os.path.join(save_directory, f"{character_name}_save.txt")
+    if newest is None:
+        raise CharacterNotFoundError(f"No save found for {character_name}")
+    return newest[1], newest[2]
+
+def load_character(character_name, save_directory="data/save_games", save_format=None):
+    """
+    Load a saved character. With save_format=None the format is picked by
+    find_save().
+    """
+    if save_format is None:
+        path, save_format = find_save(character_name, save_directory)
+    else:
+        path = get_save_path(character_name, save_directory, save_format)
     if not os.path.exists(path):
         raise CharacterNotFoundError(f"No save found for {character_name}")
 
+    if save_format == "binary":
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except Exception:
+            raise SaveFileCorruptedError("Unable to read save file")
+        character = use_quest_logs(binary_save.decode_character(data))
+        validate_character_data(character)
+        return character
+
     try:
-        with open(path, "r") as f:
+        with open(path, "r", encoding="utf-8") as f:
             lines = f.readlines()
     except Exception:
         raise SaveFileCorruptedError("Unable to read save file")
 
+    character = parse_save_lines(lines)
+    validate_character_data(character)
+    return character
+
+def parse_save_lines(lines):
+    """Turn the lines of a text save into a character dict."""
     character = {}
     for line in lines:
         if ":" not in line:
@@ -146,7 +299,15 @@ def load_character(character_name, save_directory="data/save_games"):
         except Exception:
             raise InvalidSaveDataError(f"Invalid numeric data: {nf}")
 
-    validate_character_data(character)
+    return use_quest_logs(character)
+
+def convert_save(character_name, to_format, save_directory="data/save_games"):
+    """Rewrite a character's save in another format and remove the old file."""
+    if to_format not in SAVE_FORMATS:
+        raise ValueError(f"Unknown save format: {to_format}")
+    from_format = "text" if to_format == "binary" else "binary"
+    character = load_character(character_name, save_directory, from_format)
+    save_character(character, save_directory, to_format)
     return character
 
 # ======================================================================
@@ -158,17 +319,26 @@ def list_saved_characters(save_directory="data/save_games"):
         return []
 
     chars = []
+    seen = set()
     for filename in os.listdir(save_directory):
-        if filename.endswith("_save.txt"):
-            chars.append(filename[:-9])
+        for suffix in SAVE_FORMATS.values():
+            if filename.endswith(suffix):
+                name = filename[:-len(suffix)]
+                if name not in seen:
+                    seen.add(name)
+                    chars.append(name)
     return chars
 
 def delete_character(character_name, save_directory="data/save_games"):
-    path = os.path.join(save_directory, f"{character_name}_save.txt")
-    if not os.path.exists(path):
+    deleted = False
+    for save_format in SAVE_FORMATS:
+        path = get_save_path(character_name, save_directory, save_format)
+        if os.path.exists(path):
+            os.remove(path)
+            deleted = True
+
+    if not deleted:
         raise CharacterNotFoundError(f"No save file for {character_name}")
-
-    os.remove(path)
     return True
 
 # ======================================================================
@@ -190,6 +360,6 @@ def validate_character_data(character):
             raise InvalidSaveDataError(f"Field {nf} must be an integer")
 
     for lf in ["inventory", "active_quests", "completed_quests"]:
-        if not isinstance(character[lf], list):
+        if not isinstance(character[lf], (list, StackedInventory)):
             raise InvalidSaveDataError(f"Field {lf} must be a list")
     return True
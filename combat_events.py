@@ -0,0 +1,146 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Combat Events Module
+
+Structured combat log. SimpleBattle emits a CombatEvent for every action
+(turn, actor, action, target, damage, HP after) to a sink:
+
+    ConsoleSink      prints the classic battle log (the default)
+    RingBufferSink   keeps the last N events in memory
+    JsonlSink        appends one JSON object per line, written in batches
+    NullSink         drops everything (HeadlessBattle's default)
+    FanoutSink       sends each event to several sinks
+
+Battles check sink.enabled before building an event, so with a NullSink
+logging costs one attribute check per action.
+"""
+
+import json
+from collections import deque, namedtuple
+
+# damage is HP removed from the target (negative for healing), as reported
+# by the action itself; hp_after is the target's HP once the action is
+# done. Both target and hp_after are None for escapes and invalid choices.
+CombatEvent = namedtuple(
+    "CombatEvent", "turn actor action target damage hp_after message")
+
+# ============================================================================
+# SINKS
+# ============================================================================
+
+class NullSink:
+    """Discards events; battles skip building them at all."""
+
+    enabled = False
+
+    def emit(self, event):
+        pass
+
+    def close(self):
+        pass
+
+
+NULL_SINK = NullSink()
+
+
+class ConsoleSink:
+    """Renders events as the original print-based battle log."""
+
+    enabled = True
+
+    def emit(self, event):
+        if event.action == "status":
+            print(event.message)
+            return
+        if event.action == "enemy_attack":
+            print("\n--- Enemy Turn ---")
+        print(f">>> {event.message}")
+
+    def close(self):
+        pass
+
+
+class RingBufferSink:
+    """Keeps the most recent `capacity` events."""
+
+    enabled = True
+
+    def __init__(self, capacity=1000):
+        self.buffer = deque(maxlen=capacity)
+
+    def emit(self, event):
+        self.buffer.append(event)
+
+    @property
+    def events(self):
+        return list(self.buffer)
+
+    def close(self):
+        pass
+
+
+class JsonlSink:
+    """
+    Appends events to a JSON Lines file, batch_size lines per write.
+
+    Call close() (or use it as a context manager) to write the last
+    partial batch.
+    """
+
+    enabled = True
+
+    def __init__(self, path, batch_size=256):
+        self.path = path
+        self.batch_size = batch_size
+        self._pending = []
+        self._file = None
+        self.events_written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def emit(self, event):
+        self._pending.append(json.dumps(event._asdict()) + "\n")
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write("".join(self._pending))
+        self._file.flush()
+        self.events_written += len(self._pending)
+        self._pending = []
+
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class FanoutSink:
+    """Sends every event to each of several sinks."""
+
+    def __init__(self, *sinks):
+        self.sinks = [sink for sink in sinks if sink.enabled]
+        self.enabled = bool(self.sinks)
+
+    def emit(self, event):
+        for sink in self.sinks:
+            sink.emit(event)
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+
+def read_jsonl_events(path):
+    """Load the events a JsonlSink wrote."""
+    with open(path, "r", encoding="utf-8") as f:
+        return [CombatEvent(**json.loads(line)) for line in f if line.strip()]
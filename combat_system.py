@@ -17,6 +17,11 @@ from custom_exceptions import (
 
 import random
 
+from combat_events import CombatEvent, ConsoleSink
+
+# menu choice -> event action name
+ACTION_NAMES = {"1": "attack", "2": "ability", "3": "escape"}
+
 # ============================================================================
 # ENEMY DEFINITIONS
 # ============================================================================
@@ -78,21 +83,32 @@ def get_random_enemy_for_level(character_level):
 
 class SimpleBattle:
 
-    def __init__(self, character, enemy):
+    def __init__(self, character, enemy, rng=None, sink=None):
         self.character = character
         self.enemy = enemy
         self.combat_active = True
         self.turn = 1
+        # Anything with randint()/choice(); defaults to the global random module
+        self.rng = rng if rng is not None else random
+        # Where combat events go (see combat_events); printed by default
+        self.sink = sink if sink is not None else ConsoleSink()
+
+    def emit(self, actor, action, target, damage, hp_after, message):
+        self.sink.emit(CombatEvent(self.turn, actor, action, target, damage, hp_after, message))
 
     def start_battle(self):
         """Run the combat loop until someone dies."""
         if self.character["health"] <= 0:
             raise CharacterDeadError("Character is already dead!")
 
-        display_battle_log("Battle begins!")
+        if self.sink.enabled:
+            self.emit(self.character["name"], "battle_start", self.enemy["name"], 0,
+                      self.enemy["health"], "Battle begins!")
 
         while self.combat_active:
-            display_combat_stats(self.character, self.enemy)
+            if self.sink.enabled:
+                self.emit(self.character["name"], "status", self.enemy["name"], 0,
+                          self.enemy["health"], format_combat_stats(self.character, self.enemy))
 
             # Player turn
             self.player_turn()
@@ -108,6 +124,8 @@ class SimpleBattle:
                 self.combat_active = False
                 break
 
+            self.turn += 1
+
         # Return results
         if result == "player":
             rewards = get_victory_rewards(self.enemy)
@@ -129,35 +147,56 @@ class SimpleBattle:
         print("3. Run Away")
 
         choice = input("Choose action (1-3): ")
+        self.perform_action(choice)
+
+    def perform_action(self, choice):
+        """Carry out a menu choice ("1"-"3"), emit its event and return the log message."""
+        target, damage, message = self._act(choice)
+        if self.sink.enabled:
+            if target is None:
+                # Escapes and invalid choices affect nobody's HP
+                self.emit(self.character["name"], ACTION_NAMES.get(choice, "invalid"),
+                          None, 0, None, message)
+            else:
+                self.emit(self.character["name"], ACTION_NAMES.get(choice, "invalid"),
+                          target["name"], damage, target["health"], message)
+        return message
 
+    def _act(self, choice):
+        """Returns (target, HP removed from it, message); target is None if nobody was hit."""
         if choice == "1":
             dmg = self.calculate_damage(self.character, self.enemy)
+            before = self.enemy["health"]
             self.apply_damage(self.enemy, dmg)
-            display_battle_log(f"You deal {dmg} damage!")
+            return self.enemy, before - self.enemy["health"], f"You deal {dmg} damage!"
 
         elif choice == "2":
-            result = use_special_ability(self.character, self.enemy)
-            display_battle_log(result)
+            return resolve_special_ability(self.character, self.enemy, self.rng)
 
         elif choice == "3":
             success = self.attempt_escape()
             if success:
-                display_battle_log("You escaped successfully!")
                 self.combat_active = False
+                return None, 0, "You escaped successfully!"
             else:
-                display_battle_log("Escape failed!")
+                return None, 0, "Escape failed!"
 
         else:
-            display_battle_log("Invalid choice — you lose your turn!")
+            return None, 0, "Invalid choice — you lose your turn!"
 
     def enemy_turn(self):
         if not self.combat_active:
             raise CombatNotActiveError("Combat is not active.")
 
-        print("\n--- Enemy Turn ---")
+        self.enemy_attack()
+
+    def enemy_attack(self):
         dmg = self.calculate_damage(self.enemy, self.character)
         self.apply_damage(self.character, dmg)
-        display_battle_log(f"{self.enemy['name']} hits you for {dmg} damage!")
+        if self.sink.enabled:
+            self.emit(self.enemy["name"], "enemy_attack", self.character["name"], dmg,
+                      self.character["health"], f"{self.enemy['name']} hits you for {dmg} damage!")
+        return dmg
 
     def calculate_damage(self, attacker, defender):
         raw_damage = attacker["strength"] - (defender["strength"] // 4)
@@ -178,7 +217,7 @@ class SimpleBattle:
         return None
 
     def attempt_escape(self):
-        chance = random.randint(1, 2)
+        chance = self.rng.randint(1, 2)
         return chance == 1
 
 
@@ -186,61 +225,87 @@ class SimpleBattle:
 # SPECIAL ABILITIES
 # ============================================================================
 
-def use_special_ability(character, enemy):
+# Each ability has a public function returning the log message and an
+# internal one returning (target, HP removed from it, message), with a
+# negative amount for healing; the combat log uses the latter.
+
+def use_special_ability(character, enemy, rng=random):
     """Executes character's special ability based on class."""
+    return resolve_special_ability(character, enemy, rng)[2]
+
+
+def resolve_special_ability(character, enemy, rng=random):
+    """Like use_special_ability(), but returns (target, hp_removed, message)."""
     char_class = character["class"].lower()
 
     if char_class == "warrior":
-        return warrior_power_strike(character, enemy)
+        return _power_strike(character, enemy)
 
     elif char_class == "mage":
-        return mage_fireball(character, enemy)
+        return _fireball(character, enemy)
 
     elif char_class == "rogue":
-        return rogue_critical_strike(character, enemy)
+        return _critical_strike(character, enemy, rng)
 
     elif char_class == "cleric":
-        return cleric_heal(character)
+        return _heal(character)
 
     else:
-        return "No special ability for this class."
+        return None, 0, "No special ability for this class."
 
 
 def warrior_power_strike(character, enemy):
-    dmg = character["strength"] * 2
-    enemy["health"] -= dmg
-    if enemy["health"] < 0:
-        enemy["health"] = 0
-    return f"Power Strike! You deal {dmg} damage."
+    return _power_strike(character, enemy)[2]
 
 
 def mage_fireball(character, enemy):
-    dmg = character["magic"] * 2
+    return _fireball(character, enemy)[2]
+
+
+def rogue_critical_strike(character, enemy, rng=random):
+    return _critical_strike(character, enemy, rng)[2]
+
+
+def cleric_heal(character):
+    return _heal(character)[2]
+
+
+def _hit(enemy, dmg):
+    """Take dmg off the enemy (not below 0); returns the HP actually removed."""
+    before = enemy["health"]
     enemy["health"] -= dmg
     if enemy["health"] < 0:
         enemy["health"] = 0
-    return f"Fireball hits for {dmg} damage!"
+    return before - enemy["health"]
+
+
+def _power_strike(character, enemy):
+    dmg = character["strength"] * 2
+    return enemy, _hit(enemy, dmg), f"Power Strike! You deal {dmg} damage."
+
+
+def _fireball(character, enemy):
+    dmg = character["magic"] * 2
+    return enemy, _hit(enemy, dmg), f"Fireball hits for {dmg} damage!"
 
 
-def rogue_critical_strike(character, enemy):
-    if random.randint(1, 2) == 1:
+def _critical_strike(character, enemy, rng):
+    if rng.randint(1, 2) == 1:
         dmg = character["strength"] * 3
         msg = "Critical hit! Massive damage!"
     else:
         dmg = character["strength"]
         msg = "Normal hit."
-    enemy["health"] -= dmg
-    if enemy["health"] < 0:
-        enemy["health"] = 0
-    return f"{msg} You deal {dmg} damage."
+    return enemy, _hit(enemy, dmg), f"{msg} You deal {dmg} damage."
 
 
-def cleric_heal(character):
+def _heal(character):
     healed = 30
+    before = character["health"]
     character["health"] += healed
     if character["health"] > character["max_health"]:
         character["health"] = character["max_health"]
-    return f"You heal yourself for {healed} HP."
+    return character, before - character["health"], f"You heal yourself for {healed} HP."
 
 
 # ============================================================================
@@ -259,8 +324,12 @@ def get_victory_rewards(enemy):
 
 
 def display_combat_stats(character, enemy):
-    print(f"\n{character['name']}: HP={character['health']}/{character['max_health']}")
-    print(f"{enemy['name']}: HP={enemy['health']}/{enemy['max_health']}")
+    print(format_combat_stats(character, enemy))
+
+
+def format_combat_stats(character, enemy):
+    return (f"\n{character['name']}: HP={character['health']}/{character['max_health']}\n"
+            f"{enemy['name']}: HP={enemy['health']}/{enemy['max_health']}")
 
 
 def display_battle_log(message):
@@ -0,0 +1,223 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Game Data Watcher Module
+
+Hot reload for data/quests.txt and data/items.txt. GameDataWatcher polls
+the files' size and mtime (no external dependencies); when one changes it
+re-reads the file, reparses only the blocks whose text changed, and swaps
+in the new dict in a single assignment.
+
+Readers never wait on a reload: they take watcher.quests / watcher.items
+(or watcher.snapshot() for a matching pair) and pass those dicts to
+inventory_system / quest_handler as usual. A request that already holds
+the old dicts keeps using them until it finishes. Records are shared
+between versions, so treat them as read-only.
+
+A file that fails to parse or validate is not swapped in; the previous
+data stays live and the error is kept in last_error until a good reload.
+"""
+
+import os
+import threading
+
+import game_data
+from custom_exceptions import DataError, InvalidDataFormatError, MissingDataFileError
+
+DEFAULT_POLL_INTERVAL = 1.0
+
+# ============================================================================
+# WATCHED FILE
+# ============================================================================
+
+class WatchedDataFile:
+    """One data file plus the parsed record for each block of its text."""
+
+    def __init__(self, path, kind, parse, validate, id_key, validate_all=None):
+        self.path = path
+        self.kind = kind
+        self.parse = parse
+        self.validate = validate
+        self.id_key = id_key
+        self.validate_all = validate_all    # whole-file check, e.g. the quest graph
+        self.signature = None   # (size, mtime_ns) of the loaded version
+        self._blocks = {}       # block text -> record
+        self.blocks_reparsed = 0
+
+    def changed(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False        # keep serving the last good data
+        return (stat.st_size, stat.st_mtime_ns) != self.signature
+
+    def load(self):
+        """Parse the file and make it the loaded version."""
+        records, update = self.read()
+        update()
+        return records
+
+    def read(self):
+        """
+        Parse the file, reusing records of unchanged blocks.
+
+        Returns (records, update); call update() once the records are in
+        use so the next read() compares against this version.
+        """
+        if not os.path.exists(self.path):
+            raise MissingDataFileError(f"{self.kind.capitalize()} file not found: {self.path}")
+
+        stat = os.stat(self.path)
+        with open(self.path, "r", encoding="utf-8") as f:
+            text = f.read()
+
+        records = {}
+        blocks = {}
+        reparsed = 0
+        for first_line, block in split_blocks(text):
+            record = self._blocks.get(block)
+            if record is None:
+                record = self._parse(block, first_line)
+                reparsed += 1
+            blocks[block] = record
+            records[record[self.id_key]] = record
+
+        if not records:
+            raise InvalidDataFormatError(f"{self.kind.capitalize()} file is empty or invalid")
+        if self.validate_all is not None:
+            self.validate_all(records)
+
+        def update():
+            self._blocks = blocks
+            self.signature = (stat.st_size, stat.st_mtime_ns)
+            self.blocks_reparsed += reparsed
+
+        return records, update
+
+    def _parse(self, block, first_line):
+        try:
+            record = self.parse(block.split("\n"))
+            self.validate(record)
+        except InvalidDataFormatError as e:
+            raise InvalidDataFormatError(
+                f"Invalid {self.kind} block at line {first_line}: {e}")
+        return record
+
+
+def split_blocks(text):
+    """Yield (first_line_number, block_text) for each blank-line separated block."""
+    lines = []
+    first_line = 0
+    for line_number, line in enumerate(text.splitlines(), 1):
+        if line.strip():
+            if not lines:
+                first_line = line_number
+            lines.append(line)
+        elif lines:
+            yield first_line, "\n".join(lines)
+            lines = []
+    if lines:
+        yield first_line, "\n".join(lines)
+
+# ============================================================================
+# GAME DATA WATCHER
+# ============================================================================
+
+class GameDataWatcher:
+
+    def __init__(self, quest_file="data/quests.txt", item_file="data/items.txt",
+                 interval=DEFAULT_POLL_INTERVAL):
+        self.interval = interval
+        self._quest_file = WatchedDataFile(quest_file, "quest", game_data.parse_quest_block,
+                                           game_data.validate_quest_data, "quest_id",
+                                           game_data.validate_quest_graph)
+        self._item_file = WatchedDataFile(item_file, "item", game_data.parse_item_block,
+                                          game_data.compile_item, "item_id")
+
+        # Swapped as one tuple so snapshot() never pairs old quests with new items
+        self._data = (self._quest_file.load(), self._item_file.load())
+        self.reloads = 0
+        self.last_error = None
+
+        self._lock = threading.Lock()   # serialises reloads, never readers
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    @property
+    def quests(self):
+        return self._data[0]
+
+    @property
+    def items(self):
+        return self._data[1]
+
+    def snapshot(self):
+        """Return (quests, items) from the same reload."""
+        return self._data
+
+    # ------------------------------------------------------------------------
+    # POLLING
+    # ------------------------------------------------------------------------
+
+    def poll(self):
+        """Reload any changed file; returns True if new data was swapped in."""
+        with self._lock:
+            quest_changed = self._quest_file.changed()
+            item_changed = self._item_file.changed()
+            if not (quest_changed or item_changed):
+                return False
+
+            quests, items = self._data
+            updates = []
+            try:
+                if quest_changed:
+                    quests, update = self._quest_file.read()
+                    updates.append(update)
+                if item_changed:
+                    items, update = self._item_file.read()
+                    updates.append(update)
+            except (DataError, OSError, UnicodeDecodeError) as e:
+                self.last_error = e
+                return False
+
+            self._data = (quests, items)
+            for update in updates:
+                update()
+            self.reloads += 1
+            self.last_error = None
+            return True
+
+    def start(self):
+        """Poll every `interval` seconds on a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="game-data-watcher",
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.poll()
+
+    def get_stats(self):
+        return {
+            "reloads": self.reloads,
+            "blocks_reparsed": self._quest_file.blocks_reparsed + self._item_file.blocks_reparsed,
+            "quests": len(self.quests),
+            "items": len(self.items),
+            "last_error": str(self.last_error) if self.last_error else None
+        }
@@ -3,7 +3,13 @@ COMP 163 - Project 3: Quest Chronicles
 Game Data Module
 """
 
+import hashlib
+import mmap
 import os
+import pickle
+import re
+import sys
+import tempfile
 from custom_exceptions import (
     InvalidDataFormatError,
     MissingDataFileError,
@@ -35,6 +41,7 @@ def load_quests(filename="data/quests.txt"):
             validate_quest_data(quest)
             quests[quest["quest_id"]] = quest
 
+        validate_quest_graph(quests)
         return quests
 
     except InvalidDataFormatError:
@@ -60,8 +67,7 @@ def load_items(filename="data/items.txt"):
 
         for block in blocks:
             lines = block.strip().split("\n")
-            item = parse_item_block(lines)
-            validate_item_data(item)
+            item = compile_item(parse_item_block(lines))
             items[item["item_id"]] = item
 
         return items
@@ -72,6 +78,270 @@ def load_items(filename="data/items.txt"):
         raise CorruptedDataError(f"Error reading item file: {e}")
 
 
+# ============================================================================
+# MEMORY-MAPPED LOADING
+# ============================================================================
+# The file is memory-mapped and decoded a few MB at a time (always cut at
+# a blank line), so there is never a full-file string, block list or
+# per-block line list. Blocks written in the standard field order are
+# matched by one precompiled regex each; any other block falls back to
+# the line-by-line dispatch-table parse. Blocks are separated by blank
+# lines; well-formed files give the same result as load_quests() /
+# load_items().
+
+MMAP_CHUNK_SIZE = 4 * 1024 * 1024
+
+_BLANK_LINE = re.compile(rb"\n[ \t\r]*\n")
+_BLANK_LINE_TEXT = re.compile(r"\n[ \t\r]*(?:\n|\Z)")
+_WHITESPACE = re.compile(r"\s*")
+
+
+def load_quests_mmap(filename="data/quests.txt"):
+    """Loads quests like load_quests(), via a memory-mapped single pass."""
+    quests = _load_mmap(filename, QUEST_FIELDS, "quest", validate_quest_data, "quest_id")
+    validate_quest_graph(quests)
+    return quests
+
+
+def load_items_mmap(filename="data/items.txt"):
+    """Loads items like load_items(), via a memory-mapped single pass."""
+    return _load_mmap(filename, ITEM_FIELDS, "item", compile_item, "item_id")
+
+
+def _load_mmap(filename, fields, kind, validate, id_key):
+    if not os.path.exists(filename):
+        raise MissingDataFileError(f"{kind.capitalize()} file not found: {filename}")
+
+    try:
+        records = {}
+        with open(filename, "rb") as f:
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for record in _iter_mmap_records(mm, fields, kind):
+                        validate(record)
+                        records[record[id_key]] = record
+
+        if not records:
+            raise InvalidDataFormatError(f"{kind.capitalize()} file is empty or invalid")
+        return records
+
+    except InvalidDataFormatError:
+        raise
+    except Exception as e:
+        raise CorruptedDataError(f"Error reading {kind} file: {e}")
+
+
+def _block_layout(fields):
+    """Regex matching one block written in the dispatch table's field order."""
+    keys = [re.escape(key.upper()) for key in fields]
+    body = r"\r?\n".join(f"{key}: ([^\r\n]*)" for key in keys)
+    # The block must end at a blank line (or EOF); trailing blank lines are eaten
+    return re.compile(body + r"\r?(?:\n[ \t\r]*(?:\n\s*|\Z)|\n?\Z)")
+
+
+_layouts = {}   # kind -> compiled block regex, built on first use
+
+
+def _iter_mmap_records(mm, fields, kind):
+    """Yield each record of a mapped file, one decoded chunk at a time."""
+    layout = _layouts.get(kind)
+    if layout is None:
+        layout = _layouts[kind] = _block_layout(fields)
+    names = [name for name, convert in fields.values()]
+    numeric = [name for name, convert in fields.values() if convert is not str]
+
+    size = len(mm)
+    start = 0
+    first_line = 1
+    while start < size:
+        boundary = _BLANK_LINE.search(mm, min(start + MMAP_CHUNK_SIZE, size))
+        end = boundary.end() if boundary else size
+        text = mm[start:end].decode("utf-8")
+        yield from _parse_chunk(text, first_line, layout, names, numeric, fields, kind)
+        first_line += text.count("\n")
+        start = end
+
+
+def _parse_chunk(text, first_line, layout, names, numeric, fields, kind):
+    match_block = layout.match
+    skip_blank = _WHITESPACE.match
+    size = len(text)
+    pos = skip_blank(text).end()
+    while pos < size:
+        match = match_block(text, pos)
+        try:
+            if match is not None:
+                record = dict(zip(names, match.groups()))
+                for name in numeric:
+                    record[name] = int(record[name])
+                pos = match.end()
+            else:
+                boundary = _BLANK_LINE_TEXT.search(text, pos)
+                end = boundary.end() if boundary else size
+                record = _parse_block(text[pos:end].strip().splitlines(), fields)
+                pos = skip_blank(text, end).end()
+        except ValueError as e:
+            line = first_line + text.count("\n", 0, pos)
+            raise InvalidDataFormatError(f"Invalid {kind} block at line {line}: {e}")
+
+        yield record
+
+
+# ============================================================================
+# STREAMING ITERATORS
+# ============================================================================
+# iter_quests()/iter_items() read one block at a time, so memory stays
+# bounded by the largest block however big the catalog is. Blocks are
+# separated by blank lines. Any InvalidDataFormatError names the line
+# the bad block starts on. The quest graph cannot be checked while
+# streaming; run validate_quest_graph() on the collected quests.
+
+def iter_quests(source="data/quests.txt", validate=True):
+    """Yield quest dicts from a path or an open text file, block by block."""
+    return _iter_blocks(source, QUEST_FIELDS, "quest",
+                        validate_quest_data if validate else None)
+
+
+def iter_items(source="data/items.txt", validate=True):
+    """Yield item dicts from a path or an open text file, block by block."""
+    return _iter_blocks(source, ITEM_FIELDS, "item",
+                        compile_item if validate else None)
+
+
+def _iter_blocks(source, fields, kind, validate):
+    if hasattr(source, "readline"):
+        yield from _iter_file_blocks(source, fields, kind, validate)
+        return
+
+    if not os.path.exists(source):
+        raise MissingDataFileError(f"{kind.capitalize()} file not found: {source}")
+    with open(source, "r", encoding="utf-8") as f:
+        yield from _iter_file_blocks(f, fields, kind, validate)
+
+
+def _iter_file_blocks(f, fields, kind, validate):
+    lines = []
+    first_line = 0
+    for line_number, line in enumerate(f, 1):
+        line = line.rstrip("\r\n")
+        if line.strip():
+            if not lines:
+                first_line = line_number
+            lines.append(line)
+        elif lines:
+            yield _build_record(lines, first_line, fields, kind, validate)
+            lines = []
+    if lines:
+        yield _build_record(lines, first_line, fields, kind, validate)
+
+
+def _build_record(lines, first_line, fields, kind, validate):
+    try:
+        record = _parse_block(lines, fields)
+        if validate is not None:
+            validate(record)
+    except (ValueError, InvalidDataFormatError) as e:
+        raise InvalidDataFormatError(f"Invalid {kind} block at line {first_line}: {e}")
+    return record
+
+
+# ============================================================================
+# COMPILED DATA CACHE
+# ============================================================================
+# load_*_cached() keep a pickled copy of the parsed, validated records in
+# <file>.cache next to the data file. The cache is used while the data
+# file's size and mtime are unchanged, or - if only the mtime moved, e.g.
+# after a checkout - while its SHA-256 still matches. Otherwise the file
+# is parsed again and the cache rewritten. A missing, stale or unreadable
+# cache is never an error; it only costs a normal parse.
+
+CACHE_SUFFIX = ".cache"
+CACHE_VERSION = 3
+
+
+def load_quests_cached(filename="data/quests.txt"):
+    """Loads quests like load_quests(), reusing the compiled cache if fresh."""
+    return _load_cached(filename, load_quests_mmap)
+
+
+def load_items_cached(filename="data/items.txt"):
+    """Loads items like load_items(), reusing the compiled cache if fresh."""
+    return _load_cached(filename, load_items_mmap)
+
+
+def get_cache_path(filename):
+    return filename + CACHE_SUFFIX
+
+
+def _load_cached(filename, parse):
+    if not os.path.exists(filename):
+        return parse(filename)      # raises MissingDataFileError
+
+    before = os.stat(filename)
+    cache_path = get_cache_path(filename)
+    cached = _read_cache(cache_path)
+    digest = None
+
+    if cached is not None and cached["size"] == before.st_size:
+        if cached["mtime_ns"] == before.st_mtime_ns:
+            return cached["records"]
+        digest = _file_digest(filename)
+        if cached["sha256"] == digest:
+            cached["mtime_ns"] = before.st_mtime_ns
+            _write_cache(cache_path, cached)
+            return cached["records"]
+
+    records = parse(filename)
+
+    # Only cache what we parsed if the file did not change underneath us
+    after = os.stat(filename)
+    if (after.st_size, after.st_mtime_ns) == (before.st_size, before.st_mtime_ns):
+        _write_cache(cache_path, {
+            "version": CACHE_VERSION,
+            "size": after.st_size,
+            "mtime_ns": after.st_mtime_ns,
+            "sha256": digest or _file_digest(filename),
+            "records": records
+        })
+    return records
+
+
+def _file_digest(filename):
+    digest = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_cache(cache_path):
+    try:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(cached, dict) or cached.get("version") != CACHE_VERSION:
+        return None
+    return cached
+
+
+def _write_cache(cache_path, cached):
+    directory = os.path.dirname(cache_path) or "."
+    try:
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    except OSError:
+        return False            # read-only data directory: just don't cache
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+        return True
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+
+
 # ============================================================================
 # VALIDATION FUNCTIONS
 # ============================================================================
@@ -99,8 +369,102 @@ def validate_quest_data(quest_dict):
     return True
 
 
+def find_quest_graph_problems(quest_dict):
+    """
+    Check the prerequisite graph in one linear pass over the quests.
+
+    Returns a dict of lists (all empty for a good graph):
+        missing_prerequisites  (quest_id, prerequisite) pairs
+        cycles                 each a list of quest ids, in prerequisite order
+        unreachable            quests that can never be unlocked
+        level_inconsistent     (quest_id, prerequisite) where the
+                               prerequisite needs a higher level
+    """
+    problems = {
+        "missing_prerequisites": [],
+        "cycles": [],
+        "unreachable": [],
+        "level_inconsistent": []
+    }
+
+    # Each quest has at most one prerequisite, so following the links from
+    # any quest either ends at a root, at a missing quest, or loops back.
+    reachable = {}          # quest_id -> True/False once settled
+    for start in quest_dict:
+        path = []
+        on_path = {}
+        current = start
+        while True:
+            if current in reachable:
+                ok = reachable[current]
+                break
+            if current in on_path:
+                problems["cycles"].append(path[on_path[current]:][::-1])
+                ok = False
+                break
+            quest = quest_dict[current]
+            on_path[current] = len(path)
+            path.append(current)
+            prereq = quest["prerequisite"]
+            if prereq == "NONE":
+                ok = True
+                break
+            if prereq not in quest_dict:
+                problems["missing_prerequisites"].append((current, prereq))
+                ok = False
+                break
+            current = prereq
+
+        for quest_id in path:
+            reachable[quest_id] = ok
+        if not ok:
+            problems["unreachable"].extend(path)
+
+    for quest_id, quest in quest_dict.items():
+        prereq = quest_dict.get(quest["prerequisite"])
+        if prereq is not None and prereq["required_level"] > quest["required_level"]:
+            problems["level_inconsistent"].append((quest_id, quest["prerequisite"]))
+
+    return problems
+
+
+def validate_quest_graph(quest_dict):
+    """Raises InvalidDataFormatError describing any prerequisite graph problems."""
+    problems = find_quest_graph_problems(quest_dict)
+    messages = []
+    for quest_id, prereq in problems["missing_prerequisites"]:
+        messages.append(f"{quest_id} requires unknown quest {prereq}")
+    for cycle in problems["cycles"]:
+        messages.append("prerequisite cycle " + " -> ".join(cycle + cycle[:1]))
+    if problems["unreachable"]:
+        messages.append(f"{len(problems['unreachable'])} quest(s) can never be unlocked")
+    for quest_id, prereq in problems["level_inconsistent"]:
+        messages.append(f"{quest_id} (level {quest_dict[quest_id]['required_level']}) requires "
+                        f"{prereq} (level {quest_dict[prereq]['required_level']})")
+
+    if messages:
+        raise InvalidDataFormatError("Invalid quest graph: " + "; ".join(messages))
+    return True
+
+
 def validate_item_data(item_dict):
     """Ensures an item has valid fields and types."""
+    _check_item_fields(item_dict)
+    parse_item_effects(item_dict["effect"])     # raises on a malformed effect
+    return True
+
+
+def compile_item(item_dict):
+    """
+    Validates an item and stores its parsed effects in item_dict["effects"],
+    so using or equipping it never re-parses them. Returns the item.
+    """
+    _check_item_fields(item_dict)
+    item_dict["effects"] = parse_item_effects(item_dict["effect"])
+    return item_dict
+
+
+def _check_item_fields(item_dict):
     required = ["item_id", "name", "type", "effect", "cost", "description"]
 
     for key in required:
@@ -115,75 +479,77 @@ def validate_item_data(item_dict):
     except ValueError:
         raise InvalidDataFormatError("Item cost must be an integer")
 
-    return True
+
+def parse_item_effects(effect_string):
+    """
+    Parses "strength:5" or "strength:5,magic:2" into a tuple of
+    (stat, value) pairs; stat names are interned.
+    """
+    effects = []
+    for part in effect_string.split(","):
+        if not part.strip():
+            continue
+        try:
+            stat, value = part.split(":")
+            effects.append((sys.intern(stat.strip()), int(value)))
+        except ValueError:
+            raise InvalidDataFormatError(f"Invalid item effect: {part.strip()}")
+    return tuple(effects)
 
 
 # ============================================================================
 # PARSING FUNCTIONS
 # ============================================================================
 
+# Field dispatch tables: lowercase file key -> (dict key, converter)
+QUEST_FIELDS = {
+    "quest_id": ("quest_id", str),
+    "title": ("title", str),
+    "description": ("description", str),
+    "reward_xp": ("reward_xp", int),
+    "reward_gold": ("reward_gold", int),
+    "required_level": ("required_level", int),
+    "prerequisite": ("prerequisite", str),
+}
+
+ITEM_FIELDS = {
+    "item_id": ("item_id", str),
+    "name": ("name", str),
+    "type": ("type", str),
+    "effect": ("effect", str),
+    "cost": ("cost", int),
+    "description": ("description", str),
+}
+
+
 def parse_quest_block(lines):
     """Parses text lines into a quest dict."""
-    quest = {}
-
     try:
-        for line in lines:
-            if ": " not in line:
-                continue
-            key, val = line.split(": ", 1)
-            key = key.lower()
-
-            if key == "quest_id":
-                quest["quest_id"] = val
-            elif key == "title":
-                quest["title"] = val
-            elif key == "description":
-                quest["description"] = val
-            elif key == "reward_xp":
-                quest["reward_xp"] = int(val)
-            elif key == "reward_gold":
-                quest["reward_gold"] = int(val)
-            elif key == "required_level":
-                quest["required_level"] = int(val)
-            elif key == "prerequisite":
-                quest["prerequisite"] = val
-
-        return quest
-
+        return _parse_block(lines, QUEST_FIELDS)
     except Exception as e:
         raise InvalidDataFormatError(f"Error parsing quest block: {e}")
 
 
 def parse_item_block(lines):
     """Parses text lines into an item dict."""
-    item = {}
-
     try:
-        for line in lines:
-            if ": " not in line:
-                continue
-            key, val = line.split(": ", 1)
-            key = key.lower()
-
-            if key == "item_id":
-                item["item_id"] = val
-            elif key == "name":
-                item["name"] = val
-            elif key == "type":
-                item["type"] = val
-            elif key == "effect":
-                item["effect"] = val
-            elif key == "cost":
-                item["cost"] = int(val)
-            elif key == "description":
-                item["description"] = val
-
-        return item
-
+        return _parse_block(lines, ITEM_FIELDS)
     except Exception as e:
         raise InvalidDataFormatError(f"Error parsing item block: {e}")
 
 
+def _parse_block(lines, fields):
+    record = {}
+    for line in lines:
+        if ": " not in line:
+            continue
+        key, val = line.split(": ", 1)
+        field = fields.get(key.lower())
+        if field is not None:
+            name, convert = field
+            record[name] = convert(val)
+    return record
+
 # ============================================================================
 # CREATE MISSING DATA FILES
 # ============================================================================
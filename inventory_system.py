@@ -7,21 +7,34 @@ Name: [Your Name Here]
 AI Usage: [Document any AI assistance used]
 
 This module handles inventory management, item usage, and equipment.
+
+character['inventory'] may be the plain list of item ids or a
+records.StackedInventory (see use_stacked_inventory()); every function
+here works with both and counts space in slots.
 """
 
+import functools
+from collections import Counter
+
 from custom_exceptions import (
     InventoryFullError,
     ItemNotFoundError,
     InsufficientResourcesError,
     InvalidItemTypeError
 )
+from game_data import parse_item_effects
+from records import StackedInventory
 
 MAX_INVENTORY_SIZE = 20
 
+# Items per slot when stacking; anything not listed takes a slot each
+STACK_LIMITS_BY_TYPE = {"consumable": 10}
+
 # ============================================================================
 
 def add_item_to_inventory(character, item_id):
-    if len(character.get('inventory', [])) >= MAX_INVENTORY_SIZE:
+    inventory = character.get('inventory', [])
+    if slots_used(inventory) + slots_needed(inventory, item_id) > MAX_INVENTORY_SIZE:
         raise InventoryFullError(f"Cannot add {item_id}: Inventory full")
     character.setdefault('inventory', []).append(item_id)
     return True
@@ -44,14 +57,59 @@ def count_item(character, item_id):
 
 
 def get_inventory_space_remaining(character):
-    return MAX_INVENTORY_SIZE - len(character.get('inventory', []))
+    return MAX_INVENTORY_SIZE - slots_used(character.get('inventory', []))
 
 
 def clear_inventory(character):
-    removed_items = character.get('inventory', []).copy()
+    inventory = character.get('inventory', [])
+    if isinstance(inventory, StackedInventory):
+        removed_items = inventory.to_list()
+        character['inventory'] = StackedInventory(stack_limits=inventory.stack_limits,
+                                                  default_limit=inventory.default_limit)
+        return removed_items
+    removed_items = inventory.copy()
     character['inventory'] = []
     return removed_items
 
+# ============================================================================
+# STACKED INVENTORY
+# ============================================================================
+
+def slots_used(inventory):
+    if isinstance(inventory, StackedInventory):
+        return inventory.slots_used
+    return len(inventory)
+
+
+def slots_needed(inventory, item_id, quantity=1):
+    if isinstance(inventory, StackedInventory):
+        return inventory.slots_needed(item_id, quantity)
+    return quantity
+
+
+def get_stack_limits(item_data_dict):
+    """item_id -> stack limit for every item whose type stacks."""
+    return {
+        item_id: STACK_LIMITS_BY_TYPE[item['type']]
+        for item_id, item in item_data_dict.items()
+        if item.get('type') in STACK_LIMITS_BY_TYPE
+    }
+
+
+def use_stacked_inventory(character, item_data_dict=None):
+    """
+    Switch a character's inventory to a StackedInventory (in place).
+
+    With item_data_dict, consumables stack per STACK_LIMITS_BY_TYPE;
+    without it every item keeps its own slot. Saves are unchanged.
+    """
+    inventory = character.get('inventory', [])
+    limits = get_stack_limits(item_data_dict) if item_data_dict else None
+    if isinstance(inventory, StackedInventory):
+        inventory = inventory.to_list()
+    character['inventory'] = StackedInventory(inventory, limits)
+    return character['inventory']
+
 # ============================================================================
 
 def parse_item_effect(effect_string):
@@ -59,18 +117,38 @@ def parse_item_effect(effect_string):
     return stat.strip(), int(value)
 
 
-def apply_stat_effect(character, stat_name, value):
-    # Ensure stat exists
-    if stat_name not in character:
-        character[stat_name] = 0
+def get_item_effects(item_data):
+    """(stat, value) pairs for an item, pre-parsed by game_data.load_items()."""
+    effects = item_data.get('effects')
+    if effects is None:
+        # Hand-built item dicts have only the effect string
+        effects = parse_item_effects(item_data['effect'])
+    return effects
 
-    # Increase stat
-    character[stat_name] += value
 
+def _add_stat(character, stat_name, value):
+    character[stat_name] = character.get(stat_name, 0) + value
+
+
+def _add_health(character, stat_name, value):
     # Clamp health to max
-    if stat_name == "health":
-        max_hp = character.get("max_health", 100)
-        character["health"] = min(character["health"], max_hp)
+    max_hp = character.get("max_health", 100)
+    character["health"] = min(character.get("health", 0) + value, max_hp)
+
+
+# stat -> how an effect on it is applied; anything else is added as-is
+STAT_EFFECTS = {
+    "health": _add_health,
+}
+
+
+def apply_stat_effect(character, stat_name, value):
+    STAT_EFFECTS.get(stat_name, _add_stat)(character, stat_name, value)
+
+
+def apply_item_effects(character, effects):
+    for stat_name, value in effects:
+        STAT_EFFECTS.get(stat_name, _add_stat)(character, stat_name, value)
 
 # ============================================================================
 
@@ -81,14 +159,15 @@ def use_item(character, item_id, item_data):
     if item_data['type'] != 'consumable':
         raise InvalidItemTypeError(f"{item_id} cannot be used")
 
-    # Apply effect
-    stat, val = parse_item_effect(item_data['effect'])
-    apply_stat_effect(character, stat, val)
+    # Apply effects
+    effects = get_item_effects(item_data)
+    apply_item_effects(character, effects)
 
     # Remove item
     remove_item_from_inventory(character, item_id)
 
-    return f"{item_id} used! {stat} increased by {val}."
+    changes = ", ".join(f"{stat} increased by {val}" for stat, val in effects)
+    return f"{item_id} used! {changes}."
 
 
 def equip_weapon(character, item_id, item_data):
@@ -102,13 +181,8 @@ def equip_weapon(character, item_id, item_data):
     if character.get('equipped_weapon'):
         unequip_weapon(character)
 
-    stat, val = parse_item_effect(item_data['effect'])
-    character[stat] = character.get(stat, 0) + val
-
-    character['equipped_weapon'] = item_id
-    remove_item_from_inventory(character, item_id)
-
-    return f"{item_id} equipped! {stat} +{val}"
+    effects = _equip(character, "weapon", item_id, item_data)
+    return f"{item_id} equipped! {_describe_bonus(effects)}"
 
 
 def equip_armor(character, item_id, item_data):
@@ -121,35 +195,88 @@ def equip_armor(character, item_id, item_data):
     if character.get('equipped_armor'):
         unequip_armor(character)
 
-    stat, val = parse_item_effect(item_data['effect'])
-    character[stat] = character.get(stat, 0) + val
+    effects = _equip(character, "armor", item_id, item_data)
+    return f"{item_id} equipped! {_describe_bonus(effects)}"
 
-    character['equipped_armor'] = item_id
-    remove_item_from_inventory(character, item_id)
 
-    return f"{item_id} equipped! {stat} +{val}"
+def _describe_bonus(effects):
+    return ", ".join(f"{stat} +{val}" for stat, val in effects)
 
 
 def unequip_weapon(character):
-    weapon = character.get('equipped_weapon')
-    if not weapon:
-        return None
+    return _unequip(character, "weapon")
+
+
+def unequip_armor(character):
+    return _unequip(character, "armor")
 
-    character['equipped_weapon'] = None
-    add_item_to_inventory(character, weapon)
+# ============================================================================
+# GEAR MODIFIERS
+# ============================================================================
+# character[stat] always holds the derived value (base + gear), so combat
+# reads stay plain dict lookups. The bonus of each equipped item is kept
+# apart in character['weapon_effect'] / ['armor_effect'] (the effect
+# string, which saves as-is) and is subtracted again on unequip, so stats
+# are right after any sequence of swaps. Level-ups add to the derived
+# value directly, which moves the base by the same amount.
 
-    return weapon
+# gear slot -> (equipped item field, effect field)
+GEAR_SLOTS = {
+    "weapon": ("equipped_weapon", "weapon_effect"),
+    "armor": ("equipped_armor", "armor_effect"),
+}
 
 
-def unequip_armor(character):
-    armor = character.get('equipped_armor')
-    if not armor:
+@functools.lru_cache(maxsize=256)
+def _gear_effects(effect_string):
+    return parse_item_effects(effect_string) if effect_string else ()
+
+
+def _equip(character, slot, item_id, item_data):
+    item_field, effect_field = GEAR_SLOTS[slot]
+    effects = get_item_effects(item_data)
+    for stat, val in effects:
+        _add_stat(character, stat, val)
+
+    character[item_field] = item_id
+    character[effect_field] = ",".join(f"{stat}:{val}" for stat, val in effects)
+    remove_item_from_inventory(character, item_id)
+    return effects
+
+
+def _unequip(character, slot):
+    item_field, effect_field = GEAR_SLOTS[slot]
+    item_id = character.get(item_field)
+    if not item_id:
         return None
 
-    character['equipped_armor'] = None
-    add_item_to_inventory(character, armor)
+    # May raise InventoryFullError; nothing has changed yet if it does
+    add_item_to_inventory(character, item_id)
+    character[item_field] = None
+
+    # Saves from before gear bonuses were tracked have no effect field
+    for stat, val in _gear_effects(character.pop(effect_field, "")):
+        _add_stat(character, stat, -val)
+    if "max_health" in character and character.get("health", 0) > character["max_health"]:
+        character["health"] = character["max_health"]
+
+    return item_id
+
+
+def get_gear_modifiers(character):
+    """stat -> total bonus from equipped gear."""
+    modifiers = {}
+    for item_field, effect_field in GEAR_SLOTS.values():
+        if character.get(item_field):
+            for stat, val in _gear_effects(character.get(effect_field, "")):
+                modifiers[stat] = modifiers.get(stat, 0) + val
+    return modifiers
 
-    return armor
+
+def get_base_stats(character, stats=("max_health", "strength", "magic")):
+    """Stats without gear bonuses; character[stat] itself includes them."""
+    modifiers = get_gear_modifiers(character)
+    return {stat: character.get(stat, 0) - modifiers.get(stat, 0) for stat in stats}
 
 # ============================================================================
 
@@ -160,8 +287,8 @@ def purchase_item(character, item_id, item_data):
     if character.get('gold', 0) < cost:
         raise InsufficientResourcesError(f"Not enough gold for {item_id}")
 
-    # Check space
-    if get_inventory_space_remaining(character) <= 0:
+    # Check space (a stacked item may fit in an existing stack)
+    if get_inventory_space_remaining(character) < slots_needed(character.get('inventory', []), item_id):
         raise InventoryFullError(f"Inventory full, cannot buy {item_id}")
 
     # Spend gold
@@ -184,14 +311,105 @@ def sell_item(character, item_id, item_data):
 
     return price
 
+# ============================================================================
+# BATCH SHOP TRANSACTIONS
+# ============================================================================
+
+def process_cart(character, item_data_dict, buy=(), sell=(), max_slots=MAX_INVENTORY_SIZE):
+    """
+    Buy and sell a whole cart as one transaction.
+
+    buy/sell are lists of item ids or {item_id: quantity} dicts. Prices
+    are the same as purchase_item()/sell_item(), and sale proceeds count
+    towards the purchases. The whole cart is checked first (known items,
+    items to sell held, gold, slots after the sales), so it is applied in
+    full or, with an exception, not at all. max_slots=None lifts the slot
+    limit, e.g. for vendor restocking.
+
+    Returns {'bought', 'sold', 'cost', 'proceeds', 'gold'}.
+    """
+    buy = _cart_counts(buy)
+    sell = _cart_counts(sell)
+    inventory = character.get('inventory', [])
+
+    for item_id in list(buy) + list(sell):
+        if item_id not in item_data_dict:
+            raise ItemNotFoundError(f"Unknown item: {item_id}")
+
+    if isinstance(inventory, StackedInventory):
+        held = inventory.count
+    else:
+        held = Counter(item_id for item_id in inventory if item_id in sell).__getitem__
+    for item_id, quantity in sell.items():
+        if held(item_id) < quantity:
+            raise ItemNotFoundError(f"Not enough {item_id} in inventory to sell {quantity}")
+
+    cost = sum(item_data_dict[item_id].get('cost', 0) * quantity for item_id, quantity in buy.items())
+    proceeds = sum(item_data_dict[item_id].get('cost', 0) // 2 * quantity
+                   for item_id, quantity in sell.items())
+    gold = character.get('gold', 0)
+    if gold + proceeds < cost:
+        raise InsufficientResourcesError(f"Cart costs {cost} gold, only {gold + proceeds} available")
+
+    if isinstance(inventory, StackedInventory):
+        after = inventory.copy()
+        for item_id, quantity in sell.items():
+            after.remove(item_id, quantity)
+        for item_id, quantity in buy.items():
+            after.add(item_id, quantity)
+        slots_after = after.slots_used
+    else:
+        slots_after = len(inventory) - sum(sell.values()) + sum(buy.values())
+    if max_slots is not None and slots_after > max_slots:
+        raise InventoryFullError(f"Cart needs {slots_after} slots, inventory holds {max_slots}")
+
+    # Everything checked: apply the whole cart
+    if isinstance(inventory, StackedInventory):
+        for item_id, quantity in sell.items():
+            inventory.remove(item_id, quantity)
+        for item_id, quantity in buy.items():
+            inventory.add(item_id, quantity)
+    else:
+        remaining = Counter(sell)
+        kept = []
+        for item_id in inventory:
+            if remaining[item_id]:
+                remaining[item_id] -= 1
+            else:
+                kept.append(item_id)
+        for item_id, quantity in buy.items():
+            kept.extend([item_id] * quantity)
+        inventory[:] = kept
+        character['inventory'] = inventory
+    character['gold'] = gold + proceeds - cost
+
+    return {
+        'bought': sum(buy.values()),
+        'sold': sum(sell.values()),
+        'cost': cost,
+        'proceeds': proceeds,
+        'gold': character['gold']
+    }
+
+
+def _cart_counts(cart):
+    counts = Counter(dict(cart)) if isinstance(cart, dict) else Counter(cart)
+    for item_id, quantity in counts.items():
+        if not isinstance(quantity, int) or quantity < 0:
+            raise ValueError(f"Invalid quantity for {item_id}: {quantity!r}")
+    return +counts     # drop zero quantities
+
 # ============================================================================
 
 def display_inventory(character, item_data_dict):
     inventory = character.get('inventory', [])
 
-    counted = {}
-    for item in inventory:
-        counted[item] = counted.get(item, 0) + 1
+    if isinstance(inventory, StackedInventory):
+        counted = dict(inventory.items())
+    else:
+        counted = {}
+        for item in inventory:
+            counted[item] = counted.get(item, 0) + 1
 
     print("=== Inventory ===")
     for item_id, qty in counted.items():
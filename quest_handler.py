@@ -9,6 +9,11 @@ AI Usage: [Document any AI assistance used]
 Handles quest management, dependencies, and completion.
 """
 
+import bisect
+import heapq
+from collections import deque
+
+import game_data
 from custom_exceptions import (
     QuestNotFoundError,
     QuestRequirementsNotMetError,
@@ -16,6 +21,7 @@ from custom_exceptions import (
     QuestNotActiveError,
     InsufficientLevelError
 )
+from records import QuestLog
 
 # ============================================================================
 
@@ -88,12 +94,21 @@ def get_completed_quests(character, quest_data_dict):
 
 # ============================================================================
 
+def _id_lookup(quest_ids):
+    """Something with O(1) `in` for a quest id list; QuestLogs already are."""
+    if isinstance(quest_ids, (QuestLog, set, frozenset)):
+        return quest_ids
+    return set(quest_ids)
+
 def get_available_quests(character, quest_data_dict):
+    completed = _id_lookup(character['completed_quests'])
+    active = _id_lookup(character['active_quests'])
+
     available = []
     for qid, quest in quest_data_dict.items():
 
         # Skip already completed or active quests
-        if qid in character['completed_quests'] or qid in character['active_quests']:
+        if qid in completed or qid in active:
             continue
 
         # Meets level requirement?
@@ -102,7 +117,7 @@ def get_available_quests(character, quest_data_dict):
 
         # Meets prerequisite?
         prereq = quest['prerequisite']
-        if prereq != "NONE" and prereq not in character['completed_quests']:
+        if prereq != "NONE" and prereq not in completed:
             continue
 
         available.append(quest)
@@ -144,12 +159,19 @@ def get_quest_prerequisite_chain(quest_id, quest_data_dict):
         raise QuestNotFoundError(f"Quest {quest_id} not found")
 
     chain = []
+    seen = set()
     current = quest_id
 
     while current != "NONE":
-        chain.insert(0, current)
+        if current in seen:
+            raise QuestRequirementsNotMetError(f"Circular prerequisite at {current}")
+        if current not in quest_data_dict:
+            raise QuestNotFoundError(f"Invalid prerequisite: {current}")
+        seen.add(current)
+        chain.append(current)
         current = quest_data_dict[current]['prerequisite']
 
+    chain.reverse()
     return chain
 
 # ============================================================================
@@ -210,8 +232,175 @@ def validate_quest_prerequisites(quest_data_dict):
         prereq = quest['prerequisite']
         if prereq != "NONE" and prereq not in quest_data_dict:
             raise QuestNotFoundError(f"Invalid prerequisite: {prereq}")
+
+    cycles = game_data.find_quest_graph_problems(quest_data_dict)['cycles']
+    if cycles:
+        raise QuestRequirementsNotMetError(
+            "Circular prerequisites: " + " -> ".join(cycles[0] + cycles[0][:1]))
     return True
 
+# ============================================================================
+# QUEST INDEX
+# ============================================================================
+# QuestIndex is built once per quest dict (rebuild it when the data is
+# reloaded). It precomputes the prerequisite graph so chains, level ranges
+# and availability do not scan every quest. Quests whose prerequisite is
+# missing, or that sit on a prerequisite cycle, can never be unlocked and
+# are left out of `order`.
+
+class QuestIndex:
+
+    def __init__(self, quest_data_dict):
+        self.quests = quest_data_dict
+        self.dependents = {qid: [] for qid in quest_data_dict}   # prereq -> quests it unlocks
+        self.roots = []
+
+        for qid, quest in quest_data_dict.items():
+            prereq = quest['prerequisite']
+            if prereq == "NONE":
+                self.roots.append(qid)
+            elif prereq in self.dependents:
+                self.dependents[prereq].append(qid)
+
+        # Every quest has at most one prerequisite, so a breadth-first walk
+        # from the roots is a topological order
+        self.order = []
+        queue = deque(self.roots)
+        while queue:
+            qid = queue.popleft()
+            self.order.append(qid)
+            queue.extend(self.dependents[qid])
+        self.position = {qid: i for i, qid in enumerate(self.order)}
+
+        by_level = sorted(quest_data_dict.values(), key=lambda q: q['required_level'])
+        self._levels = [q['required_level'] for q in by_level]
+        self._by_level = by_level
+        self._chains = {}
+
+    def get_prerequisite_chain(self, quest_id):
+        """Same result as get_quest_prerequisite_chain(), memoized."""
+        return list(self._chain(quest_id))
+
+    def _chain(self, quest_id):
+        if quest_id not in self.quests:
+            raise QuestNotFoundError(f"Quest {quest_id} not found")
+        if quest_id not in self.position:
+            raise QuestRequirementsNotMetError(
+                f"Quest {quest_id} has a broken prerequisite chain")
+
+        # Walk up to the nearest memoized ancestor (only asked-for chains
+        # are kept, so a long linear chain is not stored once per quest)
+        chain = self._chains.get(quest_id)
+        if chain is None:
+            missing = []
+            current = quest_id
+            while current != "NONE" and current not in self._chains:
+                missing.append(current)
+                current = self.quests[current]['prerequisite']
+            missing.reverse()
+            ancestors = self._chains[current] if current != "NONE" else ()
+            chain = self._chains[quest_id] = ancestors + tuple(missing)
+        return chain
+
+    def get_quests_by_level(self, min_level, max_level):
+        start = bisect.bisect_left(self._levels, min_level)
+        end = bisect.bisect_right(self._levels, max_level)
+        return self._by_level[start:end]
+
+    def get_available_quests(self, character):
+        """Available quests in topological order, checking only unlocked ones."""
+        completed = _id_lookup(character['completed_quests'])
+        active = _id_lookup(character['active_quests'])
+        level = character['level']
+
+        # dict keys, not a list: a QuestLog repeats ids completed more than once
+        candidates = dict.fromkeys(self.roots)
+        for qid in completed:
+            candidates.update(dict.fromkeys(self.dependents.get(qid, ())))
+
+        available = [
+            qid for qid in candidates
+            if qid not in completed and qid not in active
+            and self.quests[qid]['required_level'] <= level
+        ]
+        available.sort(key=self.sort_key)
+        return [self.quests[qid] for qid in available]
+
+    def sort_key(self, quest_id):
+        # Quests outside the order (broken chains) go last
+        return self.position.get(quest_id, len(self.position))
+
+    def track(self, character):
+        return QuestTracker(self, character)
+
+
+class QuestTracker:
+    """
+    Keeps one character's available quests up to date.
+
+    Accept, complete and abandon quests through the tracker so it sees
+    them; a level gained elsewhere is picked up on the next available().
+    Call rebuild() after changing the character's quest lists directly.
+    """
+
+    def __init__(self, index, character):
+        self.index = index
+        self.character = character
+        self.rebuild()
+
+    def rebuild(self):
+        self._completed = set(self.character['completed_quests'])
+        self._level = self.character['level']
+        self._ready = set()         # unlocked, level met, not completed
+        self._locked = []           # heap of (required_level, qid) waiting on level
+        for qid in self.index.roots:
+            self._unlock(qid)
+        for qid in self._completed:
+            for dependent in self.index.dependents.get(qid, ()):
+                self._unlock(dependent)
+
+    def _unlock(self, qid):
+        if qid in self._completed:
+            return
+        required = self.index.quests[qid]['required_level']
+        if required <= self._level:
+            self._ready.add(qid)
+        else:
+            heapq.heappush(self._locked, (required, qid))
+
+    def _catch_up_level(self):
+        level = self.character['level']
+        if level < self._level:
+            self.rebuild()
+            return
+        self._level = level
+        while self._locked and self._locked[0][0] <= level:
+            qid = heapq.heappop(self._locked)[1]
+            # May have been completed since it was pushed, before we saw the level
+            if qid not in self._completed:
+                self._ready.add(qid)
+
+    def available(self):
+        self._catch_up_level()
+        active = set(self.character['active_quests'])
+        ready = [qid for qid in self._ready if qid not in active]
+        ready.sort(key=self.index.sort_key)
+        return [self.index.quests[qid] for qid in ready]
+
+    def accept_quest(self, quest_id):
+        return accept_quest(self.character, quest_id, self.index.quests)
+
+    def abandon_quest(self, quest_id):
+        return abandon_quest(self.character, quest_id)
+
+    def complete_quest(self, quest_id):
+        rewards = complete_quest(self.character, quest_id, self.index.quests)
+        self._completed.add(quest_id)
+        self._ready.discard(quest_id)
+        for dependent in self.index.dependents[quest_id]:
+            self._unlock(dependent)
+        return rewards
+
 # ============================================================================
 
 if __name__ == "__main__":
@@ -0,0 +1,394 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Records Module
+
+Compact __slots__ record types for characters and enemies.
+
+QuestLog is a list of quest ids that also keeps a count per id, so
+`quest_id in log` is O(1) for characters with thousands of completed
+(repeatable) quests. StackedInventory stores an inventory as
+item_id -> quantity with per-item stack limits; it is saved as the same
+flat list of item ids.
+
+Records behave like the plain dicts returned by create_character() and
+create_enemy() (record["health"], .get(), "key" in record, .items(), ...)
+so every existing function and the save format keep working, but they
+store their known fields in slots instead of a per-instance dict.
+
+They buy memory, not speed: a Character is about a third the size of the
+dict, but record["key"] goes through MutableMapping and is 2-3x slower
+than a dict lookup, so code written against dicts (combat, leveling) runs
+slower on records. Use them for large numbers of characters held in
+memory, not in battle loops. Attribute reads (record.health;
+record.class_ for "class", which is a Python keyword) cost about the same
+as a dict lookup. benchmarks/bench_records.py measures all of this.
+"""
+
+from collections.abc import MutableMapping
+
+# ============================================================================
+# BASE RECORD
+# ============================================================================
+
+def _slot_name(field):
+    """Slot attribute used for a field ("class" is a keyword)."""
+    return field + "_" if field == "class" else field
+
+
+class SlotRecord(MutableMapping):
+    """Dict-compatible mapping whose known fields live in __slots__."""
+
+    __slots__ = ("_extra",)
+    FIELDS = ()
+    # field name -> slot attribute name
+    SLOTS = {}
+
+    def __init__(self, data=(), **kwargs):
+        self._extra = None
+        self.update(data, **kwargs)
+
+    def __getitem__(self, key):
+        slot = self.SLOTS.get(key)
+        if slot is not None:
+            try:
+                return getattr(self, slot)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        slot = self.SLOTS.get(key)
+        if slot is not None:
+            setattr(self, slot, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        slot = self.SLOTS.get(key)
+        if slot is not None:
+            try:
+                delattr(self, slot)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        slot = self.SLOTS.get(key)
+        if slot is not None:
+            return hasattr(self, slot)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self):
+        for field, slot in self.SLOTS.items():
+            if hasattr(self, slot):
+                yield field
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self):
+        count = sum(1 for slot in self.SLOTS.values() if hasattr(self, slot))
+        if self._extra is not None:
+            count += len(self._extra)
+        return count
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        self._extra = None
+        self.update(state)
+
+    def copy(self):
+        """Shallow copy, like dict.copy()."""
+        return type(self)(self)
+
+    def to_dict(self):
+        """Plain dict with the same keys and values."""
+        return dict(self.items())
+
+# ============================================================================
+# CHARACTER AND ENEMY
+# ============================================================================
+
+CHARACTER_FIELDS = (
+    "name", "class", "level", "health", "max_health",
+    "strength", "magic", "experience", "gold",
+    "inventory", "active_quests", "completed_quests",
+    "equipped_weapon", "equipped_armor", "weapon_effect", "armor_effect"
+)
+
+ENEMY_FIELDS = (
+    "name", "health", "max_health", "strength", "magic",
+    "xp_reward", "gold_reward"
+)
+
+
+class Character(SlotRecord):
+    """Slotted character, e.g. Character(create_character("Ana", "Mage"))."""
+
+    __slots__ = tuple(_slot_name(field) for field in CHARACTER_FIELDS)
+    FIELDS = CHARACTER_FIELDS
+    SLOTS = {field: _slot_name(field) for field in CHARACTER_FIELDS}
+
+
+class Enemy(SlotRecord):
+    """Slotted enemy, e.g. Enemy(create_enemy("orc"))."""
+
+    __slots__ = ENEMY_FIELDS
+    FIELDS = ENEMY_FIELDS
+    SLOTS = {field: field for field in ENEMY_FIELDS}
+
+# ============================================================================
+# QUEST LOG
+# ============================================================================
+
+class QuestLog(list):
+    """
+    List of quest ids with O(1) membership and count().
+
+    It is a real list (saves, ",".join(), json and isinstance checks see
+    the same thing), but every change also updates a per-id count, so `in`
+    no longer scans. Removing still shifts the list, which is cheap for the
+    short active_quests list; removing an id that is not there fails
+    without scanning.
+    """
+
+    __slots__ = ("_counts",)
+
+    def __init__(self, quest_ids=()):
+        super().__init__(quest_ids)
+        self._counts = {}
+        for quest_id in self:
+            self._counts[quest_id] = self._counts.get(quest_id, 0) + 1
+
+    def _added(self, quest_ids):
+        counts = self._counts
+        for quest_id in quest_ids:
+            counts[quest_id] = counts.get(quest_id, 0) + 1
+
+    def _removed(self, quest_ids):
+        counts = self._counts
+        for quest_id in quest_ids:
+            if counts[quest_id] == 1:
+                del counts[quest_id]
+            else:
+                counts[quest_id] -= 1
+
+    def __contains__(self, quest_id):
+        return quest_id in self._counts
+
+    def count(self, quest_id):
+        return self._counts.get(quest_id, 0)
+
+    def append(self, quest_id):
+        super().append(quest_id)
+        self._added((quest_id,))
+
+    def extend(self, quest_ids):
+        quest_ids = list(quest_ids)
+        super().extend(quest_ids)
+        self._added(quest_ids)
+
+    def __iadd__(self, quest_ids):
+        self.extend(quest_ids)
+        return self
+
+    def __imul__(self, times):
+        if times <= 0:
+            self.clear()
+        else:
+            extra = list(self) * (times - 1)
+            self.extend(extra)
+        return self
+
+    def insert(self, index, quest_id):
+        super().insert(index, quest_id)
+        self._added((quest_id,))
+
+    def remove(self, quest_id):
+        if quest_id not in self._counts:
+            raise ValueError(f"{quest_id!r} is not in quest log")
+        super().remove(quest_id)
+        self._removed((quest_id,))
+
+    def pop(self, index=-1):
+        quest_id = super().pop(index)
+        self._removed((quest_id,))
+        return quest_id
+
+    def clear(self):
+        super().clear()
+        self._counts.clear()
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            old = self[index]
+        else:
+            old = (self[index],)
+        super().__setitem__(index, value)
+        self._removed(old)
+        self._added(value if isinstance(index, slice) else (value,))
+
+    def __delitem__(self, index):
+        old = self[index] if isinstance(index, slice) else (self[index],)
+        super().__delitem__(index)
+        self._removed(old)
+
+    def copy(self):
+        return QuestLog(self)
+
+    def __reduce__(self):
+        return (QuestLog, (list(self),))
+
+    def __repr__(self):
+        return f"QuestLog({list.__repr__(self)})"
+
+
+QUEST_LOG_FIELDS = ("active_quests", "completed_quests")
+
+
+def use_quest_logs(character):
+    """Swap a character's quest lists for QuestLogs (in place); returns it."""
+    for field in QUEST_LOG_FIELDS:
+        value = character.get(field)
+        if isinstance(value, list) and not isinstance(value, QuestLog):
+            character[field] = QuestLog(value)
+    return character
+
+# ============================================================================
+# STACKED INVENTORY
+# ============================================================================
+
+class StackedInventory:
+    """
+    Inventory stored as item_id -> quantity, with slot accounting.
+
+    Each item stacks up to its limit (stack_limits[item_id], else
+    default_limit); slots_used counts the stacks, so with the default
+    limit of 1 a slot is one item, as with a plain list. Membership,
+    count(), add and remove are O(1).
+
+    It also answers the list calls inventory code makes on
+    character['inventory'] (in, count, append, remove, len, iteration)
+    and is written to saves as the flat list from to_list().
+    """
+
+    __slots__ = ("_counts", "stack_limits", "default_limit", "slots_used")
+
+    def __init__(self, item_ids=(), stack_limits=None, default_limit=1):
+        self._counts = {}
+        self.stack_limits = stack_limits if stack_limits is not None else {}
+        self.default_limit = default_limit
+        self.slots_used = 0
+        for item_id in item_ids:
+            self.add(item_id)
+
+    def stack_limit(self, item_id):
+        return self.stack_limits.get(item_id, self.default_limit)
+
+    def _slots(self, item_id, quantity):
+        limit = self.stack_limit(item_id)
+        return -(-quantity // limit)
+
+    def slots_needed(self, item_id, quantity=1):
+        """Extra slots that adding quantity of item_id would take."""
+        held = self._counts.get(item_id, 0)
+        return self._slots(item_id, held + quantity) - self._slots(item_id, held)
+
+    # ------------------------------------------------------------------------
+    # STACK API
+    # ------------------------------------------------------------------------
+
+    def add(self, item_id, quantity=1):
+        self.slots_used += self.slots_needed(item_id, quantity)
+        self._counts[item_id] = self._counts.get(item_id, 0) + quantity
+
+    def remove(self, item_id, quantity=1):
+        held = self._counts.get(item_id, 0)
+        if held < quantity:
+            raise ValueError(f"{item_id!r} x{quantity} is not in inventory")
+        self.slots_used -= self._slots(item_id, held) - self._slots(item_id, held - quantity)
+        if held == quantity:
+            del self._counts[item_id]
+        else:
+            self._counts[item_id] = held - quantity
+
+    def count(self, item_id):
+        return self._counts.get(item_id, 0)
+
+    def items(self):
+        """(item_id, quantity) pairs in first-added order."""
+        return self._counts.items()
+
+    def clear(self):
+        self._counts.clear()
+        self.slots_used = 0
+
+    # ------------------------------------------------------------------------
+    # LIST ADAPTERS
+    # ------------------------------------------------------------------------
+
+    def append(self, item_id):
+        self.add(item_id)
+
+    def __contains__(self, item_id):
+        return item_id in self._counts
+
+    def __len__(self):
+        """Number of items, like len() of the flat list."""
+        return sum(self._counts.values())
+
+    def __iter__(self):
+        for item_id, quantity in self._counts.items():
+            for _ in range(quantity):
+                yield item_id
+
+    def to_list(self):
+        """Flat list of item ids (the save format), stacks kept together."""
+        return list(self)
+
+    @classmethod
+    def from_list(cls, item_ids, stack_limits=None, default_limit=1):
+        return cls(item_ids, stack_limits, default_limit)
+
+    def copy(self):
+        inventory = StackedInventory(stack_limits=self.stack_limits,
+                                     default_limit=self.default_limit)
+        inventory._counts = dict(self._counts)
+        inventory.slots_used = self.slots_used
+        return inventory
+
+    def __eq__(self, other):
+        # Order does not matter for stacks, so compare quantities
+        if isinstance(other, StackedInventory):
+            return self._counts == other._counts
+        if isinstance(other, list):
+            return self._counts == StackedInventory(other)._counts
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return (StackedInventory, (self.to_list(), self.stack_limits, self.default_limit))
+
+    def __repr__(self):
+        return f"StackedInventory({self._counts!r})"
+
+
+def copy_character_state(character):
+    """Copy of a character whose lists (and inventories) are copied too."""
+    return {
+        key: value.copy() if isinstance(value, (list, StackedInventory)) else value
+        for key, value in character.items()
+    }
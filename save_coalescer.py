@@ -0,0 +1,97 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Save Coalescer Module
+
+Write-behind saving. SaveCoalescer.save_character() only records the
+latest state of a character; it is written to disk once `window` seconds
+have passed since the first unsaved change, so ten saves of the same
+character inside the window become one atomic disk write.
+
+Due saves are written whenever save_character() or flush_due() is
+called (e.g. once per game tick); call flush() before shutting down.
+"""
+
+import time
+
+import character_manager
+from records import copy_character_state
+
+# ============================================================================
+# SAVE COALESCER
+# ============================================================================
+
+class SaveCoalescer:
+
+    def __init__(self, window=1.0, save_directory="data/save_games",
+                 save_format="text", fsync=False, clock=time.monotonic):
+        self.window = window
+        self.save_directory = save_directory
+        self.save_format = save_format
+        self.fsync = fsync
+        self.clock = clock
+
+        self._pending = {}      # name -> [first queued time, latest state]
+        self.started = clock()
+        self.saves_requested = 0
+        self.disk_writes = 0
+        self.bytes_written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+
+    def save_character(self, character):
+        """Queue a save; writes anything whose window has passed."""
+        self.saves_requested += 1
+        state = copy_character_state(character)
+
+        pending = self._pending.get(character["name"])
+        if pending is None:
+            self._pending[character["name"]] = [self.clock(), state]
+        else:
+            pending[1] = state
+
+        self.flush_due()
+        return True
+
+    def flush_due(self):
+        """Write every character that has waited at least `window` seconds."""
+        now = self.clock()
+        due = [
+            name for name, (queued, state) in self._pending.items()
+            if now - queued >= self.window
+        ]
+        for name in due:
+            self._write(name)
+        return len(due)
+
+    def flush(self):
+        """Write every pending character now."""
+        names = list(self._pending)
+        for name in names:
+            self._write(name)
+        return len(names)
+
+    def pending_count(self):
+        return len(self._pending)
+
+    def _write(self, name):
+        queued, state = self._pending.pop(name)
+        self.bytes_written += character_manager.write_save(
+            state, self.save_directory, self.save_format, self.fsync)
+        self.disk_writes += 1
+
+    def get_stats(self):
+        """Counters plus saves/sec and writes/sec since the coalescer started."""
+        elapsed = max(self.clock() - self.started, 1e-9)
+        return {
+            "saves_requested": self.saves_requested,
+            "disk_writes": self.disk_writes,
+            "coalesced": self.saves_requested - self.disk_writes - len(self._pending),
+            "pending": len(self._pending),
+            "bytes_written": self.bytes_written,
+            "saves_per_sec": self.saves_requested / elapsed,
+            "writes_per_sec": self.disk_writes / elapsed
+        }
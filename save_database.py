@@ -0,0 +1,126 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Save Database Module
+
+Single-file SQLite save store with the same save / load / list / delete
+API as character_manager, for servers with far too many characters for
+one file each. Characters are stored as binary_save blobs keyed by name
+(the primary key doubles as the lookup index), the database runs in WAL
+mode, and save_characters() writes a whole batch in one transaction.
+"""
+
+import os
+import sqlite3
+
+import binary_save
+from character_manager import list_saved_characters, load_character, validate_character_data
+from custom_exceptions import CharacterNotFoundError
+from records import use_quest_logs
+
+DEFAULT_DATABASE = "data/save_games/saves.db"
+
+# ============================================================================
+# SAVE DATABASE
+# ============================================================================
+
+class SaveDatabase:
+
+    def __init__(self, path=DEFAULT_DATABASE):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS characters ("
+            " name TEXT PRIMARY KEY,"
+            " data BLOB NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self.connection.commit()
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # ------------------------------------------------------------------------
+    # SAVE / LOAD
+    # ------------------------------------------------------------------------
+
+    def save_character(self, character):
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO characters (name, data) VALUES (?, ?)",
+                (character["name"], binary_save.encode_character(character))
+            )
+        return True
+
+    def save_characters(self, characters):
+        """Save many characters in a single transaction; returns the count."""
+        rows = [
+            (character["name"], binary_save.encode_character(character))
+            for character in characters
+        ]
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO characters (name, data) VALUES (?, ?)", rows
+            )
+        return len(rows)
+
+    def load_character(self, character_name):
+        row = self.connection.execute(
+            "SELECT data FROM characters WHERE name = ?", (character_name,)
+        ).fetchone()
+        if row is None:
+            raise CharacterNotFoundError(f"No save found for {character_name}")
+
+        character = use_quest_logs(binary_save.decode_character(row[0]))
+        validate_character_data(character)
+        return character
+
+    # ------------------------------------------------------------------------
+    # LIST / DELETE
+    # ------------------------------------------------------------------------
+
+    def list_saved_characters(self):
+        return [
+            name for (name,) in
+            self.connection.execute("SELECT name FROM characters ORDER BY name")
+        ]
+
+    def delete_character(self, character_name):
+        with self.connection:
+            cursor = self.connection.execute(
+                "DELETE FROM characters WHERE name = ?", (character_name,)
+            )
+        if cursor.rowcount == 0:
+            raise CharacterNotFoundError(f"No save file for {character_name}")
+        return True
+
+    def count_characters(self):
+        return self.connection.execute("SELECT COUNT(*) FROM characters").fetchone()[0]
+
+    # ------------------------------------------------------------------------
+    # MIGRATION
+    # ------------------------------------------------------------------------
+
+    def import_save_directory(self, save_directory="data/save_games", batch_size=1000):
+        """Copy every per-file save in a directory into the database."""
+        imported = 0
+        batch = []
+        for name in list_saved_characters(save_directory):
+            batch.append(load_character(name, save_directory))
+            if len(batch) >= batch_size:
+                imported += self.save_characters(batch)
+                batch = []
+        if batch:
+            imported += self.save_characters(batch)
+        return imported
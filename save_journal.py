@@ -0,0 +1,187 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Save Journal Module
+
+Journaled saves: instead of rewriting the whole save on every call,
+save_character() appends only the fields that changed since the last
+save to <name>_journal.bin, and every `compact_every` entries the journal
+is folded into a fresh <name>_snapshot.bin. The snapshot alone is out of
+date while the journal has entries, so it has its own suffix that
+character_manager and bulk_loader never read as a save; always load
+journaled characters through SaveJournal.
+
+Journal entries are binary_save records (each has its own length and
+CRC32), so a crash mid-append leaves at most one torn record at the end.
+load_character() replays every complete record over the snapshot, stops
+at the first damaged one and cuts it off so later appends stay readable.
+Entries hold new field values, not increments, so replaying an entry
+twice is harmless.
+"""
+
+import os
+
+import binary_save
+import character_manager
+from custom_exceptions import (
+    CharacterNotFoundError,
+    InvalidSaveDataError,
+    SaveFileCorruptedError
+)
+from records import copy_character_state, use_quest_logs
+
+# Field listing keys removed since the previous save
+REMOVED_KEY = "__removed__"
+
+SNAPSHOT_SUFFIX = "_snapshot.bin"
+JOURNAL_SUFFIX = "_journal.bin"
+
+# ============================================================================
+# SAVE JOURNAL
+# ============================================================================
+
+class SaveJournal:
+
+    def __init__(self, save_directory="data/save_games", compact_every=100, fsync=False):
+        self.save_directory = save_directory
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self._known = {}        # name -> state as last written to disk
+        self._entries = {}      # name -> journal entries since the snapshot
+
+    def snapshot_path(self, character_name):
+        return os.path.join(self.save_directory, f"{character_name}{SNAPSHOT_SUFFIX}")
+
+    def journal_path(self, character_name):
+        return os.path.join(self.save_directory, f"{character_name}{JOURNAL_SUFFIX}")
+
+    # ------------------------------------------------------------------------
+    # SAVE
+    # ------------------------------------------------------------------------
+
+    def save_character(self, character):
+        """Append the changed fields; returns the number of fields written."""
+        name = character["name"]
+        previous = self._known.get(name)
+        if previous is None:
+            try:
+                previous = self.load_character(name)
+            except CharacterNotFoundError:
+                self._write_snapshot(character)
+                return len(character)
+
+        delta = {}
+        for key, value in character.items():
+            if key not in previous or previous[key] != value:
+                delta[key] = value
+        removed = [key for key in previous if key not in character]
+        if removed:
+            delta[REMOVED_KEY] = removed
+        if not delta:
+            return 0
+
+        with open(self.journal_path(name), "ab") as f:
+            f.write(binary_save.encode_character(delta))
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+        self._known[name] = copy_character_state(character)
+        self._entries[name] = self._entries.get(name, 0) + 1
+        if self._entries[name] >= self.compact_every:
+            self.compact(name)
+        return len(delta)
+
+    def compact(self, character_name):
+        """Fold the journal into a new snapshot and start an empty journal."""
+        state = self._known.get(character_name)
+        if state is None:
+            state = self.load_character(character_name)
+        self._write_snapshot(state)
+
+    def _write_snapshot(self, character):
+        name = character["name"]
+        os.makedirs(self.save_directory, exist_ok=True)
+        character_manager.atomic_write(self.snapshot_path(name),
+                                       binary_save.encode_character(character), self.fsync)
+
+        # A crash before this point just replays entries already in the snapshot
+        journal = self.journal_path(name)
+        if os.path.exists(journal):
+            os.remove(journal)
+
+        self._known[name] = copy_character_state(character)
+        self._entries[name] = 0
+
+    # ------------------------------------------------------------------------
+    # LOAD / DELETE
+    # ------------------------------------------------------------------------
+
+    def load_character(self, character_name):
+        """Load the snapshot and replay the journal on top of it."""
+        path = self.snapshot_path(character_name)
+        if not os.path.exists(path):
+            raise CharacterNotFoundError(f"No save found for {character_name}")
+        try:
+            with open(path, "rb") as f:
+                character = binary_save.decode_character(f.read())
+        except OSError:
+            raise SaveFileCorruptedError("Unable to read save file")
+
+        entries = 0
+        journal = self.journal_path(character_name)
+        if os.path.exists(journal):
+            with open(journal, "rb") as f:
+                data = f.read()
+            deltas, good_length = read_journal(data)
+            if good_length < len(data):
+                with open(journal, "r+b") as f:
+                    f.truncate(good_length)
+
+            for delta in deltas:
+                for key in delta.pop(REMOVED_KEY, []):
+                    character.pop(key, None)
+                character.update(delta)
+            entries = len(deltas)
+
+        # Snapshot and deltas both decode quest lists as plain lists
+        use_quest_logs(character)
+        character_manager.validate_character_data(character)
+        self._known[character_name] = copy_character_state(character)
+        self._entries[character_name] = entries
+        return character
+
+    def delete_character(self, character_name):
+        self._known.pop(character_name, None)
+        self._entries.pop(character_name, None)
+
+        deleted = False
+        for path in (self.journal_path(character_name), self.snapshot_path(character_name)):
+            if os.path.exists(path):
+                os.remove(path)
+                deleted = True
+        if not deleted:
+            raise CharacterNotFoundError(f"No save file for {character_name}")
+        return True
+
+
+def read_journal(data):
+    """
+    Split journal bytes into delta dicts.
+
+    Returns (deltas, good_length) where good_length is where the last
+    complete, checksum-valid record ends.
+    """
+    deltas = []
+    offset = 0
+    header_size = binary_save.HEADER.size
+    while offset + header_size <= len(data):
+        length = binary_save.HEADER.unpack_from(data, offset)[2]
+        end = offset + header_size + length
+        if end > len(data):
+            break
+        try:
+            deltas.append(binary_save.decode_character(data[offset:end]))
+        except (SaveFileCorruptedError, InvalidSaveDataError):
+            break
+        offset = end
+    return deltas, offset
@@ -0,0 +1,82 @@
+"""
+Test Async Saves
+Tests the asyncio save/load service
+"""
+
+import pytest
+import sys
+import os
+import asyncio
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+from async_saves import AsyncSaveService
+from custom_exceptions import CharacterNotFoundError
+
+def test_async_save_load_list_delete(tmp_path):
+    """Test the async versions of the save API"""
+    async def scenario():
+        async with AsyncSaveService(str(tmp_path)) as service:
+            char = character_manager.create_character("AsyncTest", "Mage")
+            assert await service.save_character(char) == True
+            assert await service.load_character("AsyncTest") == char
+            assert await service.list_saved_characters() == ["AsyncTest"]
+            assert await service.delete_character("AsyncTest") == True
+            with pytest.raises(CharacterNotFoundError):
+                await service.load_character("AsyncTest")
+
+    asyncio.run(scenario())
+
+def test_load_many(tmp_path):
+    """Test concurrent bulk loading with a missing character"""
+    for i in range(6):
+        character_manager.save_character(
+            character_manager.create_character(f"Many{i}", "Rogue"), str(tmp_path))
+
+    async def scenario():
+        async with AsyncSaveService(str(tmp_path), max_workers=3) as service:
+            names = [f"Many{i}" for i in range(6)] + ["Missing"]
+            return await service.load_many(names, return_exceptions=True)
+
+    loaded = asyncio.run(scenario())
+    assert [loaded[f"Many{i}"]['name'] for i in range(6)] == [f"Many{i}" for i in range(6)]
+    assert isinstance(loaded["Missing"], CharacterNotFoundError)
+
+def test_saves_of_same_character_do_not_overlap(tmp_path, monkeypatch):
+    """Test that the per-character lock serialises writes"""
+    active = {"now": 0, "max": 0}
+    guard = threading.Lock()
+    real_write = character_manager.write_save
+
+    def slow_write(*args):
+        with guard:
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        time.sleep(0.01)
+        try:
+            return real_write(*args)
+        finally:
+            with guard:
+                active["now"] -= 1
+
+    monkeypatch.setattr(character_manager, "write_save", slow_write)
+
+    async def scenario():
+        async with AsyncSaveService(str(tmp_path), max_workers=8) as service:
+            char = character_manager.create_character("LockTest", "Warrior")
+            saves = []
+            for gold in range(8):
+                char['gold'] = gold
+                saves.append(service.save_character(char))
+            await asyncio.gather(*saves)
+            assert service._locks == {}
+
+    asyncio.run(scenario())
+    assert active["max"] == 1
+    assert character_manager.load_character("LockTest", str(tmp_path))['gold'] == 7
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,196 @@
+"""
+Test Battle Simulator
+Tests headless battles and batch simulation results
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import battle_simulator
+import combat_system
+from custom_exceptions import CharacterDeadError
+
+# ============================================================================
+# HEADLESS BATTLE TESTS
+# ============================================================================
+
+def test_headless_battle_no_console_io(capsys, monkeypatch):
+    """Test that a headless battle never prints or asks for input"""
+    def fail_input(prompt=""):
+        raise AssertionError("input() should not be called")
+    monkeypatch.setattr("builtins.input", fail_input)
+
+    char = battle_simulator.create_character_at_level("Warrior", 1)
+    enemy = combat_system.create_enemy("goblin")
+    outcome = battle_simulator.HeadlessBattle(char, enemy).run()
+
+    assert outcome["winner"] == "player"
+    assert capsys.readouterr().out == ""
+
+def test_headless_battle_always_attack_outcome():
+    """Test that always-attack follows SimpleBattle damage rules"""
+    char = battle_simulator.create_character_at_level("Warrior", 1)
+    enemy = combat_system.create_enemy("goblin")
+    outcome = battle_simulator.HeadlessBattle(char, enemy).run()
+
+    # Warrior deals 15 - 8 // 4 = 13 per hit, goblin has 50 HP -> 4 turns.
+    # Goblin deals 8 - 15 // 4 = 5 per hit for the 3 turns it survives.
+    assert outcome == {"winner": "player", "turns": 4, "hp_remaining": 105}
+
+def test_headless_battle_dead_character():
+    """Test that a dead character cannot start a headless battle"""
+    char = battle_simulator.create_character_at_level("Mage", 1)
+    char['health'] = 0
+    battle = battle_simulator.HeadlessBattle(char, combat_system.create_enemy("orc"))
+
+    with pytest.raises(CharacterDeadError):
+        battle.run()
+
+# ============================================================================
+# BATCH SIMULATION TESTS
+# ============================================================================
+
+def test_simulate_battles_aggregates():
+    """Test that batch results add up"""
+    results = battle_simulator.simulate_battles("Mage", "orc", "ability_first", trials=50)
+
+    assert results["battles"] == 50
+    assert results["wins"] + results["losses"] + results["escapes"] + results["timeouts"] == 50
+    assert sum(results["turns"].values()) == 50
+    assert sum(results["hp_remaining"].values()) == results["wins"]
+    assert 0.0 <= results["win_rate"] <= 1.0
+
+def test_simulate_battles_seeded_random_policy():
+    """Test that the random policy is reproducible with a seed"""
+    first = battle_simulator.simulate_battles("Warrior", "orc", "random", trials=200, seed=7)
+    second = battle_simulator.simulate_battles("Warrior", "orc", "random", trials=200, seed=7)
+
+    assert first == second
+
+def test_shard_rng_depends_on_matchup():
+    """Test that each matchup and shard gets its own RNG stream"""
+    first = battle_simulator.shard_rng(7, ("Warrior", 1, "orc"), 0).random()
+
+    assert first == battle_simulator.shard_rng(7, ("Warrior", 1, "orc"), 0).random()
+    assert first != battle_simulator.shard_rng(7, ("Rogue", 1, "orc"), 0).random()
+    assert first != battle_simulator.shard_rng(7, ("Warrior", 1, "orc"), 1).random()
+    assert first != battle_simulator.shard_rng(8, ("Warrior", 1, "orc"), 0).random()
+
+def test_simulate_battles_string_seed():
+    """Test that a string seed is accepted and reproducible"""
+    first = battle_simulator.simulate_battles("Rogue", "orc", "random", trials=50, seed="nightly")
+    second = battle_simulator.simulate_battles("Rogue", "orc", "random", trials=50, seed="nightly")
+
+    assert first == second
+
+def test_unknown_policy():
+    """Test that an unknown policy name is rejected"""
+    with pytest.raises(ValueError):
+        battle_simulator.simulate_battles("Warrior", "goblin", "dance", trials=1)
+
+# ============================================================================
+# FAST PATH TESTS
+# ============================================================================
+
+@pytest.mark.parametrize("character_class", battle_simulator.CHARACTER_CLASSES)
+def test_closed_form_matches_scalar_engine(character_class):
+    """Test that resolve_always_attack matches a real battle at every level"""
+    for level in range(1, 51):
+        char = battle_simulator.create_character_at_level(character_class, level)
+        for enemy_type in battle_simulator.ENEMY_TYPES:
+            enemy = combat_system.create_enemy(enemy_type)
+            expected = battle_simulator.HeadlessBattle(dict(char), dict(enemy)).run()
+            assert battle_simulator.resolve_always_attack(char, enemy) == expected
+
+def test_closed_form_timeout():
+    """Test that the closed form honours max_turns"""
+    char = battle_simulator.create_character_at_level("Cleric", 1)
+    enemy = combat_system.create_enemy("dragon")
+    expected = battle_simulator.HeadlessBattle(dict(char), dict(enemy), max_turns=2).run()
+
+    assert expected["winner"] == "timeout"
+    assert battle_simulator.resolve_always_attack(char, enemy, max_turns=2) == expected
+
+@pytest.mark.parametrize("character_class", battle_simulator.CHARACTER_CLASSES)
+def test_outcome_distribution_matches_played_battles(character_class):
+    """Test that the exact distribution agrees with battles played one by one"""
+    import random
+    char = battle_simulator.create_character_at_level(character_class, 3)
+    enemy = combat_system.create_enemy("orc")
+    distribution = battle_simulator.outcome_distribution(char, enemy, "random")
+
+    assert sum(distribution.values()) == pytest.approx(1.0)
+
+    rng = random.Random(1)
+    wins = 0
+    for _ in range(2000):
+        outcome = battle_simulator.HeadlessBattle(dict(char), dict(enemy),
+                                                  battle_simulator.random_policy, rng).run()
+        assert (outcome["winner"], outcome["turns"], outcome["hp_remaining"]) in distribution
+        wins += outcome["winner"] == "player"
+
+    expected = sum(p for (winner, _, _), p in distribution.items() if winner == "player")
+    assert wins / 2000 == pytest.approx(expected, abs=0.05)
+
+def test_outcome_distribution_deterministic_policy():
+    """Test that a deterministic battle has a single certain outcome"""
+    char = battle_simulator.create_character_at_level("Warrior", 1)
+    enemy = combat_system.create_enemy("goblin")
+    distribution = battle_simulator.outcome_distribution(char, enemy)
+
+    assert distribution == {("player", 4, 105): 1.0}
+
+def test_custom_policy_plays_every_battle():
+    """Test that a custom policy is still called for every battle"""
+    calls = []
+    def counting_policy(battle):
+        calls.append(battle.turn)
+        return battle_simulator.ACTION_ATTACK
+
+    results = battle_simulator.simulate_battles("Warrior", "goblin", counting_policy,
+                                                trials=10, seed=1)
+
+    assert results["wins"] == 10
+    assert len(calls) == 40
+
+def test_sweep_balance_covers_every_matchup():
+    """Test that the sweep returns one result per class x level x enemy"""
+    sweep = battle_simulator.sweep_balance("ability_first", trials=20, levels=range(1, 6), seed=3)
+
+    assert len(sweep) == 4 * 5 * 3
+    result = sweep[("Mage", 3, "orc")]
+    assert result["battles"] == 20
+    assert result == battle_simulator.simulate_battles("Mage", "orc", "ability_first",
+                                                       trials=20, level=3, seed=3)
+
+# ============================================================================
+# MULTI-PROCESS RUNNER TESTS
+# ============================================================================
+
+def test_parallel_results_independent_of_worker_count():
+    """Test that merged results only depend on the seed"""
+    matchups = [("Rogue", 1, "orc"), ("Warrior", 2, "goblin")]
+    kwargs = {"policy": "random", "trials": 2500, "seed": 11}
+
+    serial = battle_simulator.run_parallel_sweep(matchups, workers=1, **kwargs)
+    parallel = battle_simulator.run_parallel_sweep(matchups, workers=3, **kwargs)
+
+    assert serial == parallel
+    assert serial[("Rogue", 1, "orc")] == battle_simulator.simulate_battles(
+        "Rogue", "orc", "random", trials=2500, level=1, seed=11)
+
+def test_seeded_rogue_crits_do_not_use_global_random():
+    """Test that rogue critical strikes draw from the battle's RNG"""
+    import random
+    random.seed(0)
+    first = battle_simulator.simulate_battles("Rogue", "dragon", "ability_first", trials=100, seed=5)
+    random.seed(99)
+    second = battle_simulator.simulate_battles("Rogue", "dragon", "ability_first", trials=100, seed=5)
+
+    assert first == second
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,98 @@
+"""
+Test Bulk Loader
+Tests loading a whole save directory with an error report
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bulk_loader
+import character_manager
+
+def make_save_directory(path):
+    for i in range(6):
+        char = character_manager.create_character(f"Hero{i}", "Warrior")
+        character_manager.save_character(char, str(path), "binary" if i % 2 else "text")
+
+    # Text save with a bad number, binary save with a broken checksum
+    (path / "BadNumber_save.txt").write_text("NAME: BadNumber\nLEVEL: lots\n")
+    data = bytearray((path / "Hero1_save.bin").read_bytes())
+    data[-1] ^= 0xFF
+    (path / "Corrupt_save.bin").write_bytes(bytes(data))
+    (path / "notes.txt").write_text("not a save")
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_load_all_saves_reports_errors(tmp_path, workers):
+    """Test that bad saves are reported without stopping the load"""
+    make_save_directory(tmp_path)
+    report = bulk_loader.load_all_saves(str(tmp_path), workers=workers, batch_size=3)
+
+    assert sorted(report['characters']) == [f"Hero{i}" for i in range(6)]
+    assert report['characters']['Hero3'] == character_manager.load_character("Hero3", str(tmp_path))
+    assert report['loaded'] == 6
+    assert report['failed'] == 2
+
+    errors = {error['name']: error['error'] for error in report['errors']}
+    assert errors == {
+        "BadNumber": "InvalidSaveDataError",
+        "Corrupt": "SaveFileCorruptedError"
+    }
+
+def test_mixed_formats_scan_newest(tmp_path):
+    """Test that a character with both save formats is loaded once, from the newest file"""
+    char = character_manager.create_character("Both", "Mage")
+    character_manager.save_character(char, str(tmp_path), "binary")
+    binary_path = tmp_path / "Both_save.bin"
+    binary_data = binary_path.read_bytes()
+    char['gold'] = 1
+    character_manager.save_character(char, str(tmp_path), "text")
+    binary_path.write_bytes(binary_data)
+
+    os.utime(binary_path, ns=(1_000_000_000, 1_000_000_000))
+    files = list(bulk_loader.scan_save_files(str(tmp_path)))
+    assert files == [("Both", str(tmp_path / "Both_save.txt"), "text")]
+    assert bulk_loader.load_all_saves(str(tmp_path), workers=1)['characters']['Both']['gold'] == 1
+
+    os.utime(tmp_path / "Both_save.txt", ns=(1_000_000_000, 1_000_000_000))
+    files = list(bulk_loader.scan_save_files(str(tmp_path)))
+    assert files == [("Both", str(binary_path), "binary")]
+
+def test_scan_streams_saves(tmp_path, monkeypatch):
+    """Test that the first save is yielded before the directory scan finishes"""
+    for i in range(5):
+        character_manager.save_character(
+            character_manager.create_character(f"Hero{i}", "Warrior"), str(tmp_path))
+
+    scanned = []
+    real_scandir = os.scandir
+
+    class CountingScandir:
+        def __init__(self, path):
+            self.entries = real_scandir(path)
+        def __enter__(self):
+            return self
+        def __exit__(self, *exc):
+            self.entries.close()
+        def __iter__(self):
+            for entry in self.entries:
+                scanned.append(entry.name)
+                yield entry
+
+    monkeypatch.setattr(bulk_loader.os, "scandir", CountingScandir)
+    files = bulk_loader.scan_save_files(str(tmp_path))
+    next(files)
+    assert len(scanned) == 1
+
+    assert len(list(files)) == 4
+    assert len(scanned) == 5
+
+def test_missing_directory():
+    """Test that a missing directory loads nothing"""
+    report = bulk_loader.load_all_saves("no_such_save_directory", workers=1)
+    assert report['loaded'] == 0 and report['failed'] == 0
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
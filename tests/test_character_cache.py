@@ -0,0 +1,85 @@
+"""
+Test Character Cache
+Tests LRU/TTL eviction, write-through and invalidation
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+from character_cache import CharacterCache
+from custom_exceptions import CharacterNotFoundError
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+def save_heroes(path, count):
+    for i in range(count):
+        character_manager.save_character(
+            character_manager.create_character(f"Hero{i}", "Warrior"), str(path))
+
+def test_cache_hits_and_copies(tmp_path):
+    """Test that repeat loads hit the cache and return copies"""
+    save_heroes(tmp_path, 1)
+    cache = CharacterCache(save_directory=str(tmp_path))
+
+    first = cache.load_character("Hero0")
+    first['inventory'].append("changed")
+    second = cache.load_character("Hero0")
+
+    assert second['inventory'] == []
+    assert cache.get_stats()['hits'] == 1
+    assert cache.get_stats()['misses'] == 1
+
+def test_cache_lru_eviction(tmp_path):
+    """Test that the least recently used character is evicted"""
+    save_heroes(tmp_path, 3)
+    cache = CharacterCache(max_size=2, save_directory=str(tmp_path))
+
+    cache.load_character("Hero0")
+    cache.load_character("Hero1")
+    cache.load_character("Hero0")
+    cache.load_character("Hero2")
+
+    assert "Hero1" not in cache
+    assert "Hero0" in cache and "Hero2" in cache
+    assert cache.get_stats()['evictions'] == 1
+
+def test_cache_ttl_expiry(tmp_path):
+    """Test that old entries are reloaded from disk"""
+    save_heroes(tmp_path, 1)
+    clock = FakeClock()
+    cache = CharacterCache(ttl=10, save_directory=str(tmp_path), clock=clock)
+
+    cache.load_character("Hero0")
+    clock.now = 10
+    cache.load_character("Hero0")
+
+    stats = cache.get_stats()
+    assert stats['expirations'] == 1
+    assert stats['misses'] == 2
+
+def test_cache_write_through_and_delete(tmp_path):
+    """Test that saves update disk and cache, and deletes invalidate"""
+    cache = CharacterCache(save_directory=str(tmp_path))
+    char = character_manager.create_character("WriteThrough", "Mage")
+    cache.save_character(char)
+    char['gold'] = 0
+
+    assert cache.load_character("WriteThrough")['gold'] == 100
+    assert character_manager.load_character("WriteThrough", str(tmp_path))['gold'] == 100
+    assert cache.get_stats()['misses'] == 0
+
+    cache.delete_character("WriteThrough")
+    assert "WriteThrough" not in cache
+    with pytest.raises(CharacterNotFoundError):
+        cache.load_character("WriteThrough")
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
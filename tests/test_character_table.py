@@ -0,0 +1,100 @@
+"""
+Test Character Table
+Tests that bulk column operations match the single-character functions
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+from character_table import CharacterTable
+
+CLASSES = ["Warrior", "Mage", "Rogue", "Cleric"]
+
+def make_population(size=40):
+    chars = []
+    for i in range(size):
+        char = character_manager.create_character(f"Pop{i}", CLASSES[i % 4])
+        character_manager.gain_experience(char, i * 37)
+        if i % 5 == 0:
+            char['health'] = 0
+        elif i % 3 == 0:
+            char['health'] = char['max_health'] // 3
+        chars.append(char)
+    return chars
+
+# ============================================================================
+# TABLE STRUCTURE TESTS
+# ============================================================================
+
+def test_table_round_trip():
+    """Test that rows come back as the same stats"""
+    chars = make_population()
+    table = CharacterTable.from_characters(chars)
+
+    assert len(table) == len(chars)
+    assert len(table.class_names) == 4
+    for row, char in enumerate(chars):
+        data = table.get_row(row)
+        for key in data:
+            assert data[key] == char[key]
+
+def test_rows_of_class():
+    """Test the interned class column"""
+    table = CharacterTable.from_characters(make_population(8))
+
+    assert table.rows_of_class("Mage") == [1, 5]
+    assert table.rows_of_class("Paladin") == []
+
+# ============================================================================
+# BULK OPERATION TESTS
+# ============================================================================
+
+def test_bulk_gain_experience_matches_single():
+    """Test that bulk XP grants level exactly like gain_experience"""
+    chars = make_population()
+    table = CharacterTable.from_characters(chars)
+
+    granted = table.gain_experience(2500)
+
+    alive = 0
+    for row, char in enumerate(chars):
+        if not character_manager.is_character_dead(char):
+            character_manager.gain_experience(char, 2500)
+            alive += 1
+        assert table.update_character(row, dict(char)) == char
+    assert granted == alive
+
+def test_bulk_add_gold_is_all_or_nothing():
+    """Test that negative bulk gold changes nothing on failure"""
+    chars = make_population(4)
+    chars[2]['gold'] = 10
+    table = CharacterTable.from_characters(chars)
+
+    with pytest.raises(ValueError):
+        table.add_gold(-50)
+    assert list(table.columns["gold"]) == [100, 100, 10, 100]
+
+    table.add_gold(-10)
+    table.add_gold(500, rows=[0, 1])
+    assert list(table.columns["gold"]) == [590, 590, 0, 90]
+
+def test_bulk_heal_and_revive():
+    """Test heal and revive against the single-character functions"""
+    chars = make_population()
+    table = CharacterTable.from_characters(chars)
+
+    revived = table.revive_character()
+    healed = table.heal_character(15)
+
+    expected_revived = sum(character_manager.revive_character(c) for c in chars)
+    expected_healed = sum(character_manager.heal_character(c, 15) for c in chars)
+    assert revived == expected_revived
+    assert healed == expected_healed
+    assert list(table.columns["health"]) == [c['health'] for c in chars]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
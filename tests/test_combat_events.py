@@ -0,0 +1,97 @@
+"""
+Test Combat Events
+Tests the combat event stream and its sinks
+"""
+
+import pytest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+from battle_simulator import HeadlessBattle, ability_first_policy
+from combat_events import (
+    CombatEvent,
+    FanoutSink,
+    JsonlSink,
+    NullSink,
+    RingBufferSink,
+    read_jsonl_events
+)
+from combat_system import SimpleBattle, create_enemy
+
+def run_headless(sink, character_class="Warrior", seed=1):
+    battle = HeadlessBattle(character_manager.create_character("Hero", character_class),
+                            create_enemy("orc"), ability_first_policy,
+                            rng=random.Random(seed), sink=sink)
+    return battle.run()
+
+def test_events_follow_the_battle():
+    """Test that events record turns, damage and HP after each action"""
+    sink = RingBufferSink()
+    result = run_headless(sink)
+    events = sink.events
+
+    assert events[0].actor == "Hero" and events[0].action == "ability"
+    assert events[1].actor == "Orc" and events[1].action == "enemy_attack"
+    assert all(isinstance(event, CombatEvent) for event in events)
+    assert events[-1].turn == result["turns"]
+    assert events[-1].hp_after == 0                  # the loser's last hit
+    assert sum(e.damage for e in events if e.target == "Orc") == 80
+
+def test_heal_is_self_targeted():
+    """Test that a cleric heal shows as negative damage to the caster"""
+    sink = RingBufferSink()
+    battle = SimpleBattle(character_manager.create_character("Priest", "Cleric"),
+                          create_enemy("goblin"), sink=sink)
+    battle.character["health"] = 50
+    battle.perform_action("2")
+
+    event = sink.events[0]
+    assert (event.target, event.damage, event.hp_after) == ("Priest", -30, 80)
+
+    # At full HP the heal still targets the caster, it just restores nothing
+    battle.character["health"] = battle.character["max_health"]
+    battle.perform_action("2")
+    event = sink.events[1]
+    assert (event.target, event.damage, event.hp_after) == ("Priest", 0, 100)
+
+def test_events_report_actual_target():
+    """Test overkill, escape and invalid choices in the event stream"""
+    sink = RingBufferSink()
+    battle = SimpleBattle(character_manager.create_character("Hero", "Warrior"),
+                          create_enemy("goblin"), rng=random.Random(1), sink=sink)
+    battle.enemy["health"] = 3
+    battle.perform_action("2")          # Power Strike for 30, only 3 HP left
+    battle.perform_action("9")
+    battle.perform_action("3")
+
+    strike, invalid, escape = sink.events
+    assert (strike.target, strike.damage, strike.hp_after) == ("Goblin", 3, 0)
+    assert "30 damage" in strike.message
+    assert (invalid.action, invalid.target, invalid.hp_after) == ("invalid", None, None)
+    assert (escape.action, escape.target, escape.damage) == ("escape", None, 0)
+
+def test_sinks_see_the_same_stream(tmp_path):
+    """Test that JSONL (batched) and ring buffer sinks record the same events"""
+    ring = RingBufferSink(capacity=3)
+    path = tmp_path / "combat.jsonl"
+    with JsonlSink(str(path), batch_size=4) as jsonl:
+        sink = FanoutSink(ring, jsonl, NullSink())
+        run_headless(sink, "Mage")
+        written = jsonl.events_written + len(jsonl._pending)
+
+    events = read_jsonl_events(str(path))
+    assert len(events) == written
+    assert events[-3:] == ring.events
+
+def test_null_sink_builds_no_events(monkeypatch):
+    """Test that the simulation path never constructs events"""
+    import combat_system
+    monkeypatch.setattr(combat_system, "CombatEvent", None)   # would fail if called
+    assert run_headless(NullSink())["winner"] in ("player", "enemy")
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
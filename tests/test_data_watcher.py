@@ -0,0 +1,89 @@
+"""
+Test Data Watcher
+Tests polling hot reload, incremental reparsing and failed reloads
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_watcher import GameDataWatcher, split_blocks
+from custom_exceptions import InvalidDataFormatError
+
+QUEST = (
+    "QUEST_ID: {id}\n"
+    "TITLE: Quest {id}\n"
+    "DESCRIPTION: Do the thing\n"
+    "REWARD_XP: {xp}\n"
+    "REWARD_GOLD: 10\n"
+    "REQUIRED_LEVEL: 1\n"
+    "PREREQUISITE: NONE\n"
+)
+
+ITEM = (
+    "ITEM_ID: potion\n"
+    "NAME: Potion\n"
+    "TYPE: consumable\n"
+    "EFFECT: health:20\n"
+    "COST: 25\n"
+    "DESCRIPTION: Heals\n"
+)
+
+def write_quests(path, xp_values, mtime):
+    path.write_text("\n".join(QUEST.format(id=f"q{i}", xp=xp) for i, xp in enumerate(xp_values)))
+    os.utime(path, ns=(mtime, mtime))
+
+@pytest.fixture
+def files(tmp_path):
+    quests = tmp_path / "quests.txt"
+    items = tmp_path / "items.txt"
+    write_quests(quests, [10, 20, 30], 1)
+    items.write_text(ITEM)
+    return quests, items
+
+def test_split_blocks_line_numbers():
+    """Test that blocks are split on blank lines with their first line"""
+    blocks = list(split_blocks("A: 1\nB: 2\n\n\n  \nC: 3\n"))
+    assert blocks == [(1, "A: 1\nB: 2"), (6, "C: 3")]
+
+def test_poll_reparses_only_changed_blocks(files):
+    """Test that a reload swaps in new data, reparsing one block"""
+    quest_path, item_path = files
+    watcher = GameDataWatcher(str(quest_path), str(item_path))
+    old_quests = watcher.quests
+    assert watcher.poll() is False
+
+    write_quests(quest_path, [10, 25, 30], 2)
+    assert watcher.poll() is True
+
+    assert watcher.quests['q1']['reward_xp'] == 25
+    assert old_quests['q1']['reward_xp'] == 20       # in-flight readers unaffected
+    assert watcher.quests['q0'] is old_quests['q0']  # unchanged block reused
+    assert watcher.get_stats()['blocks_reparsed'] == 3 + 1 + 1
+
+def test_bad_reload_keeps_previous_data(files):
+    """Test that an invalid edit is reported and not swapped in"""
+    quest_path, item_path = files
+    watcher = GameDataWatcher(str(quest_path), str(item_path))
+    quests, items = watcher.snapshot()
+
+    item_path.write_text(ITEM.replace("consumable", "spoon"))
+    os.utime(item_path, ns=(5, 5))
+    write_quests(quest_path, [1, 2, 3], 5)
+
+    assert watcher.poll() is False
+    assert watcher.snapshot() == (quests, items)
+    assert isinstance(watcher.last_error, InvalidDataFormatError)
+    assert "line 1" in str(watcher.last_error)
+
+    # Fixing the item file brings in both changes
+    item_path.write_text(ITEM)
+    os.utime(item_path, ns=(6, 6))
+    assert watcher.poll() is True
+    assert watcher.quests['q0']['reward_xp'] == 1
+    assert watcher.last_error is None
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,153 @@
+"""
+Test Game Data Loading
+Tests that the memory-mapped loaders match load_quests/load_items
+"""
+
+import io
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+from custom_exceptions import InvalidDataFormatError, MissingDataFileError
+
+ITEMS = (
+    "ITEM_ID: potion\n"
+    "NAME: Potion\n"
+    "TYPE: consumable\n"
+    "EFFECT: health:20\n"
+    "COST: 25\n"
+    "DESCRIPTION: Heals 20 HP\n"
+    "\n\n"
+    "NAME: Sword\n"
+    "ITEM_ID: sword\n"
+    "TYPE: weapon\n"
+    "EFFECT: strength:5\n"
+    "COST: 100\n"
+    "DESCRIPTION: Listed out of order\n"
+)
+
+def test_mmap_loaders_match_bundled_data():
+    """Test that the mmap loaders agree with the originals on data/"""
+    game_data.create_default_data_files()
+    assert game_data.load_quests_mmap() == game_data.load_quests()
+    assert game_data.load_items_mmap() == game_data.load_items()
+
+def test_mmap_loader_handles_any_field_order(tmp_path):
+    """Test that blocks outside the standard layout still parse"""
+    path = tmp_path / "items.txt"
+    path.write_text(ITEMS)
+
+    items = game_data.load_items_mmap(str(path))
+    assert items == game_data.load_items(str(path))
+    assert items['sword']['cost'] == 100
+
+    # Windows line endings, on both the fast path and the fallback
+    crlf_path = tmp_path / "items_crlf.txt"
+    crlf_path.write_bytes(ITEMS.replace("\n", "\r\n").encode("utf-8"))
+    assert game_data.load_items_mmap(str(crlf_path)) == items
+    assert game_data.load_items_cached(str(crlf_path)) == items
+    assert items['sword']['description'] == "Listed out of order"
+
+def test_mmap_loader_small_chunks(tmp_path, monkeypatch):
+    """Test that chunk boundaries do not split blocks"""
+    path = tmp_path / "items.txt"
+    path.write_text(ITEMS)
+    monkeypatch.setattr(game_data, "MMAP_CHUNK_SIZE", 8)
+
+    assert game_data.load_items_mmap(str(path)) == game_data.load_items(str(path))
+
+def test_mmap_loader_reports_line_number(tmp_path):
+    """Test that a bad number names the block's line"""
+    path = tmp_path / "items.txt"
+    path.write_text(ITEMS.replace("COST: 100", "COST: lots"))
+
+    with pytest.raises(InvalidDataFormatError, match="line 9"):
+        game_data.load_items_mmap(str(path))
+
+def test_mmap_loader_missing_and_empty(tmp_path):
+    """Test missing and empty files"""
+    with pytest.raises(MissingDataFileError):
+        game_data.load_quests_mmap(str(tmp_path / "nope.txt"))
+
+    path = tmp_path / "quests.txt"
+    path.write_text("\n\n")
+    with pytest.raises(InvalidDataFormatError):
+        game_data.load_quests_mmap(str(path))
+
+def test_cached_loader_reuses_and_refreshes(tmp_path, monkeypatch):
+    """Test that the compiled cache is used until the file changes"""
+    path = tmp_path / "items.txt"
+    path.write_text(ITEMS)
+    first = game_data.load_items_cached(str(path))
+    assert os.path.exists(game_data.get_cache_path(str(path)))
+
+    calls = []
+    real_parse = game_data.load_items_mmap
+    monkeypatch.setattr(game_data, "load_items_mmap",
+                        lambda f: calls.append(f) or real_parse(f))
+
+    assert game_data.load_items_cached(str(path)) == first
+    assert calls == []
+
+    # Same content, new mtime: the hash still matches
+    os.utime(path, ns=(1, 1))
+    assert game_data.load_items_cached(str(path)) == first
+    assert calls == []
+
+    path.write_text(ITEMS.replace("COST: 25", "COST: 30"))
+    assert game_data.load_items_cached(str(path))['potion']['cost'] == 30
+    assert len(calls) == 1
+
+def test_cached_loader_ignores_bad_cache(tmp_path):
+    """Test that a corrupt cache file just means a normal parse"""
+    path = tmp_path / "items.txt"
+    path.write_text(ITEMS)
+    with open(game_data.get_cache_path(str(path)), "wb") as f:
+        f.write(b"not a pickle")
+
+    assert game_data.load_items_cached(str(path)) == game_data.load_items(str(path))
+
+def test_iterators_match_loaders():
+    """Test that streaming the bundled data gives the loaded dicts"""
+    game_data.create_default_data_files()
+    quests = {quest['quest_id']: quest for quest in game_data.iter_quests()}
+    items = {item['item_id']: item for item in game_data.iter_items()}
+    assert quests == game_data.load_quests()
+    assert items == game_data.load_items()
+
+def test_iterator_reads_file_objects_lazily():
+    """Test that blocks come out one at a time from a file object"""
+    stream = io.StringIO(ITEMS)
+    items = game_data.iter_items(stream)
+
+    assert next(items)['item_id'] == "potion"
+    assert next(items)['item_id'] == "sword"
+    assert list(items) == []
+
+def test_iterator_reports_line_numbers():
+    """Test that parse and validation errors name the block's first line"""
+    bad_cost = io.StringIO(ITEMS.replace("COST: 100", "COST: lots"))
+    with pytest.raises(InvalidDataFormatError, match="line 9"):
+        list(game_data.iter_items(bad_cost))
+
+    bad_type = io.StringIO(ITEMS.replace("TYPE: weapon", "TYPE: spoon"))
+    items = game_data.iter_items(bad_type)
+    next(items)
+    with pytest.raises(InvalidDataFormatError, match="line 9.*spoon"):
+        next(items)
+
+    # Without validation the block comes through as parsed
+    unchecked = list(game_data.iter_items(io.StringIO(ITEMS.replace("TYPE: weapon", "TYPE: spoon")),
+                                          validate=False))
+    assert unchecked[1]['type'] == "spoon"
+
+def test_iterator_missing_file(tmp_path):
+    """Test that a missing path raises MissingDataFileError"""
+    with pytest.raises(MissingDataFileError):
+        list(game_data.iter_quests(str(tmp_path / "nope.txt")))
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,77 @@
+"""
+Test Gear Stats
+Tests that gear bonuses are tracked apart from base stats
+"""
+
+import pytest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import inventory_system
+
+GEAR = {
+    'iron_sword': {'type': 'weapon', 'effect': 'strength:5'},
+    'staff': {'type': 'weapon', 'effect': 'magic:8,strength:1'},
+    'leather_armor': {'type': 'armor', 'effect': 'max_health:10'},
+    'plate_armor': {'type': 'armor', 'effect': 'max_health:25'},
+}
+
+def equip(char, item_id):
+    if item_id not in char['inventory']:
+        inventory_system.add_item_to_inventory(char, item_id)
+    if GEAR[item_id]['type'] == 'weapon':
+        inventory_system.equip_weapon(char, item_id, GEAR[item_id])
+    else:
+        inventory_system.equip_armor(char, item_id, GEAR[item_id])
+
+def test_unequip_removes_bonus():
+    """Test that unequipping gives the bonus back"""
+    char = character_manager.create_character("Gear", "Warrior")
+    base = inventory_system.get_base_stats(char)
+
+    equip(char, 'staff')
+    equip(char, 'plate_armor')
+    assert char['magic'] == base['magic'] + 8
+    assert inventory_system.get_gear_modifiers(char) == {'magic': 8, 'strength': 1, 'max_health': 25}
+    assert inventory_system.get_base_stats(char) == base
+
+    char['health'] = char['max_health']
+    inventory_system.unequip_armor(char)
+    inventory_system.unequip_weapon(char)
+    assert inventory_system.get_base_stats(char) == base
+    assert (char['max_health'], char['strength'], char['magic']) == \
+        (base['max_health'], base['strength'], base['magic'])
+    assert char['health'] == char['max_health']      # clamped to the lower max
+    assert 'weapon_effect' not in char and 'armor_effect' not in char
+
+def test_random_swaps_and_level_ups_never_drift(tmp_path):
+    """Test stats after many swaps, level-ups and a save/load round trip"""
+    char = character_manager.create_character("Gear", "Mage")
+    rng = random.Random(3)
+    base = inventory_system.get_base_stats(char)
+
+    for _ in range(200):
+        roll = rng.random()
+        if roll < 0.6:
+            equip(char, rng.choice(list(GEAR)))
+        elif roll < 0.8:
+            rng.choice([inventory_system.unequip_weapon, inventory_system.unequip_armor])(char)
+        else:
+            character_manager.gain_experience(char, char['level'] * 100)
+            base = {stat: value + (10 if stat == 'max_health' else 2) for stat, value in base.items()}
+        assert inventory_system.get_base_stats(char) == base
+
+    character_manager.save_character(char, str(tmp_path), "binary")
+    char = character_manager.load_character("Gear", str(tmp_path))
+    assert inventory_system.get_base_stats(char) == base
+
+    inventory_system.unequip_weapon(char)
+    inventory_system.unequip_armor(char)
+    assert {stat: char[stat] for stat in base} == base
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,63 @@
+"""
+Test Item Effects
+Tests pre-parsed item effects and the stat effect dispatch table
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import game_data
+import inventory_system
+from custom_exceptions import InvalidDataFormatError
+
+def test_effects_parsed_at_load():
+    """Test that loaded items carry (stat, value) effects"""
+    game_data.create_default_data_files()
+    for item in game_data.load_items().values():
+        assert item['effects'] == (inventory_system.parse_item_effect(item['effect']),)
+
+def test_parse_multiple_effects():
+    """Test comma separated effects and bad effect strings"""
+    assert game_data.parse_item_effects("strength:5, magic:2") == (("strength", 5), ("magic", 2))
+    assert game_data.parse_item_effects("") == ()
+    with pytest.raises(InvalidDataFormatError):
+        game_data.parse_item_effects("strength:lots")
+    with pytest.raises(InvalidDataFormatError):
+        game_data.validate_item_data({'item_id': 'x', 'name': 'X', 'type': 'weapon',
+                                      'effect': 'strength', 'cost': 1, 'description': ''})
+
+def test_validation_does_not_change_item():
+    """Test that validate_item_data only checks and compile_item adds the effects"""
+    item = {'item_id': 'x', 'name': 'X', 'type': 'weapon',
+            'effect': 'strength:5', 'cost': 1, 'description': ''}
+    assert game_data.validate_item_data(item) == True
+    assert 'effects' not in item
+
+    assert game_data.compile_item(item) is item
+    assert item['effects'] == (("strength", 5),)
+
+def test_multi_effect_items_apply_every_stat():
+    """Test using and equipping items with several effects"""
+    char = character_manager.create_character("Effects", "Mage")
+    elixir = {'type': 'consumable', 'effect': 'health:500,magic:2'}
+    staff = {'type': 'weapon', 'effect': 'magic:5,strength:1',
+             'effects': game_data.parse_item_effects('magic:5,strength:1')}
+    char['health'] = 10
+    inventory_system.add_item_to_inventory(char, "elixir")
+    inventory_system.add_item_to_inventory(char, "staff")
+
+    message = inventory_system.use_item(char, "elixir", elixir)
+    assert char['health'] == char['max_health']     # clamped by the dispatch table
+    assert char['magic'] == 22
+    assert "magic increased by 2" in message
+
+    message = inventory_system.equip_weapon(char, "staff", staff)
+    assert (char['magic'], char['strength']) == (27, 9)
+    assert message == "staff equipped! magic +5, strength +1"
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,47 @@
+"""
+Test Leveling
+Tests that closed-form leveling matches the level-by-level rules
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+def loop_level_up(level, experience):
+    """Reference: spend XP one level at a time"""
+    while experience >= level * 100:
+        experience -= level * 100
+        level += 1
+    return level, experience
+
+def test_calculate_level_up_matches_loop():
+    """Test every level/XP combination on a grid"""
+    for level in range(1, 30):
+        for experience in range(-200, 40000, 7):
+            assert character_manager.calculate_level_up(level, experience) == \
+                loop_level_up(level, experience)
+
+def test_calculate_level_up_exact_boundaries():
+    """Test grants that land exactly on a level boundary"""
+    # 100 + 200 + 300 = 600 XP takes level 1 to level 4 with nothing left
+    assert character_manager.calculate_level_up(1, 600) == (4, 0)
+    assert character_manager.calculate_level_up(1, 599) == (3, 299)
+
+def test_huge_experience_grant():
+    """Test a huge grant levels in one step with correct stats"""
+    char = character_manager.create_character("HugeXP", "Rogue")
+    character_manager.gain_experience(char, 10 ** 12)
+
+    gained = char['level'] - 1
+    assert (char['level'], char['experience']) == loop_level_up(1, 10 ** 12)
+    assert char['max_health'] == 90 + 10 * gained
+    assert char['strength'] == 12 + 2 * gained
+    assert char['magic'] == 10 + 2 * gained
+    assert char['health'] == char['max_health']
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,184 @@
+"""
+Test Quest Index
+Tests QuestIndex/QuestTracker against the scanning functions and
+quest graph validation
+"""
+
+import pytest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+import quest_handler
+from quest_handler import QuestIndex
+from custom_exceptions import (
+    InvalidDataFormatError,
+    QuestNotFoundError,
+    QuestRequirementsNotMetError
+)
+
+def make_quest(qid, level, prereq="NONE"):
+    return {
+        'quest_id': qid, 'title': qid.title(), 'description': "",
+        'reward_xp': 10, 'reward_gold': 5,
+        'required_level': level, 'prerequisite': prereq
+    }
+
+def make_quests(count=60, seed=1):
+    rng = random.Random(seed)
+    quests = {}
+    for i in range(count):
+        prereq = f"q{rng.randrange(i)}" if i and rng.random() < 0.7 else "NONE"
+        quests[f"q{i}"] = make_quest(f"q{i}", rng.randint(1, 10), prereq)
+    return quests
+
+def make_character(level=1):
+    return {'level': level, 'active_quests': [], 'completed_quests': [],
+            'experience': 0, 'gold': 0}
+
+def ids(quests):
+    return sorted(q['quest_id'] for q in quests)
+
+def test_index_structure():
+    """Test topological order, reverse edges and chains"""
+    quests = make_quests()
+    index = QuestIndex(quests)
+
+    assert sorted(index.order) == sorted(quests)
+    for qid, quest in quests.items():
+        if quest['prerequisite'] != "NONE":
+            assert index.position[quest['prerequisite']] < index.position[qid]
+            assert qid in index.dependents[quest['prerequisite']]
+        assert index.get_prerequisite_chain(qid) == \
+            quest_handler.get_quest_prerequisite_chain(qid, quests)
+
+    assert ids(index.get_quests_by_level(3, 5)) == ids(quest_handler.get_quests_by_level(quests, 3, 5))
+
+def test_index_broken_chains():
+    """Test that missing or cyclic prerequisites are never unlocked"""
+    quests = {
+        'a': make_quest('a', 1, 'b'),
+        'b': make_quest('b', 1, 'a'),
+        'c': make_quest('c', 1, 'missing'),
+        'd': make_quest('d', 1),
+    }
+    index = QuestIndex(quests)
+    assert index.order == ['d']
+    with pytest.raises(QuestRequirementsNotMetError):
+        index.get_prerequisite_chain('a')
+    with pytest.raises(QuestNotFoundError):
+        index.get_prerequisite_chain('zzz')
+    assert ids(index.get_available_quests(make_character())) == ['d']
+
+def test_tracker_matches_full_scan():
+    """Test that incremental availability always equals the full scan"""
+    quests = make_quests()
+    index = QuestIndex(quests)
+    character = make_character()
+    tracker = index.track(character)
+    rng = random.Random(7)
+
+    for step in range(80):
+        expected = ids(quest_handler.get_available_quests(character, quests))
+        assert ids(tracker.available()) == expected
+        assert ids(index.get_available_quests(character)) == expected
+
+        if character['active_quests'] and rng.random() < 0.6:
+            tracker.complete_quest(rng.choice(character['active_quests']))
+        elif expected:
+            tracker.accept_quest(rng.choice(expected))
+        if step % 10 == 9:
+            character['level'] += 1
+
+def test_tracker_skips_quest_completed_before_level_seen():
+    """Test that a level-locked quest completed before available() is not offered again"""
+    quests = {'late': make_quest('late', 5)}
+    index = QuestIndex(quests)
+    character = make_character()
+    tracker = index.track(character)
+    assert tracker.available() == []
+
+    character['level'] = 5
+    tracker.accept_quest('late')
+    tracker.complete_quest('late')
+
+    assert tracker.available() == []
+    assert quest_handler.get_available_quests(character, quests) == []
+
+def test_available_quests_use_quest_log_directly():
+    """Test that a QuestLog is not copied into a set and repeats are listed once"""
+    from records import QuestLog
+
+    class NoIterQuestLog(QuestLog):
+        __slots__ = ()
+        frozen = False
+        def __iter__(self):
+            if self.frozen:
+                raise AssertionError("completed_quests should not be scanned")
+            return super().__iter__()
+
+    quests = {'a': make_quest('a', 1), 'b': make_quest('b', 1, 'a')}
+    character = make_character()
+    character['completed_quests'] = NoIterQuestLog(['a', 'a'])
+    NoIterQuestLog.frozen = True
+    assert ids(quest_handler.get_available_quests(character, quests)) == ['b']
+
+    character['completed_quests'] = QuestLog(['a', 'a'])
+    assert ids(QuestIndex(quests).get_available_quests(character)) == ['b']
+
+# ============================================================================
+# GRAPH VALIDATION TESTS
+# ============================================================================
+
+def test_graph_problems_found_in_one_pass():
+    """Test cycles, missing prerequisites, unreachable and level problems"""
+    quests = {
+        'root': make_quest('root', 5),
+        'easy': make_quest('easy', 2, 'root'),
+        'a': make_quest('a', 1, 'c'),
+        'b': make_quest('b', 1, 'a'),
+        'c': make_quest('c', 1, 'b'),
+        'after_cycle': make_quest('after_cycle', 1, 'a'),
+        'orphan': make_quest('orphan', 1, 'missing'),
+    }
+    problems = game_data.find_quest_graph_problems(quests)
+
+    assert problems['missing_prerequisites'] == [('orphan', 'missing')]
+    assert len(problems['cycles']) == 1
+    assert sorted(problems['cycles'][0]) == ['a', 'b', 'c']
+    assert sorted(problems['unreachable']) == ['a', 'after_cycle', 'b', 'c', 'orphan']
+    assert problems['level_inconsistent'] == [('easy', 'root')]
+
+    with pytest.raises(InvalidDataFormatError, match="cycle"):
+        game_data.validate_quest_graph(quests)
+
+def test_graph_validation_on_load(tmp_path):
+    """Test that loaders reject a quest file with a cycle"""
+    game_data.create_default_data_files()
+    assert game_data.validate_quest_graph(game_data.load_quests())
+
+    blocks = [
+        "QUEST_ID: {0}\nTITLE: T\nDESCRIPTION: D\nREWARD_XP: 1\nREWARD_GOLD: 1\n"
+        "REQUIRED_LEVEL: 1\nPREREQUISITE: {1}\n".format(qid, prereq)
+        for qid, prereq in [("a", "b"), ("b", "a")]
+    ]
+    path = tmp_path / "quests.txt"
+    path.write_text("\n".join(blocks))
+
+    for loader in (game_data.load_quests, game_data.load_quests_mmap):
+        with pytest.raises(InvalidDataFormatError, match="a -> b -> a|b -> a -> b"):
+            loader(str(path))
+
+def test_prerequisite_chain_is_cycle_safe():
+    """Test that chain lookups raise instead of looping forever"""
+    quests = {'a': make_quest('a', 1, 'b'), 'b': make_quest('b', 1, 'a')}
+    with pytest.raises(QuestRequirementsNotMetError):
+        quest_handler.get_quest_prerequisite_chain('a', quests)
+    with pytest.raises(QuestRequirementsNotMetError):
+        quest_handler.validate_quest_prerequisites(quests)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
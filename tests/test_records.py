@@ -0,0 +1,161 @@
+"""
+Test Records
+Tests that slotted Character/Enemy records work with the dict-based API
+"""
+
+import pytest
+import sys
+import os
+import pickle
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import combat_system
+import inventory_system
+from records import Character, Enemy, QuestLog
+
+# ============================================================================
+# MAPPING BEHAVIOUR TESTS
+# ============================================================================
+
+def test_character_record_matches_dict():
+    """Test that a Character record looks exactly like the dict it came from"""
+    data = character_manager.create_character("RecordTest", "Cleric")
+    record = Character(data)
+
+    assert record == data
+    assert list(record.keys()) == list(data.keys())
+    assert record["class"] == "Cleric"
+    assert record.class_ == "Cleric"
+    assert record.health == data["health"]
+    assert "equipped_weapon" not in record
+
+def test_record_has_no_instance_dict():
+    """Test that records store fields in slots"""
+    record = Enemy(combat_system.create_enemy("orc"))
+
+    assert not hasattr(record, "__dict__")
+    assert record.strength == 12
+
+def test_record_extra_and_missing_keys():
+    """Test unknown keys, deletion and KeyError behaviour"""
+    record = Enemy(combat_system.create_enemy("goblin"))
+    record["poisoned"] = True
+
+    assert record["poisoned"] is True
+    assert record.get("missing", 5) == 5
+    del record["poisoned"]
+    with pytest.raises(KeyError):
+        record["poisoned"]
+
+def test_record_pickle_and_copy():
+    """Test that records survive pickling and copying"""
+    record = Character(character_manager.create_character("PickleTest", "Rogue"))
+    record["equipped_weapon"] = "iron_sword"
+
+    assert pickle.loads(pickle.dumps(record)) == record
+    assert record.copy() == record
+    assert isinstance(record.copy(), Character)
+
+# ============================================================================
+# EXISTING FUNCTION COMPATIBILITY TESTS
+# ============================================================================
+
+def test_character_record_with_existing_functions():
+    """Test that leveling, inventory and combat accept records"""
+    char = Character(character_manager.create_character("CompatTest", "Warrior"))
+    character_manager.gain_experience(char, 100)
+    inventory_system.add_item_to_inventory(char, "iron_sword")
+    inventory_system.equip_weapon(char, "iron_sword", {'type': 'weapon', 'effect': 'strength:5'})
+
+    assert char.level == 2
+    assert char.strength == 15 + 2 + 5
+    assert char["equipped_weapon"] == "iron_sword"
+
+    enemy = Enemy(combat_system.create_enemy("goblin"))
+    battle = combat_system.SimpleBattle(char, enemy)
+    battle.apply_damage(enemy, battle.calculate_damage(char, enemy))
+    assert enemy.health < enemy.max_health
+
+def test_character_record_save_and_load():
+    """Test that a record saves in the existing format"""
+    char = Character(character_manager.create_character("RecordSaveTest", "Mage"))
+    character_manager.save_character(char)
+
+    try:
+        loaded = character_manager.load_character("RecordSaveTest")
+        assert loaded == char.to_dict()
+    finally:
+        character_manager.delete_character("RecordSaveTest")
+
+# ============================================================================
+# QUEST LOG TESTS
+# ============================================================================
+
+def test_quest_log_membership_tracks_changes():
+    """Test that QuestLog's counts follow every list mutation"""
+    log = QuestLog(["a", "b", "a"])
+    assert "a" in log and log.count("a") == 2 and "z" not in log
+
+    log.append("c")
+    log.remove("a")
+    assert log == ["b", "a", "c"] and log.count("a") == 1
+    log[0] = "d"
+    del log[1]
+    log[1:] = ["e", "e"]
+    log += ["f"]
+    assert log == ["d", "e", "e", "f"]
+    assert sorted(log._counts.items()) == [("d", 1), ("e", 2), ("f", 1)]
+    assert log.pop() == "f" and "f" not in log
+
+    with pytest.raises(ValueError):
+        log.remove("missing")
+    log.clear()
+    assert log == [] and "d" not in log
+
+def test_quest_log_keeps_save_format(tmp_path):
+    """Test that characters get QuestLogs and save/load unchanged"""
+    char = character_manager.create_character("Quester", "Mage")
+    assert isinstance(char['completed_quests'], QuestLog)
+    char['completed_quests'].extend(["daily", "daily", "first"])
+
+    for save_format in ("text", "binary"):
+        character_manager.save_character(char, str(tmp_path), save_format)
+        loaded = character_manager.load_character("Quester", str(tmp_path), save_format)
+        assert isinstance(loaded['completed_quests'], QuestLog)
+        assert loaded['completed_quests'] == ["daily", "daily", "first"]
+
+    copied = pickle.loads(pickle.dumps(char['completed_quests']))
+    assert isinstance(copied, QuestLog) and copied.count("daily") == 2
+
+def test_quest_logs_from_every_loader(tmp_path):
+    """Test that the database, bulk loader and journal also return QuestLogs"""
+    import bulk_loader
+    from save_database import SaveDatabase
+    from save_journal import SaveJournal
+
+    char = character_manager.create_character("Quester", "Mage")
+    char['completed_quests'].extend(["daily", "first"])
+
+    with SaveDatabase(str(tmp_path / "saves.db")) as db:
+        db.save_character(char)
+        loaded = [db.load_character("Quester")]
+
+    saves = tmp_path / "saves"
+    character_manager.save_character(char, str(saves), "binary")
+    loaded.append(bulk_loader.load_all_saves(str(saves), workers=1)['characters']['Quester'])
+
+    journal = SaveJournal(str(tmp_path / "journal"))
+    journal.save_character(char)
+    char['active_quests'].append("next")
+    journal.save_character(char)
+    loaded.append(SaveJournal(str(tmp_path / "journal")).load_character("Quester"))
+
+    for character in loaded:
+        assert isinstance(character['completed_quests'], QuestLog)
+        assert isinstance(character['active_quests'], QuestLog)
+        assert "first" in character['completed_quests']
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,59 @@
+"""
+Test Save Database
+Tests the SQLite save store against the file-based save API
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+from save_database import SaveDatabase
+from custom_exceptions import CharacterNotFoundError
+
+def test_database_save_load_list_delete(tmp_path):
+    """Test the same save/load/list/delete flow as character_manager"""
+    with SaveDatabase(str(tmp_path / "saves.db")) as db:
+        char = character_manager.create_character("DbTest", "Rogue")
+        char['inventory'] = ["health_potion"]
+        char['equipped_weapon'] = None
+
+        assert db.save_character(char) == True
+        assert db.load_character("DbTest") == char
+        assert db.list_saved_characters() == ["DbTest"]
+
+        char['gold'] = 5
+        db.save_character(char)
+        assert db.load_character("DbTest")['gold'] == 5
+        assert db.count_characters() == 1
+
+        assert db.delete_character("DbTest") == True
+        with pytest.raises(CharacterNotFoundError):
+            db.load_character("DbTest")
+        with pytest.raises(CharacterNotFoundError):
+            db.delete_character("DbTest")
+
+def test_database_uses_wal(tmp_path):
+    """Test that the database runs in WAL mode"""
+    with SaveDatabase(str(tmp_path / "saves.db")) as db:
+        mode = db.connection.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+def test_database_batch_and_import(tmp_path):
+    """Test batched writes and importing a save directory"""
+    save_dir = str(tmp_path / "files")
+    for i in range(5):
+        character_manager.save_character(
+            character_manager.create_character(f"File{i}", "Mage"), save_dir)
+
+    with SaveDatabase(str(tmp_path / "saves.db")) as db:
+        batch = [character_manager.create_character(f"Batch{i}", "Cleric") for i in range(10)]
+        assert db.save_characters(batch) == 10
+        assert db.import_save_directory(save_dir, batch_size=2) == 5
+        assert db.count_characters() == 15
+        assert db.load_character("File3")['class'] == "Mage"
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
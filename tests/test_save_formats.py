@@ -0,0 +1,129 @@
+"""
+Test Save Formats
+Tests the binary save format and converting between save formats
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import binary_save
+import character_manager
+from character_cache import CharacterCache
+from custom_exceptions import (
+    CharacterNotFoundError,
+    InvalidSaveDataError,
+    SaveFileCorruptedError
+)
+
+def make_character(name="BinaryTest"):
+    char = character_manager.create_character(name, "Warrior")
+    char['inventory'] = ["health_potion", "iron_sword"]
+    char['completed_quests'] = ["first_steps"]
+    char['equipped_weapon'] = None
+    char['equipped_armor'] = "leather_armor"
+    return char
+
+# ============================================================================
+# BINARY CODEC TESTS
+# ============================================================================
+
+def test_binary_round_trip_keeps_types():
+    """Test that ints, lists and None survive encoding"""
+    char = make_character()
+    char['experience'] = 10 ** 30
+
+    assert binary_save.decode_character(binary_save.encode_character(char)) == char
+
+def test_binary_detects_corruption():
+    """Test checksum, truncation and magic checks"""
+    data = bytearray(binary_save.encode_character(make_character()))
+
+    with pytest.raises(SaveFileCorruptedError):
+        binary_save.decode_character(bytes(data[:-3]))
+    with pytest.raises(SaveFileCorruptedError):
+        binary_save.decode_character(b"JUNK" + bytes(data[4:]))
+
+    data[-1] ^= 0xFF
+    with pytest.raises(SaveFileCorruptedError):
+        binary_save.decode_character(bytes(data))
+
+def test_binary_rejects_unsaveable_values():
+    """Test that unsupported field types are reported"""
+    char = make_character()
+    char['position'] = (1, 2)
+
+    with pytest.raises(InvalidSaveDataError):
+        binary_save.encode_character(char)
+
+# ============================================================================
+# CHARACTER MANAGER FORMAT TESTS
+# ============================================================================
+
+def test_save_and_load_binary(tmp_path):
+    """Test saving and loading through character_manager"""
+    char = make_character()
+    character_manager.save_character(char, str(tmp_path), save_format="binary")
+
+    assert os.path.exists(tmp_path / "BinaryTest_save.bin")
+    assert character_manager.list_saved_characters(str(tmp_path)) == ["BinaryTest"]
+    assert character_manager.load_character("BinaryTest", str(tmp_path)) == char
+
+    character_manager.delete_character("BinaryTest", str(tmp_path))
+    with pytest.raises(CharacterNotFoundError):
+        character_manager.load_character("BinaryTest", str(tmp_path))
+
+def test_convert_save(tmp_path):
+    """Test converting a text save to binary and back"""
+    char = character_manager.create_character("ConvertTest", "Cleric")
+    character_manager.save_character(char, str(tmp_path))
+
+    converted = character_manager.convert_save("ConvertTest", "binary", str(tmp_path))
+    assert converted == char
+    assert os.listdir(tmp_path) == ["ConvertTest_save.bin"]
+
+    character_manager.convert_save("ConvertTest", "text", str(tmp_path))
+    assert os.listdir(tmp_path) == ["ConvertTest_save.txt"]
+    assert character_manager.load_character("ConvertTest", str(tmp_path)) == char
+
+def test_saving_one_format_removes_the_other(tmp_path):
+    """Test that a binary save followed by a text save never loads the stale binary"""
+    char = make_character()
+    character_manager.save_character(char, str(tmp_path), save_format="binary")
+    char['gold'] = 999
+    character_manager.save_character(char, str(tmp_path), save_format="text")
+
+    assert os.listdir(tmp_path) == ["BinaryTest_save.txt"]
+    assert character_manager.load_character("BinaryTest", str(tmp_path))['gold'] == 999
+
+def test_mixed_formats_load_newest(tmp_path):
+    """Test that when both save files exist the newest one is loaded"""
+    char = make_character()
+    saved_gold = char['gold']
+    text_path = tmp_path / "BinaryTest_save.txt"
+    binary_path = tmp_path / "BinaryTest_save.bin"
+    binary_path.write_bytes(binary_save.encode_character(char))
+    character_manager.save_character(char, str(tmp_path), save_format="text")
+    char['gold'] = 999
+    binary_path.write_bytes(binary_save.encode_character(char))
+
+    os.utime(binary_path, ns=(1_000_000_000, 1_000_000_000))
+    assert character_manager.load_character("BinaryTest", str(tmp_path))['gold'] == saved_gold
+    assert character_manager.find_save("BinaryTest", str(tmp_path)) == (str(text_path), "text")
+
+    os.utime(text_path, ns=(1_000_000_000, 1_000_000_000))
+    os.utime(binary_path, ns=(2_000_000_000, 2_000_000_000))
+    assert character_manager.load_character("BinaryTest", str(tmp_path))['gold'] == 999
+
+    cache = CharacterCache(save_directory=str(tmp_path))
+    assert cache.load_character("BinaryTest")['gold'] == 999
+
+def test_unknown_save_format(tmp_path):
+    """Test that an unknown format is rejected"""
+    with pytest.raises(ValueError):
+        character_manager.save_character(make_character(), str(tmp_path), save_format="xml")
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
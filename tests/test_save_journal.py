@@ -0,0 +1,97 @@
+"""
+Test Save Journal
+Tests delta appends, compaction and crash-safe replay
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+from custom_exceptions import CharacterNotFoundError
+from save_journal import SaveJournal
+
+def test_journal_appends_only_changes(tmp_path):
+    """Test that later saves only write changed fields"""
+    journal = SaveJournal(str(tmp_path))
+    char = character_manager.create_character("JournalTest", "Warrior")
+
+    assert journal.save_character(char) == len(char)   # first save is a snapshot
+    char['gold'] += 10
+    assert journal.save_character(char) == 1
+    assert journal.save_character(char) == 0           # nothing changed
+    char['health'] -= 5
+    char['inventory'].append("health_potion")
+    assert journal.save_character(char) == 2
+
+    assert SaveJournal(str(tmp_path)).load_character("JournalTest") == char
+
+def test_journal_compaction(tmp_path):
+    """Test that the journal is folded into the snapshot"""
+    journal = SaveJournal(str(tmp_path), compact_every=3)
+    char = character_manager.create_character("CompactTest", "Mage")
+    journal.save_character(char)
+
+    for turn in range(3):
+        char['health'] -= 1
+        journal.save_character(char)
+
+    assert os.listdir(tmp_path) == ["CompactTest_snapshot.bin"]
+    assert SaveJournal(str(tmp_path)).load_character("CompactTest") == char
+
+def test_journal_snapshot_is_not_a_plain_save(tmp_path):
+    """Test that a snapshot with journal entries is never loaded as a save on its own"""
+    journal = SaveJournal(str(tmp_path))
+    char = character_manager.create_character("StaleTest", "Warrior")
+    journal.save_character(char)
+    char['gold'] = 500
+    journal.save_character(char)
+
+    assert character_manager.list_saved_characters(str(tmp_path)) == []
+    with pytest.raises(CharacterNotFoundError):
+        character_manager.load_character("StaleTest", str(tmp_path))
+    assert SaveJournal(str(tmp_path)).load_character("StaleTest")['gold'] == 500
+
+def test_journal_recovers_from_torn_write(tmp_path):
+    """Test that a half-written last entry is ignored and cut off"""
+    journal = SaveJournal(str(tmp_path))
+    char = character_manager.create_character("CrashTest", "Rogue")
+    journal.save_character(char)
+    char['gold'] = 1
+    journal.save_character(char)
+    expected = dict(char)
+
+    char['gold'] = 2
+    journal.save_character(char)
+    path = journal.journal_path("CrashTest")
+    with open(path, "r+b") as f:
+        f.truncate(os.path.getsize(path) - 3)
+
+    recovered = SaveJournal(str(tmp_path))
+    assert recovered.load_character("CrashTest") == expected
+
+    expected['gold'] = 3
+    recovered.save_character(expected)
+    assert SaveJournal(str(tmp_path)).load_character("CrashTest") == expected
+
+def test_journal_removed_keys_and_delete(tmp_path):
+    """Test removed fields and deleting a journaled character"""
+    journal = SaveJournal(str(tmp_path))
+    char = character_manager.create_character("RemoveTest", "Cleric")
+    char['equipped_weapon'] = "iron_sword"
+    journal.save_character(char)
+    del char['equipped_weapon']
+    journal.save_character(char)
+
+    assert 'equipped_weapon' not in SaveJournal(str(tmp_path)).load_character("RemoveTest")
+    assert journal.delete_character("RemoveTest") == True
+    assert os.listdir(tmp_path) == []
+    with pytest.raises(CharacterNotFoundError):
+        journal.load_character("RemoveTest")
+    with pytest.raises(CharacterNotFoundError):
+        journal.delete_character("RemoveTest")
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
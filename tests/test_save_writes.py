@@ -0,0 +1,103 @@
+"""
+Test Save Writes
+Tests atomic save writes and write-behind coalescing
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+from save_coalescer import SaveCoalescer
+
+# ============================================================================
+# ATOMIC WRITE TESTS
+# ============================================================================
+
+def test_failed_save_keeps_old_file(tmp_path):
+    """Test that an error while saving leaves the previous save intact"""
+    char = character_manager.create_character("AtomicTest", "Warrior")
+    character_manager.save_character(char, str(tmp_path))
+
+    broken = dict(char)
+    broken['inventory'] = [1, 2]    # ",".join fails part-way through building
+    with pytest.raises(TypeError):
+        character_manager.save_character(broken, str(tmp_path))
+
+    assert character_manager.load_character("AtomicTest", str(tmp_path)) == char
+    assert os.listdir(tmp_path) == ["AtomicTest_save.txt"]
+
+def test_atomic_write_with_fsync(tmp_path):
+    """Test fsync saves and the returned byte count"""
+    char = character_manager.create_character("FsyncTest", "Mage")
+    written = character_manager.write_save(char, str(tmp_path), fsync=True)
+
+    assert written == os.path.getsize(tmp_path / "FsyncTest_save.txt")
+    assert character_manager.load_character("FsyncTest", str(tmp_path)) == char
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_atomic_write_file_modes(tmp_path):
+    """Test that new saves follow the umask and rewrites keep the file's mode"""
+    import stat
+    path = tmp_path / "ModeTest_save.txt"
+
+    old_umask = os.umask(0o022)
+    try:
+        character_manager.atomic_write(str(path), b"first")
+    finally:
+        os.umask(old_umask)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+
+    os.chmod(path, 0o640)
+    character_manager.atomic_write(str(path), b"second")
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+    assert path.read_bytes() == b"second"
+    assert os.listdir(tmp_path) == ["ModeTest_save.txt"]
+
+# ============================================================================
+# COALESCER TESTS
+# ============================================================================
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+def test_coalescer_merges_saves_in_window(tmp_path):
+    """Test that repeated saves inside the window become one write"""
+    clock = FakeClock()
+    coalescer = SaveCoalescer(window=5, save_directory=str(tmp_path), clock=clock)
+    char = character_manager.create_character("CoalesceTest", "Rogue")
+
+    for gold in range(10):
+        char['gold'] = gold
+        coalescer.save_character(char)
+        clock.now += 0.1
+    assert os.listdir(tmp_path) == []
+
+    clock.now = 5.0
+    assert coalescer.flush_due() == 1
+    assert character_manager.load_character("CoalesceTest", str(tmp_path))['gold'] == 9
+
+    stats = coalescer.get_stats()
+    assert stats['saves_requested'] == 10
+    assert stats['disk_writes'] == 1
+    assert stats['coalesced'] == 9
+    assert stats['bytes_written'] == os.path.getsize(tmp_path / "CoalesceTest_save.txt")
+
+def test_coalescer_snapshots_state_and_flushes_on_exit(tmp_path):
+    """Test that queued state is a copy and is written on exit"""
+    with SaveCoalescer(window=60, save_directory=str(tmp_path),
+                       save_format="binary") as coalescer:
+        char = character_manager.create_character("ExitTest", "Cleric")
+        coalescer.save_character(char)
+        char['inventory'].append("not_saved_yet")
+        assert coalescer.pending_count() == 1
+
+    assert character_manager.load_character("ExitTest", str(tmp_path))['inventory'] == []
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
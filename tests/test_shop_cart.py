@@ -0,0 +1,69 @@
+"""
+Test Shop Cart
+Tests that process_cart applies a whole cart or nothing
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import inventory_system
+from custom_exceptions import InsufficientResourcesError, InventoryFullError, ItemNotFoundError
+
+ITEMS = {
+    'health_potion': {'type': 'consumable', 'effect': 'health:20', 'cost': 25},
+    'iron_sword': {'type': 'weapon', 'effect': 'strength:5', 'cost': 100},
+    'leather_armor': {'type': 'armor', 'effect': 'max_health:10', 'cost': 60},
+}
+
+def make_character(gold=100, inventory=()):
+    char = character_manager.create_character("Shopper", "Rogue")
+    char['gold'] = gold
+    char['inventory'] = list(inventory)
+    return char
+
+def test_cart_buys_and_sells_in_one_step():
+    """Test that sale proceeds pay for purchases"""
+    char = make_character(gold=20, inventory=['iron_sword', 'health_potion', 'iron_sword'])
+
+    receipt = inventory_system.process_cart(
+        char, ITEMS, buy={'health_potion': 3}, sell=['iron_sword', 'iron_sword'])
+
+    assert receipt == {'bought': 3, 'sold': 2, 'cost': 75, 'proceeds': 100, 'gold': 45}
+    assert char['gold'] == 45
+    assert char['inventory'] == ['health_potion'] * 4
+
+@pytest.mark.parametrize("cart, error", [
+    ({'buy': ['health_potion'] * 5}, InsufficientResourcesError),
+    ({'buy': ['mystery_box']}, ItemNotFoundError),
+    ({'sell': ['leather_armor']}, ItemNotFoundError),
+    ({'buy': {'health_potion': 1}, 'max_slots': 2}, InventoryFullError),
+])
+def test_failed_cart_changes_nothing(cart, error):
+    """Test that a cart failing any check leaves the character untouched"""
+    char = make_character(gold=100, inventory=['iron_sword', 'health_potion'])
+    before = (char['gold'], list(char['inventory']))
+
+    with pytest.raises(error):
+        inventory_system.process_cart(char, ITEMS, **cart)
+    assert (char['gold'], char['inventory']) == before
+
+def test_cart_with_stacked_inventory_and_no_slot_limit():
+    """Test vendor-style restocking into stacks"""
+    vendor = make_character(gold=100000)
+    inventory_system.use_stacked_inventory(vendor, ITEMS)
+
+    inventory_system.process_cart(vendor, ITEMS, buy={'health_potion': 500, 'iron_sword': 30},
+                                  max_slots=None)
+    assert vendor['inventory'].count('health_potion') == 500
+    assert vendor['inventory'].slots_used == 50 + 30
+
+    with pytest.raises(InventoryFullError):
+        inventory_system.process_cart(vendor, ITEMS, buy=['iron_sword'])
+    assert vendor['inventory'].count('iron_sword') == 30
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
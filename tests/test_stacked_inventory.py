@@ -0,0 +1,94 @@
+"""
+Test Stacked Inventory
+Tests StackedInventory slot accounting and the inventory_system adapters
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import inventory_system
+from records import StackedInventory
+from custom_exceptions import InventoryFullError, ItemNotFoundError
+
+ITEMS = {
+    'health_potion': {'item_id': 'health_potion', 'name': 'Health Potion', 'type': 'consumable',
+                      'effect': 'health:20', 'cost': 25, 'description': ''},
+    'iron_sword': {'item_id': 'iron_sword', 'name': 'Iron Sword', 'type': 'weapon',
+                   'effect': 'strength:5', 'cost': 100, 'description': ''},
+}
+
+def test_stack_slot_accounting():
+    """Test that stacks count slots by their limit"""
+    inventory = StackedInventory(stack_limits={'potion': 3})
+    for _ in range(7):
+        inventory.add('potion')
+    inventory.add('sword')
+
+    assert inventory.count('potion') == 7
+    assert inventory.slots_used == 3 + 1
+    assert inventory.slots_needed('potion') == 0
+    assert inventory.slots_needed('potion', 3) == 1
+
+    inventory.remove('potion', 4)
+    assert inventory.slots_used == 1 + 1
+    inventory.remove('sword')
+    assert 'sword' not in inventory and len(inventory) == 3
+    with pytest.raises(ValueError):
+        inventory.remove('potion', 4)
+
+def test_default_limit_matches_list_behaviour():
+    """Test that unstacked items still take one slot each"""
+    char = character_manager.create_character("Stacker", "Warrior")
+    inventory_system.use_stacked_inventory(char)
+    for _ in range(inventory_system.MAX_INVENTORY_SIZE):
+        inventory_system.add_item_to_inventory(char, "health_potion")
+
+    assert inventory_system.get_inventory_space_remaining(char) == 0
+    with pytest.raises(InventoryFullError):
+        inventory_system.add_item_to_inventory(char, "health_potion")
+
+def test_consumables_stack_with_item_data():
+    """Test that potions share slots once stack limits come from item data"""
+    char = character_manager.create_character("Stacker", "Warrior")
+    inventory_system.use_stacked_inventory(char, ITEMS)
+    char['gold'] = 10000
+
+    for _ in range(25):
+        inventory_system.purchase_item(char, 'health_potion', ITEMS['health_potion'])
+    inventory_system.purchase_item(char, 'iron_sword', ITEMS['iron_sword'])
+
+    assert inventory_system.count_item(char, 'health_potion') == 25
+    assert inventory_system.get_inventory_space_remaining(char) == \
+        inventory_system.MAX_INVENTORY_SIZE - 4
+
+    char['health'] = 10
+    inventory_system.use_item(char, 'health_potion', ITEMS['health_potion'])
+    inventory_system.equip_weapon(char, 'iron_sword', ITEMS['iron_sword'])
+    assert inventory_system.count_item(char, 'health_potion') == 24
+    assert not inventory_system.has_item(char, 'iron_sword')
+    with pytest.raises(ItemNotFoundError):
+        inventory_system.remove_item_from_inventory(char, 'iron_sword')
+
+    removed = inventory_system.clear_inventory(char)
+    assert removed == ['health_potion'] * 24
+    assert isinstance(char['inventory'], StackedInventory)
+
+def test_stacked_inventory_saves_as_list(tmp_path):
+    """Test that text and binary saves keep the flat list format"""
+    char = character_manager.create_character("Stacker", "Warrior")
+    inventory_system.use_stacked_inventory(char, ITEMS)
+    for item_id in ['health_potion', 'iron_sword', 'health_potion']:
+        inventory_system.add_item_to_inventory(char, item_id)
+
+    for save_format in ("text", "binary"):
+        character_manager.save_character(char, str(tmp_path), save_format)
+        loaded = character_manager.load_character("Stacker", str(tmp_path), save_format)
+        assert loaded['inventory'] == ['health_potion', 'health_potion', 'iron_sword']
+        assert loaded['inventory'] == char['inventory']
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])